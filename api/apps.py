@@ -0,0 +1,26 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class ApiConfig(AppConfig):
+    name = 'api'
+
+    def ready(self):
+        """
+        Registers the app's system checks. Keeps the detail documents up to date on writes when
+        `MATERIALIZED_DOCUMENTS` is enabled. Compiles the detail serializer of every registered viewset when
+        `COMPILE_SERIALIZERS` is enabled, so the first request to each resource does not pay for it.
+        """
+        from api import checks  # noqa: F401
+
+        if settings.MATERIALIZED_DOCUMENTS:
+            from api.documents import connect
+
+            connect()
+        if not settings.COMPILE_SERIALIZERS:
+            return
+        from api.serializers.compiler import compiled_renderer
+        from api.urls import router
+
+        for _, viewset, _ in router.registry:
+            compiled_renderer(viewset(action='retrieve').get_serializer_class())
@@ -0,0 +1,209 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.base import ModelState
+
+from api.catalog_file import MappedCatalog, write_catalog_file
+from api.models.tracking import TrackedModel
+
+logger = logging.getLogger(__name__)
+
+
+def catalog_models():
+    """
+    Returns the models held in the catalog: every model of the API app with tracked rows.
+    """
+    return [model for model in apps.get_app_config('api').get_models() if issubclass(model, TrackedModel)]
+
+
+def sort_key(model):
+    """
+    Returns the key ordering rows of `model` the way its default queryset does: `Meta.ordering` (ascending
+    fields only, which is all the models use), then the primary key.
+    """
+    names = [model._meta.get_field(name).attname for name in model._meta.ordering]
+
+    def key(obj):
+        return (*(getattr(obj, name) for name in names), obj.pk)
+    return key
+
+
+class Catalog:
+    """
+    An immutable in-memory copy of every API table, read in one transaction.
+
+    Rows are the models' own instances, so serializers render them exactly as they render rows from the
+    database; strings are interned, so the many repeated values (schools, sizes, durations) are stored once.
+    Every relation is wired up front: a foreign key holds its parent instance, a reverse foreign key holds the
+    tuple of child instances (in default ordering) in the prefetch cache, and a reverse one-to-one holds its
+    instance or None. Rendering any object, with all its nested relations, never reaches the database.
+    """
+
+    def __init__(self, stamp=None, using=DEFAULT_DB_ALIAS):
+        self.stamp = stamp
+        self.objects = {}
+        started = time.perf_counter()
+        models = catalog_models()
+        with transaction.atomic(using=using):
+            for model in models:
+                self.objects[model] = self.load(model, using)
+        for model in models:
+            self.link(model)
+
+        self.memory = self.size()
+        self.rows = sum(len(objects) for objects in self.objects.values())
+        self.seconds = time.perf_counter() - started
+
+    @staticmethod
+    def load(model, using):
+        """
+        Returns the rows of `model` as instances by primary key, in default ordering.
+        """
+        attnames = [field.attname for field in model._meta.concrete_fields]
+        objects = []
+        for row in model._base_manager.using(using).values_list(*attnames).iterator():
+            obj = model.from_db(using, attnames, tuple(sys.intern(v) if type(v) is str else v for v in row))
+            obj._prefetched_objects_cache = {}
+            objects.append(obj)
+        objects.sort(key=sort_key(model))
+        return {obj.pk: obj for obj in objects}
+
+    def link(self, model):
+        """
+        Caches both ends of every foreign key and one-to-one field of `model`.
+        """
+        for field in model._meta.concrete_fields:
+            if not field.is_relation:
+                continue
+            parents = self.objects[field.related_model]
+            children = defaultdict(list)
+            for obj in self.objects[model].values():
+                parent = parents.get(getattr(obj, field.attname))
+                field.set_cached_value(obj, parent)
+                if parent is not None:
+                    children[parent.pk].append(obj)
+            relation = field.remote_field
+            for pk, parent in parents.items():
+                if field.one_to_one:
+                    relation.set_cached_value(parent, children[pk][0] if children.get(pk) else None)
+                else:
+                    parent._prefetched_objects_cache[relation.cache_name] = tuple(children.get(pk, ()))
+
+    def size(self):
+        """
+        Returns the bytes held by the catalog: its indexes, the instances with their attribute dicts, states
+        and relation caches, and the values in them. Interned strings count once.
+        """
+        strings = {}
+        total = 0
+        for objects in self.objects.values():
+            total += sys.getsizeof(objects)
+            for obj in objects.values():
+                state = obj._state
+                total += sum(map(sys.getsizeof, (
+                    obj, obj.__dict__, state, state.__dict__, state.fields_cache, obj._prefetched_objects_cache,
+                )))
+                total += sum(map(sys.getsizeof, obj._prefetched_objects_cache.values()))
+                for value in obj.__dict__.values():
+                    if type(value) is str:
+                        strings[id(value)] = value
+                    elif not isinstance(value, (dict, ModelState)):
+                        total += sys.getsizeof(value)
+        return total + sum(map(sys.getsizeof, strings.values()))
+
+    def all(self, model):
+        """
+        Returns every row of `model`, in default ordering.
+        """
+        return list(self.objects[model].values())
+
+    def values(self, model, attnames):
+        """
+        Returns the `attnames` columns of every row of `model` as tuples, in default ordering.
+        """
+        return [tuple(obj.__dict__[attname] for attname in attnames) for obj in self.objects[model].values()]
+
+    def get(self, model, pk):
+        """
+        Returns the row of `model` with primary key `pk`, or None.
+        """
+        return self.objects[model].get(pk)
+
+    def find(self, model, index):
+        """
+        Returns the row of `model` with the `index` slug `index`, or None.
+        """
+        return next((obj for obj in self.objects[model].values() if obj.index == index), None)
+
+    def __str__(self):
+        return (f"{self.rows} rows of {len(self.objects)} tables in {self.seconds * 1000:.0f} ms, "
+                f"{self.memory / 1024 / 1024:.1f} MiB")
+
+
+_catalog = None
+_lock = threading.Lock()
+
+
+def current_stamp():
+    """
+    Identifies the last write recorded in the `CATALOG_STAMP` file, shared by every worker on the host. With
+    `CATALOG_FILE` set, the catalog file is its own stamp.
+    """
+    try:
+        stat = os.stat(settings.CATALOG_FILE or settings.CATALOG_STAMP)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def mark_stale():
+    """
+    Records a write, so every worker rebuilds its catalog before serving from it again. With `CATALOG_FILE`
+    set, a new catalog file is written from the database and renamed over the old one instead.
+    """
+    if settings.CATALOG_FILE:
+        write_catalog_file(settings.CATALOG_FILE, Catalog())
+        return
+    temporary = f'{settings.CATALOG_STAMP}.{os.getpid()}.{threading.get_ident()}'
+    with open(temporary, 'w') as file:
+        file.write(str(time.time_ns()))
+    # A fresh inode per write: the stamp changes even when two writes share a timestamp.
+    os.replace(temporary, settings.CATALOG_STAMP)
+
+
+def get_catalog():
+    """
+    Returns the current catalog, building it first if there is none or a write was recorded since it was built.
+    With `CATALOG_FILE` set, the catalog file is mapped instead, after writing it if it does not exist yet.
+    """
+    global _catalog
+    stamp = current_stamp()
+    catalog = _catalog
+    if catalog is not None and catalog.stamp == stamp:
+        return catalog
+    with _lock:
+        if _catalog is None or _catalog.stamp != stamp:
+            if not settings.CATALOG_FILE:
+                _catalog = Catalog(stamp)
+            else:
+                if stamp is None:
+                    mark_stale()
+                _catalog = MappedCatalog(settings.CATALOG_FILE, catalog_models())
+            logger.info("Catalog loaded: %s", _catalog)
+        return _catalog
+
+
+def refresh_catalog():
+    """
+    Records a write and loads this worker's new catalog straight away; readers keep the previous catalog
+    until the new one replaces it.
+    """
+    mark_stale()
+    return get_catalog()
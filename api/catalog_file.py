@@ -0,0 +1,392 @@
+import json
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.base import ModelState
+
+MAGIC = b'DNDCAT01'
+# The magic, then the offset and length of the JSON directory locating every table's sections. The file is only
+# ever read on the host that wrote it, so numbers are in native byte order (with standard sizes).
+HEADER = struct.Struct('=8sQQ')
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# How each field type is stored in a record: integers, booleans and timestamps (microseconds since the epoch)
+# inline, strings as the offset and byte length of their UTF-8 text in the string heap (length -1 for NULL).
+KINDS = {
+    'AutoField': 'int', 'BigAutoField': 'int', 'SmallAutoField': 'int', 'IntegerField': 'int',
+    'BigIntegerField': 'int', 'SmallIntegerField': 'int', 'PositiveIntegerField': 'int',
+    'PositiveBigIntegerField': 'int', 'PositiveSmallIntegerField': 'int', 'ForeignKey': 'int',
+    'OneToOneField': 'int', 'BooleanField': 'bool', 'DateTimeField': 'datetime', 'CharField': 'str',
+    'TextField': 'str', 'SlugField': 'str',
+}
+CODES = {'int': 'q', 'bool': '?', 'datetime': 'q', 'str': 'Ii'}
+
+
+def columns(model):
+    """
+    Returns (attname, kind, nullable) for every column of `model`, in the order records store them.
+    """
+    return [(field.attname, KINDS[field.get_internal_type()], field.null) for field in model._meta.concrete_fields]
+
+
+def record_format(model):
+    """
+    Returns the struct format of a record of `model`: every column's codes, plus a presence flag for each
+    nullable column that is not a string.
+    """
+    codes = ''.join(
+        CODES[kind] + ('?' if nullable and kind != 'str' else '') for _, kind, nullable in columns(model)
+    )
+    return f'={codes}'
+
+
+class CatalogWriter:
+    """
+    Lays out a catalog file: one section per table of fixed-size records in default ordering, the sorted
+    indexes over them, and a string heap shared by every table, where each distinct string is stored once.
+    """
+
+    def __init__(self):
+        self.body = bytearray(HEADER.size)
+        self.heap = bytearray()
+        self.strings = {}
+
+    def section(self, data):
+        """
+        Appends `data` at the next 8-byte boundary and returns its offset.
+        """
+        self.body.extend(bytes(-len(self.body) % 8))
+        offset = len(self.body)
+        self.body.extend(data)
+        return offset
+
+    def string(self, value):
+        """
+        Returns the heap offset and byte length of `value`, adding it to the heap if it is new.
+        """
+        if value is None:
+            return 0, -1
+        found = self.strings.get(value)
+        if found is None:
+            encoded = value.encode()
+            found = self.strings[value] = (len(self.heap), len(encoded))
+            self.heap.extend(encoded)
+        return found
+
+    def encode(self, obj, layout):
+        """
+        Returns the values packed into the record of `obj`.
+        """
+        values = []
+        for attname, kind, nullable in layout:
+            value = getattr(obj, attname)
+            if kind == 'str':
+                values.extend(self.string(value))
+                continue
+            if value is None:
+                values.append(0)
+            elif kind == 'datetime':
+                values.append((value - EPOCH) // timedelta(microseconds=1))
+            else:
+                values.append(value)
+            if nullable:
+                values.append(value is not None)
+        return values
+
+    def table(self, model, objects):
+        """
+        Writes the records of `objects` (every row of `model`, in default ordering) and their indexes, and
+        returns the table's directory entry.
+        """
+        layout = columns(model)
+        record = struct.Struct(record_format(model))
+        records = bytearray(record.size * len(objects))
+        for recno, obj in enumerate(objects):
+            record.pack_into(records, recno * record.size, *self.encode(obj, layout))
+
+        by_id = sorted(range(len(objects)), key=lambda recno: objects[recno].pk)
+        entry = {
+            'count': len(objects),
+            'records': self.section(records),
+            'ids': self.section(array('q', (objects[recno].pk for recno in by_id)).tobytes()),
+            'id_records': self.section(array('I', by_id).tobytes()),
+            'children': {},
+        }
+        if any(attname == 'index' for attname, _, _ in layout):
+            by_index = sorted(range(len(objects)), key=lambda recno: objects[recno].index)
+            entry['index_records'] = self.section(array('I', by_index).tobytes())
+        for field in model._meta.concrete_fields:
+            if field.is_relation:
+                # Stable sort by parent: each parent's children keep their default ordering.
+                children = sorted(
+                    (recno for recno, obj in enumerate(objects) if getattr(obj, field.attname) is not None),
+                    key=lambda recno: getattr(objects[recno], field.attname),
+                )
+                entry['children'][field.attname] = [
+                    len(children),
+                    self.section(array('q', (getattr(objects[recno], field.attname) for recno in children)).tobytes()),
+                    self.section(array('I', children).tobytes()),
+                ]
+        return entry
+
+    def write(self, path, catalog):
+        """
+        Writes every table of `catalog` to `path`, replacing any previous file in one rename: a reader has
+        either the old file or the new one mapped, never a partial one.
+        """
+        tables = {model._meta.label_lower: self.table(model, list(catalog.all(model))) for model in catalog.objects}
+        heap = self.section(self.heap)
+        directory = json.dumps({'heap': heap, 'tables': tables}).encode()
+        offset = self.section(directory)
+        HEADER.pack_into(self.body, 0, MAGIC, offset, len(directory))
+
+        temporary = f'{path}.{os.getpid()}.{threading.get_ident()}'
+        with open(temporary, 'wb') as file:
+            file.write(self.body)
+        os.replace(temporary, path)
+
+
+def write_catalog_file(path, catalog):
+    """
+    Writes `catalog` (an `api.catalog.Catalog`) to `path` as a catalog file.
+    """
+    CatalogWriter().write(path, catalog)
+
+
+@lru_cache(maxsize=None)
+def compile_decoder(model, attnames=None):
+    """
+    Generates the function turning the unpacked values of a record of `model` and the string heap into the
+    dict of column values by attname, with one expression per column. Given `attnames`, a tuple, it returns
+    the tuple of those columns instead, and only decodes them.
+    """
+    items = {}
+    position = 0
+    for attname, kind, nullable in columns(model):
+        if kind == 'str':
+            start, length = f'raw[{position}]', f'raw[{position + 1}]'
+            value = f"str(heap[{start}:{start} + {length}], 'utf-8')"
+            if nullable:
+                value = f'None if {length} < 0 else {value}'
+            position += 2
+        else:
+            value = f'raw[{position}]'
+            if kind == 'datetime':
+                value = f'EPOCH + timedelta(microseconds={value})'
+            position += 1
+            if nullable:
+                value = f'{value} if raw[{position}] else None'
+                position += 1
+        items[attname] = value
+    if attnames is None:
+        returned = '{%s}' % ', '.join(f'{attname!r}: {value}' for attname, value in items.items())
+    else:
+        returned = '(%s,)' % ', '.join(items[attname] for attname in attnames)
+    namespace = {'EPOCH': EPOCH, 'timedelta': timedelta}
+    source = f'def decode(raw, heap):\n    return {returned}'
+    exec(compile(source, f'<catalog decoder {model._meta.object_name}>', 'exec'), namespace)
+    return namespace['decode']
+
+
+class Relations(dict):
+    """
+    The relation cache of an instance read from a catalog file, filled on first access to each relation.
+    Django reads relation caches by key, so related objects are only read from the file when rendered.
+    """
+    __slots__ = ('obj', 'resolvers')
+
+    def __init__(self, obj, resolvers):
+        super().__init__()
+        self.obj = obj
+        self.resolvers = resolvers
+
+    def __missing__(self, name):
+        resolve = self.resolvers.get(name)
+        if resolve is None:
+            raise KeyError(name)
+        value = self[name] = resolve(self.obj)
+        return value
+
+
+class MappedTable:
+    """
+    The records of one model in a mapped catalog file, with the views of its indexes.
+    """
+
+    def __init__(self, catalog, model, entry):
+        self.catalog = catalog
+        self.model = model
+        self.count = entry['count']
+        self.offset = entry['records']
+        self.record = struct.Struct(record_format(model))
+        self.decode = compile_decoder(model)
+        self.ids = catalog.array(entry['ids'], 'q', self.count)
+        self.id_records = catalog.array(entry['id_records'], 'I', self.count)
+        self.index_records = (
+            catalog.array(entry['index_records'], 'I', self.count) if 'index_records' in entry else None
+        )
+        self.children = {
+            attname: (catalog.array(parents, 'q', count), catalog.array(recnos, 'I', count))
+            for attname, (count, parents, recnos) in entry['children'].items()
+        }
+        # Filled in by the catalog once every table is open: how to resolve each relation cache entry.
+        self.forward = {}
+        self.reverse = {}
+
+    def values(self, recno):
+        """
+        Returns the column values of record `recno` by attname, decoded.
+        """
+        return self.decode(self.record.unpack_from(self.catalog.map, self.offset + recno * self.record.size),
+                           self.catalog.heap)
+
+    def row(self, recno):
+        """
+        Returns record `recno` as an instance whose relations are read from the file when accessed.
+        """
+        # Built as unpickling builds instances, without running `__init__`; the models have no `post_init` hooks.
+        obj = self.model.__new__(self.model)
+        obj.__dict__ = self.values(recno)
+        obj._state = state = ModelState()
+        state.adding = False
+        state.db = DEFAULT_DB_ALIAS
+        state.fields_cache = Relations(obj, self.forward)
+        obj._prefetched_objects_cache = Relations(obj, self.reverse)
+        return obj
+
+    def get(self, pk):
+        position = bisect_left(self.ids, pk)
+        if position == self.count or self.ids[position] != pk:
+            return None
+        return self.row(self.id_records[position])
+
+    def find(self, index):
+        if self.index_records is None:
+            raise ValueError(f"{self.model._meta.object_name} has no index column.")
+        position = self.index_position(index)
+        if position == self.count:
+            return None
+        obj = self.row(self.index_records[position])
+        return obj if obj.index == index else None
+
+    def index_position(self, index):
+        """
+        Returns the position of the first record whose index is not less than `index`, by binary search.
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.values(self.index_records[middle])['index'] < index:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def children_of(self, attname, pk):
+        """
+        Returns the records whose `attname` foreign key is `pk`, in default ordering, as instances.
+        """
+        parents, recnos = self.children[attname]
+        return tuple(self.row(recnos[i]) for i in range(bisect_left(parents, pk), bisect_right(parents, pk)))
+
+
+class MappedCatalog:
+    """
+    A catalog file mapped read-only into memory, with the interface of `api.catalog.Catalog`.
+
+    The file's pages live in the OS page cache, shared by every process mapping it, so the memory it takes does
+    not grow with the number of workers. Lookups binary-search the file's indexes in place; only the records
+    a response renders are decoded, into instances discarded with the response.
+    """
+
+    def __init__(self, path, models):
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.stamp = stat.st_ino, stat.st_mtime_ns
+        self.memory = stat.st_size
+        magic, offset, length = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a catalog file.")
+        directory = json.loads(self.map[offset:offset + length])
+        self.view = memoryview(self.map)
+        self.heap = self.view[directory['heap']:]
+        self.tables = {
+            model: MappedTable(self, model, directory['tables'][model._meta.label_lower]) for model in models
+        }
+        self.rows = sum(table.count for table in self.tables.values())
+        self.link()
+
+    def array(self, offset, typecode, count):
+        """
+        Returns `count` numbers of type `typecode` at `offset`, as a view over the mapped file.
+        """
+        size = struct.calcsize(f'={typecode}')
+        return self.view[offset:offset + count * size].cast(typecode)
+
+    def link(self):
+        """
+        Sets up how each relation cache entry of each model is read: a foreign key or one-to-one field from
+        its parent's record, a reverse foreign key from the children index, a reverse one-to-one from its
+        single child.
+        """
+        for model, table in self.tables.items():
+            for field in model._meta.concrete_fields:
+                if not field.is_relation:
+                    continue
+                parent, child = self.tables[field.related_model], table
+
+                def forward(obj, parent=parent, attname=field.attname):
+                    pk = getattr(obj, attname)
+                    return None if pk is None else parent.get(pk)
+
+                def reverse(obj, child=child, attname=field.attname):
+                    return child.children_of(attname, obj.pk)
+
+                table.forward[field.cache_name] = forward
+                if field.one_to_one:
+                    parent.forward[field.remote_field.cache_name] = lambda obj, reverse=reverse: next(
+                        iter(reverse(obj)), None
+                    )
+                else:
+                    parent.reverse[field.remote_field.cache_name] = reverse
+
+    def all(self, model):
+        """
+        Returns every row of `model`, in default ordering.
+        """
+        table = self.tables[model]
+        return [table.row(recno) for recno in range(table.count)]
+
+    def values(self, model, attnames):
+        """
+        Returns the `attnames` columns of every row of `model` as tuples, in default ordering.
+        """
+        table = self.tables[model]
+        decode = compile_decoder(model, tuple(attnames))
+        unpack, size = table.record.unpack_from, table.record.size
+        offsets = range(table.offset, table.offset + table.count * size, size)
+        return [decode(unpack(self.map, offset), self.heap) for offset in offsets]
+
+    def get(self, model, pk):
+        """
+        Returns the row of `model` with primary key `pk`, or None.
+        """
+        return self.tables[model].get(pk)
+
+    def find(self, model, index):
+        """
+        Returns the row of `model` with the `index` slug `index`, or None.
+        """
+        return self.tables[model].find(index)
+
+    def __str__(self):
+        return (f"{self.rows} rows of {len(self.tables)} tables mapped, "
+                f"{self.memory / 1024 / 1024:.1f} MiB shared")
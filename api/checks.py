@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+
+@register()
+def check_read_paths(app_configs, **kwargs):
+    """
+    Rejects enabling both `CATALOG_READS` and `MATERIALIZED_DOCUMENTS`. Detail documents come first among the
+    read paths, so the catalog would only serve lists, while every write would still pay for rebuilding both.
+    """
+    if settings.CATALOG_READS and settings.MATERIALIZED_DOCUMENTS:
+        return [Error(
+            "CATALOG_READS and MATERIALIZED_DOCUMENTS cannot be enabled together.",
+            hint="Enable CATALOG_READS for the fastest reads, or MATERIALIZED_DOCUMENTS to keep rendered details "
+                 "in the database rather than in every worker.",
+            id='api.E001',
+        )]
+    return []
@@ -0,0 +1,155 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import brotli
+except ImportError:  # Optional dependency; without it `br` is not offered.
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency; without it `zstd` is not offered.
+    zstandard = None
+
+# Content codings the server can produce, most preferred first (smallest output on the API's JSON first), with
+# the function producing each at a given level.
+CODINGS = OrderedDict(
+    (name, compress) for name, compress, library in (
+        ('br', lambda data, level: brotli.compress(data, quality=level), brotli),
+        ('zstd', lambda data, level: zstandard.ZstdCompressor(level=level).compress(data), zstandard),
+        ('gzip', lambda data, level: gzip.compress(data, compresslevel=level, mtime=0), gzip),
+    ) if library is not None
+)
+
+# Levels for bodies compressed while a client waits: on the spell list brotli 5 takes under 1 ms for 16% of the
+# size, where brotli 11 takes ~55 ms for 13% (zstd 3 against 19: 0.1 ms against 14 ms).
+FAST_LEVELS = {'br': 5, 'zstd': 3, 'gzip': 6}
+
+# Levels for bodies compressed ahead of any request (see `best_compression`).
+BEST_LEVELS = {'br': 11, 'zstd': 19, 'gzip': 9}
+
+_levels = threading.local()
+
+
+@contextmanager
+def best_compression():
+    """
+    Compresses at `BEST_LEVELS` within the block, for bodies compressed before they are requested (the
+    warm-up) and then served from the cache.
+    """
+    previous = getattr(_levels, 'levels', FAST_LEVELS)
+    _levels.levels = BEST_LEVELS
+    try:
+        yield
+    finally:
+        _levels.levels = previous
+
+
+def compress(data, coding):
+    """
+    Returns `data` compressed with `coding`, at `FAST_LEVELS` unless within `best_compression`.
+    """
+    return CODINGS[coding](data, getattr(_levels, 'levels', FAST_LEVELS)[coding])
+
+
+def coded_etag(etag, coding):
+    """
+    Returns the ETag of the `coding`-compressed representation of the response tagged `etag`: `"<tag>-br"`.
+    It stays strong, as each coding's bytes are the same for every client.
+    """
+    return f'{etag[:-1]}-{coding}"'
+
+
+def identity_etag(etag):
+    """
+    Returns the ETag of the uncompressed representation `etag` stands for, undoing `coded_etag`.
+    """
+    for coding in CODINGS:
+        suffix = f'-{coding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def parse_accept_encoding(header):
+    """
+    Returns the content codings listed in an Accept-Encoding header with their quality values.
+    """
+    accepted = {}
+    for item in header.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+def negotiate_coding(header, codings=CODINGS):
+    """
+    Picks the coding of `codings` the client accepts with the highest quality, preferring earlier entries
+    of `codings` on ties. Returns None when the client accepts none of them (or sent no header).
+    """
+    accepted = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for coding in codings:
+        quality = accepted.get(coding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressedBodyCache:
+    """
+    Keeps the most recently used compressed bodies, up to `max_bytes` of compressed data in total, keyed
+    by the representation they encode and the coding. Counts hits and misses so the hit rate can be checked.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def compress(self, content, coding, representation=None):
+        """
+        Returns `content` compressed with `coding`, compressing it only if it is not cached already.
+        `representation` identifies the content (e.g. URL, media type and ETag); a digest of the content
+        is used when it is not given.
+        """
+        key = (representation or hashlib.blake2b(content, digest_size=16).digest(), coding)
+        with self.lock:
+            body = self.entries.get(key)
+            if body is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return body
+            self.misses += 1
+
+        body = compress(content, coding)
+        if len(body) <= self.max_bytes:
+            with self.lock:
+                if key not in self.entries:
+                    self.entries[key] = body
+                    self.size += len(body)
+                while self.size > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.size -= len(evicted)
+        return body
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = self.hits = self.misses = 0
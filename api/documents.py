@@ -0,0 +1,213 @@
+import threading
+from functools import lru_cache
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from api.models import DetailDocument
+from api.renderers import FastJSONRenderer
+from api.serializers.links import LinkBuilder
+
+# Origin the documents' links are rendered with. It is replaced with the requesting origin when a document is
+# served, so one document serves every host.
+DOCUMENT_ORIGIN = 'http://materialized.invalid'
+
+# Objects rendered and stored per batch when documents are rebuilt in bulk.
+BACKFILL_BATCH_SIZE = 500
+
+# (resource, id) pairs whose documents the writes of the current thread outdated, rebuilt on commit.
+_pending = threading.local()
+
+
+class DocumentLinks(LinkBuilder):
+    """
+    Builds the links of stored documents, for DOCUMENT_ORIGIN and the root script prefix.
+    """
+
+    def __init__(self):
+        self.origin = DOCUMENT_ORIGIN
+        self.script_prefix = '/'
+
+
+@lru_cache(maxsize=None)
+def resources():
+    """
+    Returns the viewset of every registered resource by router basename.
+    """
+    from api.urls import router
+
+    return {basename: viewset for _, viewset, basename in router.registry}
+
+
+@lru_cache(maxsize=None)
+def dependents(model):
+    """
+    Returns (resource, path) for every detail document built from rows of `model`: path is None for the
+    resource's own rows, and otherwise the lookup from the resource to `model` in its retrieve query plan.
+    """
+    from api.views.includes import related_model
+
+    found = set()
+    for basename, viewset in resources().items():
+        if viewset.queryset.model is model:
+            found.add((basename, None))
+        for lookup in viewset.query_plans.get('retrieve', ()):
+            parts = lookup.split('__')
+            for end in range(1, len(parts) + 1):
+                path = '__'.join(parts[:end])
+                if related_model(viewset.queryset.model, path) is model:
+                    found.add((basename, path))
+    return tuple(found)
+
+
+def affected(instance, using):
+    """
+    Returns the (resource, id) pairs of the documents built from `instance` as the database has it now.
+    """
+    if instance.pk is None:
+        return set()
+    pairs = set()
+    for basename, path in dependents(type(instance)):
+        if path is None:
+            pairs.add((basename, instance.pk))
+        else:
+            root = resources()[basename].queryset.model
+            pks = root._default_manager.using(using).filter(**{path: instance.pk}).values_list('pk', flat=True)
+            pairs.update((basename, pk) for pk in pks)
+    return pairs
+
+
+def pending():
+    """
+    Returns the set of (resource, id) pairs recorded by this thread's writes and not rebuilt yet.
+    """
+    if not hasattr(_pending, 'pairs'):
+        _pending.pairs = set()
+    return _pending.pairs
+
+
+def before_write(sender, instance, using, **kwargs):
+    """
+    Records the documents built from the row as it was before a save or a delete: a foreign key moved by the
+    save takes the row out of its previous documents.
+    """
+    pending().update(affected(instance, using))
+
+
+def after_write(sender, instance, using, **kwargs):
+    """
+    Records the documents built from the row after a save, and rebuilds everything recorded once the
+    transaction commits (straight away outside of one).
+    """
+    if kwargs.get('signal') is post_save:
+        pending().update(affected(instance, using))
+    transaction.on_commit(lambda: flush(using), using=using)
+
+
+def flush(using=DEFAULT_DB_ALIAS):
+    """
+    Rebuilds the documents recorded by this thread's writes.
+    """
+    pairs = pending()
+    by_resource = {}
+    while pairs:
+        basename, pk = pairs.pop()
+        by_resource.setdefault(basename, set()).add(pk)
+    for basename, pks in by_resource.items():
+        rebuild(basename, pks, using)
+
+
+def render_documents(basename, pks, using=DEFAULT_DB_ALIAS):
+    """
+    Yields (id, body) for every existing object of `basename` among `pks`: exactly what the detail endpoint
+    returns as `application/json`, with links rendered for DOCUMENT_ORIGIN.
+    """
+    viewset = resources()[basename]
+    view = viewset(action='retrieve', request=Request(RequestFactory().get('/')), format_kwarg=None,
+                   basename=basename, args=(), kwargs={})
+    renderer = FastJSONRenderer()
+    renderer_context = view.get_renderer_context()
+    context = {**view.get_serializer_context(), 'link_builder': DocumentLinks()}
+    serializer_class = view.get_serializer_class()
+    for instance in view.get_queryset().using(using).filter(pk__in=pks).order_by('pk'):
+        data = serializer_class(instance, context=context).data
+        yield instance.pk, renderer.render(data, renderer.media_type, renderer_context)
+
+
+def store(basename, documents, using):
+    """
+    Saves (id, body) documents of `basename`, replacing those already stored.
+    """
+    DetailDocument.objects.using(using).bulk_create(
+        [DetailDocument(resource=basename, object_id=pk, body=body) for pk, body in documents],
+        update_conflicts=True,
+        unique_fields=['resource', 'object_id'],
+        update_fields=['body'],
+    )
+
+
+def rebuild(basename, pks, using=DEFAULT_DB_ALIAS):
+    """
+    Renders and stores the documents of the given objects of `basename`, and drops those of deleted ones.
+    """
+    documents = list(render_documents(basename, pks, using))
+    store(basename, documents, using)
+    gone = set(pks) - {pk for pk, _ in documents}
+    DetailDocument.objects.using(using).filter(resource=basename, object_id__in=gone).delete()
+
+
+def backfill(using=DEFAULT_DB_ALIAS):
+    """
+    Replaces every document with one rendered from the current data. Returns the number of documents stored.
+    """
+    pending().clear()
+    count = 0
+    with transaction.atomic(using=using):
+        DetailDocument.objects.using(using).all().delete()
+        for basename, viewset in resources().items():
+            pks = list(viewset.queryset.model._default_manager.using(using).values_list('pk', flat=True))
+            for start in range(0, len(pks), BACKFILL_BATCH_SIZE):
+                documents = list(render_documents(basename, pks[start:start + BACKFILL_BATCH_SIZE], using))
+                store(basename, documents, using)
+                count += len(documents)
+    return count
+
+
+def document_body(basename, pk, using=DEFAULT_DB_ALIAS):
+    """
+    Returns the stored body of the document of object `pk` of `basename`, or None.
+    """
+    body = DetailDocument.objects.using(using).filter(resource=basename, object_id=pk).values_list(
+        'body', flat=True
+    ).first()
+    return None if body is None else bytes(body)
+
+
+def tracked_models():
+    """
+    Returns the models documents are built from.
+    """
+    return [model for model in apps.get_app_config('api').get_models() if dependents(model)]
+
+
+def connect():
+    """
+    Keeps the documents up to date with every save and delete of the models they are built from. Listening to
+    deletes turns off Django's fast deletes for those models, so this is only done with `MATERIALIZED_DOCUMENTS`.
+    """
+    for model in tracked_models():
+        for signal, receiver in ((pre_save, before_write), (pre_delete, before_write),
+                                 (post_save, after_write), (post_delete, after_write)):
+            signal.connect(receiver, sender=model, dispatch_uid=f'documents-{model._meta.label_lower}')
+
+
+def disconnect():
+    """
+    Stops maintaining the documents on writes.
+    """
+    for model in tracked_models():
+        for signal in (pre_save, pre_delete, post_save, post_delete):
+            signal.disconnect(sender=model, dispatch_uid=f'documents-{model._meta.label_lower}')
@@ -0,0 +1,189 @@
+import json
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Spell
+from api.renderers import CBORRenderer, FastJSONRenderer, MessagePackRenderer, cbor2, msgpack
+from api.serializers.compiler import compiled_renderer
+from api.serializers.links import LinkBuilder
+from api.urls import router
+from api.views import ClassViewSet, SpellViewSet
+
+# Views linked to from serializers, cycled through by the link benchmark.
+LINK_VIEWS = ['spell-detail', 'class-detail', 'proficiency-detail', 'subclass-detail', 'race-detail']
+
+
+def bench_links(iterations):
+    """
+    Cost of one detail link: resolving and absolutizing it per call, against the cached LinkBuilder.
+    """
+    request = RequestFactory().get('/api/classes/1/', HTTP_HOST='localhost')
+    builder = LinkBuilder(request)
+
+    def resolve_each_time():
+        for pk, view_name in enumerate(LINK_VIEWS):
+            request.build_absolute_uri(reverse(view_name, args=[pk]))
+
+    def cached_template():
+        for pk, view_name in enumerate(LINK_VIEWS):
+            builder.detail(view_name, pk)
+
+    return [
+        ('reverse() + build_absolute_uri()', resolve_each_time, len(LINK_VIEWS)),
+        ('LinkBuilder.detail()', cached_template, len(LINK_VIEWS)),
+    ]
+
+
+def bench_lists(iterations):
+    """
+    Cost per row of rendering the spell list: serializer instances against the `.values()` fast path.
+    Runs against the configured database, so load data (or a generate_seed dataset) first.
+    """
+    rows = Spell.objects.count()
+    if not rows:
+        raise CommandError("The lists suite needs spells in the database; run load_data first.")
+    factory = RequestFactory()
+
+    def render(fast_list):
+        view = SpellViewSet.as_view({'get': 'list'}, basename='spell', fast_list=fast_list)
+        return lambda: view(factory.get('/api/spells/', HTTP_HOST='localhost')).render()
+
+    return [
+        ('SpellListSerializer', render(False), rows),
+        ('values() fast path', render(True), rows),
+    ]
+
+
+def bench_detail(viewset, index):
+    """
+    Cost of rendering one fully loaded detail object: the DRF serializer against its compiled render function.
+    Runs against the configured database, so load data (or a generate_seed dataset) first.
+    """
+    def cases(iterations):
+        request = RequestFactory().get('/', HTTP_HOST='localhost')
+        view = viewset(action='retrieve', request=request, format_kwarg=None)
+        instance = view.get_queryset().filter(index=index).first()
+        if instance is None:
+            raise CommandError(f"The detail suites need the {index!r} object; run load_data first.")
+        serializer_class = view.get_serializer_class()
+        render = compiled_renderer(serializer_class)
+        return [
+            (serializer_class.__name__, lambda: serializer_class(instance, context={'request': request}).data, 1),
+            ('compiled render function', lambda: render(instance, {'request': request}), 1),
+        ]
+
+    return cases
+
+
+def endpoint_payloads():
+    """
+    Returns the response data of every resource's list and of its largest detail object, by sub-heading.
+    """
+    factory = RequestFactory()
+    payloads = {}
+    for prefix, viewset, basename in router.registry:
+        list_view = viewset.as_view({'get': 'list'}, basename=basename)
+        detail_view = viewset.as_view({'get': 'retrieve'}, basename=basename)
+        payloads[f'{basename} list'] = list_view(factory.get(f'/api/{prefix}/', HTTP_HOST='localhost')).data
+        details = [
+            detail_view(factory.get(f'/api/{prefix}/{pk}/', HTTP_HOST='localhost'), pk=pk).data
+            for pk in viewset.queryset.model._default_manager.values_list('pk', flat=True)
+        ]
+        if details:
+            payloads[f'{basename} largest detail'] = max(details, key=lambda data: len(JSONRenderer().render(data)))
+    return payloads
+
+
+def bench_json(iterations):
+    """
+    Cost of encoding each endpoint's payload: the list of every resource and its largest detail object, with
+    DRF's stdlib JSONRenderer against FastJSONRenderer. Runs against the configured database.
+    """
+    groups = {}
+    for endpoint, data in endpoint_payloads().items():
+        groups[f'{endpoint} ({len(JSONRenderer().render(data)):,} bytes)'] = [
+            ('JSONRenderer', lambda data=data: JSONRenderer().render(data), 1),
+            ('FastJSONRenderer', lambda data=data: FastJSONRenderer().render(data), 1),
+        ]
+    return groups
+
+
+def bench_decode(iterations):
+    """
+    Cost of decoding each endpoint's payload on the client side, JSON against the binary formats, with the
+    size of each encoding. Formats whose library is not installed are left out.
+    """
+    groups = {}
+    for endpoint, data in endpoint_payloads().items():
+        cases = []
+        sizes = []
+        for renderer, decode in [(JSONRenderer, json.loads), (MessagePackRenderer, msgpack and msgpack.unpackb),
+                                 (CBORRenderer, cbor2 and cbor2.loads)]:
+            if decode is None:
+                continue
+            body = renderer().render(data)
+            sizes.append(f'{renderer.format} {len(body):,} bytes')
+            cases.append((f'{renderer.format} decode', lambda decode=decode, body=body: decode(body), 1))
+        groups[f"{endpoint} ({', '.join(sizes)})"] = cases
+    return groups
+
+
+# Benchmark suites by name. Each returns (label, callable, operations per call) cases, the first being the baseline,
+# or a dict of such case lists by sub-heading, each with its own baseline.
+SUITES = {
+    'links': bench_links,
+    'lists': bench_lists,
+    'class_detail': bench_detail(ClassViewSet, 'wizard'),
+    'spell_detail': bench_detail(SpellViewSet, 'fireball'),
+    'json': bench_json,
+    'decode': bench_decode,
+}
+
+
+class Command(BaseCommand):
+    help = "Run micro-benchmarks of the API's hot paths and print the cost per operation"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'suites',
+            nargs='*',
+            help=f"Suites to run (defaults to all): {', '.join(SUITES)}.",
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20000,
+            help="Calls per measurement (defaults to 20000); the best of five measurements is reported.",
+        )
+
+    def handle(self, *args, **options):
+        names = options['suites'] or list(SUITES)
+        unknown = [name for name in names if name not in SUITES]
+        if unknown:
+            raise CommandError(f"Unknown suite(s): {', '.join(unknown)}. Choose from: {', '.join(SUITES)}.")
+
+        iterations = options['iterations']
+        for name in names:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name}:"))
+            cases = SUITES[name](iterations)
+            if isinstance(cases, dict):
+                for heading, group in cases.items():
+                    self.stdout.write(f"  {heading}:")
+                    self.run_cases(group, iterations, indent='    ')
+            else:
+                self.run_cases(cases, iterations)
+
+    def run_cases(self, cases, iterations, indent='  '):
+        baseline = None
+        for label, func, operations in cases:
+            func()  # Warm caches before timing.
+            best = min(timeit.repeat(func, number=iterations, repeat=5))
+            per_operation = best / (iterations * operations)
+            baseline = baseline or per_operation
+            self.stdout.write(
+                f"{indent}{label:<40} {per_operation * 1e9:>10.0f} ns/op  {baseline / per_operation:>6.1f}x"
+            )
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client
+
+from api.models import SeedFile
+
+# Where the snapshot is written when no --output is given.
+DEFAULT_OUTPUT = settings.BASE_DIR / 'snapshot' / 'db.sqlite3'
+
+# Page size of the finished file. On this dataset 8 KiB pages made the file a third larger
+# without serving reads any faster, so the snapshot is packed into 4 KiB pages.
+DEFAULT_PAGE_SIZE = 4096
+
+# Route requested when measuring how long a booted snapshot takes to serve its first byte.
+PROBE_PATH = '/api/spells/'
+
+
+@contextmanager
+def use_database_file(path):
+    """
+    Points the default SQLite connection at another database file for the duration of the block.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    original_name = connection.settings_dict['NAME']
+    connection.close()
+    connection.settings_dict['NAME'] = str(path)
+    try:
+        yield connection
+    finally:
+        connection.close()
+        connection.settings_dict['NAME'] = original_name
+
+
+def seed_digest():
+    """
+    Returns the SHA-256 hex digest of the seed content loaded into the default database: the name and digest
+    of every applied seed file. Unlike the file's own bytes it does not change with the timestamps of a build,
+    so two builds of the same seed data agree.
+    """
+    digest = hashlib.sha256()
+    for name, file_digest in SeedFile.objects.order_by('name').values_list('name', 'digest'):
+        digest.update(f'{name} {file_digest}\n'.encode())
+    return digest.hexdigest()
+
+
+class Command(BaseCommand):
+    help = "Build a migrated, seeded and read-optimized SQLite database file to boot the application from"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=str(DEFAULT_OUTPUT),
+            help="Path of the snapshot file to write (defaults to snapshot/db.sqlite3).",
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=DEFAULT_PAGE_SIZE,
+            help=f"SQLite page size of the snapshot in bytes (defaults to {DEFAULT_PAGE_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise CommandError("Snapshots can only be built for the SQLite backend.")
+
+        output = Path(options['output']).resolve()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        building = output.with_name(output.name + '.building')
+        building.unlink(missing_ok=True)
+
+        started = time.perf_counter()
+        with use_database_file(building) as connection:
+            call_command('migrate', interactive=False, verbosity=0)
+            call_command('load_data', stdout=self.stdout, stderr=self.stderr)
+            digest = seed_digest()
+            with connection.cursor() as cursor:
+                # Statistics for the query planner, then a rewrite of the whole file at the new page size.
+                cursor.execute('ANALYZE')
+                cursor.execute('PRAGMA journal_mode = DELETE')
+                cursor.execute(f"PRAGMA page_size = {int(options['page_size'])}")
+                cursor.execute('VACUUM')
+        os.replace(building, output)
+        output.with_name(output.name + '.sha256').write_text(digest + '\n')
+        build_time = time.perf_counter() - started
+
+        copy_time, first_byte_time = self.measure_boot(output)
+        self.stdout.write(self.style.SUCCESS(
+            f"Snapshot written to {output} ({output.stat().st_size / 1024:.0f} KiB, seed sha256 {digest[:12]}) "
+            f"in {build_time:.2f}s."
+        ))
+        self.stdout.write(
+            f"Boot from snapshot: copy {copy_time * 1000:.1f} ms, "
+            f"first byte of GET {PROBE_PATH} {first_byte_time * 1000:.1f} ms, "
+            f"start-to-first-byte {(copy_time + first_byte_time) * 1000:.1f} ms."
+        )
+
+    def measure_boot(self, snapshot):
+        """
+        Simulates a cold start from the snapshot: copies it to a fresh location, opens it and serves
+        one request. Returns the copy time and the time until the response body is available.
+        """
+        with tempfile.TemporaryDirectory() as data_dir:
+            target = Path(data_dir) / 'db.sqlite3'
+            started = time.perf_counter()
+            shutil.copyfile(snapshot, target)
+            copied = time.perf_counter()
+            with use_database_file(target):
+                response = Client().get(PROBE_PATH, HTTP_HOST='localhost')
+                response.content  # Forces rendering of the body.
+                served = time.perf_counter()
+            if response.status_code != 200:
+                raise CommandError(f"GET {PROBE_PATH} on the snapshot returned {response.status_code}.")
+        return copied - started, served - copied
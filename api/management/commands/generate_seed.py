@@ -0,0 +1,149 @@
+import csv
+import os
+import random
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.management.commands.load_data import DEFAULT_SEED_DIR, LOADERS, REFERENCES, SEED_SOURCES
+from api.models import School
+
+# Where the generated files are written when no --output is given.
+DEFAULT_OUTPUT = settings.BASE_DIR / 'synthetic_seed'
+
+# Columns holding display names; replicas get the replica number appended so names stay distinguishable.
+NAME_COLUMNS = ('name', 'ref_name')
+
+# Free-text columns regenerated for every replica, with lengths drawn from the real values of the same column.
+GENERATED_TEXT = {
+    'spells_desc.csv': 'value',
+    'subclasses_desc.csv': 'value',
+}
+
+# Size of the word stream that generated paragraphs are cut from, in words.
+CORPUS_WORDS = 200_000
+
+
+def slug_columns():
+    """
+    Returns, per seed file, the columns holding slugs of replicated models. Schools are the fixed set
+    of eight schools of magic and keep their slugs, so every replica spell still points at a real school.
+    """
+    columns = {}
+    for model, (file_name, column) in SEED_SOURCES.items():
+        if model is not School:
+            columns.setdefault(file_name, set()).add(column)
+    for file_name, column, models in REFERENCES:
+        if School not in models:
+            columns.setdefault(file_name, set()).add(column)
+    return columns
+
+
+def read_seed_file(path):
+    """
+    Returns the header and rows of a seed file.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+class TextGenerator:
+    """
+    Produces filler paragraphs from the vocabulary of the real descriptions. Paragraphs are cut from one
+    long random word stream, which keeps generating a million of them cheap.
+    """
+
+    def __init__(self, rng, samples):
+        self.rng = rng
+        vocabulary = [word for text in samples for word in text.split()]
+        longest = max(len(text) for text in samples)
+        self.corpus = ' '.join(rng.choices(vocabulary, k=max(CORPUS_WORDS, longest)))
+        self.word_starts = [0] + [i + 1 for i, char in enumerate(self.corpus) if char == ' ']
+
+    def paragraph(self, length):
+        """
+        Returns a paragraph of exactly `length` characters.
+        """
+        limit = len(self.corpus) - length
+        start = self.rng.choice(self.word_starts)
+        while start > limit:
+            start = self.rng.choice(self.word_starts)
+        text = self.corpus[start:start + length].strip()
+        text = text[:1].upper() + text[1:-1] + '.' if len(text) > 1 else text
+        return text.ljust(length, '.')
+
+
+class Command(BaseCommand):
+    help = "Write a synthetic, scaled-up copy of the seed data in the csv_seed layout"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=10,
+            help="How many copies of the catalog to write (defaults to 10).",
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help="Random seed; the same seed and scale always produce the same files (defaults to 0).",
+        )
+        parser.add_argument(
+            '--source',
+            default=DEFAULT_SEED_DIR,
+            help="Directory holding the seed files to scale up (defaults to the bundled csv_seed directory).",
+        )
+        parser.add_argument(
+            '--output',
+            default=str(DEFAULT_OUTPUT),
+            help="Directory to write the generated files to (defaults to synthetic_seed/).",
+        )
+
+    def handle(self, *args, **options):
+        scale = options['scale']
+        if scale < 1:
+            raise CommandError("--scale must be at least 1.")
+
+        started = time.perf_counter()
+        rng = random.Random(options['seed'])
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+        slugs = slug_columns()
+
+        # Files are generated in loader order so the random stream, and with it the output, is stable.
+        for _, file_name, _ in LOADERS:
+            header, rows = read_seed_file(os.path.join(options['source'], file_name))
+            text_column = GENERATED_TEXT.get(file_name)
+            if text_column:
+                samples = [row[text_column] for row in rows]
+                generator = TextGenerator(rng, samples)
+                lengths = [len(text) for text in samples]
+
+            with open(output / file_name, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=header)
+                writer.writeheader()
+                # Replica 0 is the real data; every other replica renames each row into its own copy of
+                # the catalog, so each junction table keeps exactly its real per-row cardinalities.
+                writer.writerows(rows)
+                for replica in range(1, scale):
+                    for row in rows:
+                        copy = dict(row)
+                        for column in slugs.get(file_name, ()):
+                            if copy[column]:
+                                copy[column] = f"{copy[column]}-{replica}"
+                        for column in NAME_COLUMNS:
+                            if copy.get(column):
+                                copy[column] = f"{copy[column]} {replica}"
+                        if text_column:
+                            copy[text_column] = generator.paragraph(rng.choice(lengths))
+                        writer.writerow(copy)
+
+            self.stdout.write(f"{file_name}: {len(rows) * scale} rows.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote a {scale}x dataset (seed {options['seed']}) to {output} in {time.perf_counter() - started:.2f}s."
+        ))
@@ -1,15 +1,73 @@
 import os
 import csv
+import hashlib
+import json
 import django
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
 
 # Set up Django environment
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dndRestAPI.settings')
 django.setup()
 
+from api.management.profiling import StageProfiler
+from api.catalog import mark_stale
+from api.documents import backfill
+from api.response_cache import bump_all_versions
 from api.models import Class, Proficiency, ClassProficiency, Race, ProficiencyClass, ProficiencyRace, \
     RaceStartingProficiency, Subrace, SubraceStartingProficiency, Subclass, SubclassDescription, School, Spell, \
-    SpellDescription, SpellClass, SpellSubclass
+    SpellDescription, SpellClass, SpellSubclass, SeedFile
+
+# Directory holding the CSV files shipped with the project.
+DEFAULT_SEED_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "../../../csv_seed"))
+
+# Where `--profile` writes its JSON report unless told otherwise.
+DEFAULT_PROFILE_OUTPUT = 'load_data_profile.json'
+
+# Number of rows sent per INSERT/UPDATE/DELETE statement by the bulk writers.
+BATCH_SIZE = 500
+
+# Separator used to join the columns of a composite row key when it is stored as JSON.
+KEY_SEPARATOR = '\x1f'
+
+# Models referenced by their `index` slug in the seed files, and the file (and column) that seeds each of them.
+SEED_SOURCES = {
+    Class: ('classes.csv', 'index'),
+    Proficiency: ('proficiencies.csv', 'index'),
+    Race: ('races.csv', 'index'),
+    Subrace: ('subraces.csv', 'index'),
+    Subclass: ('subclasses.csv', 'index'),
+    Spell: ('spells.csv', 'index'),
+    School: ('spells.csv', 'school_index'),
+}
+
+# Every foreign-key column in the seed files, with the model(s) its slug may refer to.
+REFERENCES = [
+    ('subraces.csv', 'race_index', (Race,)),
+    ('subclasses.csv', 'class_index', (Class,)),
+    ('subclasses_desc.csv', 'subclasses_index', (Subclass,)),
+    ('spells_desc.csv', 'spells_index', (Spell,)),
+    ('classes_proficiencies.csv', 'classes_index', (Class,)),
+    ('classes_proficiencies.csv', 'ref_index', (Proficiency,)),
+    ('proficiencies_classes.csv', 'proficiencies_index', (Proficiency,)),
+    ('proficiencies_classes.csv', 'ref_index', (Class,)),
+    ('proficiencies_races.csv', 'proficiencies_index', (Proficiency,)),
+    ('proficiencies_races.csv', 'ref_index', (Race, Subrace)),
+    ('races_starting_proficiencies.csv', 'races_index', (Race,)),
+    ('races_starting_proficiencies.csv', 'ref_index', (Proficiency,)),
+    ('subraces_starting_proficiencies.csv', 'subraces_index', (Subrace,)),
+    ('subraces_starting_proficiencies.csv', 'ref_index', (Proficiency,)),
+    ('spells_classes.csv', 'spells_index', (Spell,)),
+    ('spells_classes.csv', 'ref_index', (Class,)),
+    ('spells_subclasses.csv', 'spells_index', (Spell,)),
+    ('spells_subclasses.csv', 'ref_index', (Subclass,)),
+    ('classes_subclasses.csv', 'classes_index', (Class,)),
+    ('classes_subclasses.csv', 'ref_index', (Subclass,)),
+    ('races_subraces.csv', 'races_index', (Race,)),
+    ('races_subraces.csv', 'ref_index', (Subrace,)),
+]
 
 
 def load_csv(file_path):
@@ -22,294 +80,573 @@ def load_csv(file_path):
     return data
 
 
-def load_classes(file_path):
+def file_digest(file_path):
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+    """
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def row_digests(rows, key_columns):
+    """
+    Groups the rows of a file by their natural key and returns a digest of each group's values,
+    keyed by the joined key columns. Files with several rows per key (spell descriptions) are
+    compared group by group.
+    """
+    groups = {}
+    for row in rows:
+        key = KEY_SEPARATOR.join(row[column] for column in key_columns)
+        groups.setdefault(key, hashlib.sha256()).update(KEY_SEPARATOR.join(row.values()).encode() + b'\n')
+    return {key: digest.hexdigest()[:16] for key, digest in groups.items()}
+
+
+def diff_rows(rows, key_columns, previous):
+    """
+    Compares a file's rows with the row digests recorded when it was last applied.
+    Returns the rows that were inserted or updated, and the keys (as tuples) that were deleted.
+    """
+    current = row_digests(rows, key_columns)
+    changed = {key for key, digest in current.items() if previous.get(key) != digest}
+    upserts = [row for row in rows if KEY_SEPARATOR.join(row[column] for column in key_columns) in changed]
+    deleted = [tuple(key.split(KEY_SEPARATOR)) for key in previous if key not in current]
+    return upserts, deleted
+
+
+def dependencies():
+    """
+    Returns, for each seed file, the seed files of the tables its foreign-key columns refer to.
+    """
+    deps = {}
+    for file_name, _, models in REFERENCES:
+        deps.setdefault(file_name, set()).update(SEED_SOURCES[model][0] for model in models)
+    return deps
+
+
+def index_map(model):
+    """
+    Returns a dictionary mapping the `index` slug of every stored row of the model to its primary key.
+    """
+    return dict(model.objects.values_list('index', 'pk'))
+
+
+def check_references(data, maps, deleted=None):
+    """
+    Verifies, before anything is written, that every foreign-key slug in the seed files refers to a row
+    that either already exists in the database (and is not about to be deleted) or is seeded by its own file.
+    Raises CommandError listing the unresolved references.
+    """
+    deleted = deleted or {}
+    known = {}
+    for model, (file_name, column) in SEED_SOURCES.items():
+        removed = {key[0] for key in deleted.get(file_name, [])} if column == 'index' else set()
+        known[model] = (set(maps[model]) - removed) | {row[column] for row in data[file_name]}
+    problems = []
+    for file_name, column, models in REFERENCES:
+        for line, row in enumerate(data[file_name], start=2):
+            if not any(row[column] in known[model] for model in models):
+                names = '/'.join(model.__name__ for model in models)
+                problems.append(f"{file_name}:{line}: {column}={row[column]!r} matches no {names}")
+    if problems:
+        raise CommandError("Unresolved references in seed data:\n" + "\n".join(problems))
+
+
+def first_by_key(objs, *keys):
+    """
+    Drops objects whose key repeats an earlier one, so the first row of a file wins as it did with get_or_create.
+    """
+    return list({tuple(getattr(obj, key) for key in keys): obj for obj in reversed(objs)}.values())[::-1]
+
+
+def upsert(model, objs, unique_fields, update_fields):
+    """
+    Inserts the objects, or updates `update_fields` on the stored rows sharing their `unique_fields`.
+    Updated rows get a new `updated_at` too, which the API's ETags are computed from.
+    """
+    model.objects.bulk_create(
+        first_by_key(objs, *unique_fields),
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=[*update_fields, 'updated_at'],
+    )
+
+
+def delete_indexes(model, deleted):
+    """
+    Deletes the rows whose `index` slug was removed from the seed file, cascading to their dependants.
+    """
+    if deleted:
+        model.objects.filter(index__in=[key[0] for key in deleted]).delete()
+
+
+def create_missing_links(model, fields, keys):
+    """
+    Bulk-creates junction rows for the given tuples of foreign-key ids, skipping tuples that are already stored.
+    """
+    existing = set(model.objects.values_list(*fields))
+    objs = [model(**dict(zip(fields, key))) for key in dict.fromkeys(keys) if key not in existing]
+    model.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+    return len(objs)
+
+
+def delete_links(model, fields, keys):
+    """
+    Deletes the junction rows matching the given tuples of foreign-key ids.
+    """
+    keys = set(keys)
+    if not keys:
+        return 0
+    pks = [pk for pk, *key in model.objects.values_list('pk', *fields) if tuple(key) in keys]
+    for start in range(0, len(pks), BATCH_SIZE):
+        model.objects.filter(pk__in=pks[start:start + BATCH_SIZE]).delete()
+    return len(pks)
+
+
+def relink(model, fk_field, links):
+    """
+    Points each row of the model at the parent given in `links` (a pk -> parent pk mapping),
+    updating only the rows whose current parent differs.
+    """
+    current = dict(model.objects.values_list('pk', fk_field))
+    now = timezone.now()
+    objs = [
+        model(pk=pk, updated_at=now, **{fk_field: parent})
+        for pk, parent in links.items() if current.get(pk) != parent
+    ]
+    model.objects.bulk_update(objs, [fk_field, 'updated_at'], batch_size=BATCH_SIZE)
+    return len(objs)
+
+
+def resolve(mapping, deleted):
+    """
+    Translates deleted slug tuples into primary-key tuples using one index map per column,
+    dropping tuples that name rows which no longer exist.
+    """
+    keys = []
+    for key in deleted:
+        pks = tuple(column_map.get(slug) for column_map, slug in zip(mapping, key))
+        if None not in pks:
+            keys.append(pks)
+    return keys
+
+
+def load_classes(rows, deleted, maps):
     """
     Load data from classes.csv into the Class model.
     """
-    data = load_csv(file_path)
-    for row in data:
-        Class.objects.get_or_create(
-            index=row['index'],
-            defaults={'hit_die': int(row['hit_die']), 'name': row['name']}
-        )
+    delete_indexes(Class, deleted)
+    upsert(Class, [
+        Class(index=row['index'], hit_die=int(row['hit_die']), name=row['name'])
+        for row in rows
+    ], ['index'], ['hit_die', 'name'])
+    maps[Class] = index_map(Class)
     print("Classes loaded.")
 
 
-def load_proficiencies(file_path):
+def load_proficiencies(rows, deleted, maps):
     """
     Load data from proficiencies.csv into the Proficiency model.
     """
-    data = load_csv(file_path)
-    for row in data:
-        Proficiency.objects.get_or_create(
-            index=row['index'],
-            defaults={'name': row['name'], 'type': row['type']}
-        )
+    delete_indexes(Proficiency, deleted)
+    upsert(Proficiency, [
+        Proficiency(index=row['index'], name=row['name'], type=row['type'])
+        for row in rows
+    ], ['index'], ['name', 'type'])
+    maps[Proficiency] = index_map(Proficiency)
     print("Proficiencies loaded.")
 
 
-def load_races(file_path):
+def load_races(rows, deleted, maps):
     """
     Load data from races.csv into the Race model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            Race.objects.get_or_create(
-                index=row['index'],
-                defaults={
-                    'age': row['age'],
-                    'alignment': row['alignment'],
-                    'language_desc': row['language_desc'],
-                    'name': row['name'],
-                    'size': row['size'],
-                    'size_description': row['size_description'],
-                    'speed': int(row['speed']),
-                }
-            )
+    delete_indexes(Race, deleted)
+    upsert(Race, [
+        Race(
+            index=row['index'],
+            age=row['age'],
+            alignment=row['alignment'],
+            language_desc=row['language_desc'],
+            name=row['name'],
+            size=row['size'],
+            size_description=row['size_description'],
+            speed=int(row['speed']),
+        )
+        for row in rows
+    ], ['index'], ['age', 'alignment', 'language_desc', 'name', 'size', 'size_description', 'speed'])
+    maps[Race] = index_map(Race)
     print("Races loaded.")
 
 
-def load_subraces(file_path):
+def load_subraces(rows, deleted, maps):
     """
     Load data from subraces.csv into the Subrace model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            race = Race.objects.get(index=row['race_index'])
-            Subrace.objects.get_or_create(
-                index=row['index'],
-                defaults={
-                    'desc': row['desc'],
-                    'name': row['name'],
-                    'race': race,
-                }
-            )
+    delete_indexes(Subrace, deleted)
+    upsert(Subrace, [
+        Subrace(index=row['index'], desc=row['desc'], name=row['name'], race_id=maps[Race][row['race_index']])
+        for row in rows
+    ], ['index'], ['desc', 'name', 'race'])
+    maps[Subrace] = index_map(Subrace)
     print("Subraces loaded.")
 
 
-def load_subclasses(file_path):
+def load_subclasses(rows, deleted, maps):
     """
     Load data from subclasses.csv into the Subclass model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            class_obj = Class.objects.get(index=row['class_index'])
-            Subclass.objects.get_or_create(
-                index=row['index'],
-                defaults={
-                    'name': row['name'],
-                    'subclass_flavor': row['subclass_flavor'],
-                    'class_obj': class_obj,
-                }
-            )
+    delete_indexes(Subclass, deleted)
+    upsert(Subclass, [
+        Subclass(
+            index=row['index'],
+            name=row['name'],
+            subclass_flavor=row['subclass_flavor'],
+            class_obj_id=maps[Class][row['class_index']],
+        )
+        for row in rows
+    ], ['index'], ['name', 'subclass_flavor', 'class_obj'])
+    maps[Subclass] = index_map(Subclass)
     print("Subclasses loaded.")
 
 
-def load_subclasses_desc(file_path):
+def load_subclasses_desc(rows, deleted, maps):
     """
     Load data from subclasses_desc.csv into the SubclassDescription model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            subclass = Subclass.objects.get(index=row['subclasses_index'])
-            SubclassDescription.objects.get_or_create(
-                subclass=subclass,
-                defaults={'value': row['value']}
-            )
+    SubclassDescription.objects.filter(subclass_id__in=[pks[0] for pks in resolve([maps[Subclass]], deleted)]).delete()
+    upsert(SubclassDescription, [
+        SubclassDescription(subclass_id=maps[Subclass][row['subclasses_index']], value=row['value'])
+        for row in rows
+    ], ['subclass_id'], ['value'])
     print("Subclass Descriptions loaded.")
 
 
-def load_spells(file_path):
+def load_spells(rows, deleted, maps):
     """
-    Load data from spells.csv into the Spell model.
+    Load data from spells.csv into the Spell model, creating the schools they reference first.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            school, _ = School.objects.get_or_create(index=row['school_index'], name=row['school_name'])
-            Spell.objects.get_or_create(
-                index=row['index'],
-                defaults={
-                    'name': row['name'],
-                    'level': int(row['level']),
-                    'attack_type': row['attack_type'] if row['attack_type'] else None,
-                    'casting_time': row['casting_time'],
-                    'concentration': row['concentration'] == 'True',
-                    'duration': row['duration'],
-                    'material': row['material'] if row['material'] else None,
-                    'range': row['range'],
-                    'ritual': row['ritual'] == 'True',
-                    'school': school,
-                }
-            )
+    delete_indexes(Spell, deleted)
+    School.objects.bulk_create(first_by_key([
+        School(index=row['school_index'], name=row['school_name'])
+        for row in rows if row['school_index'] not in maps[School]
+    ], 'index'), batch_size=BATCH_SIZE)
+    maps[School] = index_map(School)
+
+    upsert(Spell, [
+        Spell(
+            index=row['index'],
+            name=row['name'],
+            level=int(row['level']),
+            attack_type=row['attack_type'] if row['attack_type'] else None,
+            casting_time=row['casting_time'],
+            concentration=row['concentration'] == 'True',
+            duration=row['duration'],
+            material=row['material'] if row['material'] else None,
+            range=row['range'],
+            ritual=row['ritual'] == 'True',
+            school_id=maps[School][row['school_index']],
+        )
+        for row in rows
+    ], ['index'], ['name', 'level', 'attack_type', 'casting_time', 'concentration', 'duration', 'material', 'range',
+                 'ritual', 'school'])
+    maps[Spell] = index_map(Spell)
     print("Spells loaded.")
 
 
-def load_spell_descriptions(file_path):
+def load_spell_descriptions(rows, deleted, maps):
     """
     Load data from spells_desc.csv into the SpellDescription model.
-    """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            spell = Spell.objects.get(index=row['spells_index'])
-            SpellDescription.objects.create(spell=spell, value=row['value'])
+    Paragraphs are upserted on (spell, position), where the position is the paragraph's order among the
+    spell's rows in the file; positions past the end of a shortened description are removed.
+    """
+    positions = {}
+    objs = []
+    for row in rows:
+        spell_id = maps[Spell][row['spells_index']]
+        position = positions[spell_id] = positions.get(spell_id, -1) + 1
+        objs.append(SpellDescription(spell_id=spell_id, position=position, value=row['value']))
+    upsert(SpellDescription, objs, ['spell_id', 'position'], ['value'])
+
+    removed = {pks[0] for pks in resolve([maps[Spell]], deleted)}
+    stale = [
+        pk for pk, spell_id, position in SpellDescription.objects.filter(
+            spell_id__in=removed | set(positions)
+        ).values_list('pk', 'spell_id', 'position')
+        if spell_id in removed or position > positions.get(spell_id, -1)
+    ]
+    for start in range(0, len(stale), BATCH_SIZE):
+        SpellDescription.objects.filter(pk__in=stale[start:start + BATCH_SIZE]).delete()
     print("Spell Descriptions loaded.")
 
 
 # Junction Table Loaders
-def load_class_proficiencies(file_path):
-    data = load_csv(file_path)
-    for row in data:
-        class_obj = Class.objects.get(index=row['classes_index'])
-        proficiency = Proficiency.objects.get(index=row['ref_index'])
-        ClassProficiency.objects.get_or_create(class_obj=class_obj, proficiency=proficiency)
+def load_class_proficiencies(rows, deleted, maps):
+    """
+    Load data from classes_proficiencies.csv into the ClassProficiency model.
+    """
+    fields = ('class_obj_id', 'proficiency_id')
+    delete_links(ClassProficiency, fields, resolve([maps[Class], maps[Proficiency]], deleted))
+    create_missing_links(ClassProficiency, fields, [
+        (maps[Class][row['classes_index']], maps[Proficiency][row['ref_index']])
+        for row in rows
+    ])
     print("Class proficiencies loaded.")
 
 
-def load_proficiencies_classes(file_path):
+def load_proficiencies_classes(rows, deleted, maps):
     """
     Load data from proficiencies_classes.csv into the ProficiencyClass model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            proficiency = Proficiency.objects.get(index=row['proficiencies_index'])
-            class_obj = Class.objects.get(index=row['ref_index'])
-            ProficiencyClass.objects.get_or_create(proficiency=proficiency, class_obj=class_obj)
+    fields = ('proficiency_id', 'class_obj_id')
+    delete_links(ProficiencyClass, fields, resolve([maps[Proficiency], maps[Class]], deleted))
+    create_missing_links(ProficiencyClass, fields, [
+        (maps[Proficiency][row['proficiencies_index']], maps[Class][row['ref_index']])
+        for row in rows
+    ])
     print("Proficiencies-Classes loaded.")
 
 
-def load_proficiencies_races(file_path):
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            proficiency = Proficiency.objects.get(index=row['proficiencies_index'])
-            try:
-                race = Race.objects.get(index=row['ref_index'])
-                ProficiencyRace.objects.create(proficiency=proficiency, race=race)
-            except Race.DoesNotExist:
-                subrace = Subrace.objects.get(index=row['ref_index'])
-                ProficiencyRace.objects.create(proficiency=proficiency, subrace=subrace)
+def proficiency_race_key(maps, proficiency_index, ref_index):
+    """
+    Builds the (proficiency, race, subrace) id tuple of a proficiencies_races.csv row.
+    The `ref_index` column names a race when one matches, otherwise a subrace.
+    """
+    if ref_index in maps[Race]:
+        return maps[Proficiency].get(proficiency_index), maps[Race][ref_index], None
+    return maps[Proficiency].get(proficiency_index), None, maps[Subrace].get(ref_index)
+
+
+def load_proficiencies_races(rows, deleted, maps):
+    """
+    Load data from proficiencies_races.csv into the ProficiencyRace model.
+    """
+    fields = ('proficiency_id', 'race_id', 'subrace_id')
+    delete_links(ProficiencyRace, fields, [proficiency_race_key(maps, *key) for key in deleted])
+    create_missing_links(ProficiencyRace, fields, [
+        proficiency_race_key(maps, row['proficiencies_index'], row['ref_index'])
+        for row in rows
+    ])
+    print("Proficiencies-Races loaded.")
 
 
-def load_races_starting_proficiencies(file_path):
+def load_races_starting_proficiencies(rows, deleted, maps):
     """
     Load data from races_starting_proficiencies.csv into the RaceStartingProficiency model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            race = Race.objects.get(index=row['races_index'])
-            proficiency = Proficiency.objects.get(index=row['ref_index'])
-            RaceStartingProficiency.objects.get_or_create(race=race, proficiency=proficiency)
+    fields = ('race_id', 'proficiency_id')
+    delete_links(RaceStartingProficiency, fields, resolve([maps[Race], maps[Proficiency]], deleted))
+    create_missing_links(RaceStartingProficiency, fields, [
+        (maps[Race][row['races_index']], maps[Proficiency][row['ref_index']])
+        for row in rows
+    ])
     print("Races Starting Proficiencies loaded.")
 
 
-def load_subraces_starting_proficiencies(file_path):
+def load_subraces_starting_proficiencies(rows, deleted, maps):
     """
     Load data from subraces_starting_proficiencies.csv into the SubraceStartingProficiency model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            subrace = Subrace.objects.get(index=row['subraces_index'])
-            proficiency = Proficiency.objects.get(index=row['ref_index'])
-            SubraceStartingProficiency.objects.get_or_create(subrace=subrace, proficiency=proficiency)
+    fields = ('subrace_id', 'proficiency_id')
+    delete_links(SubraceStartingProficiency, fields, resolve([maps[Subrace], maps[Proficiency]], deleted))
+    create_missing_links(SubraceStartingProficiency, fields, [
+        (maps[Subrace][row['subraces_index']], maps[Proficiency][row['ref_index']])
+        for row in rows
+    ])
     print("Subraces Starting Proficiencies loaded.")
 
 
-def load_spell_classes(file_path):
+def load_spell_classes(rows, deleted, maps):
     """
     Load data from spells_classes.csv into the SpellClass model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            spell = Spell.objects.get(index=row['spells_index'])
-            class_obj = Class.objects.get(index=row['ref_index'])
-            SpellClass.objects.get_or_create(spell=spell, class_obj=class_obj)
+    fields = ('spell_id', 'class_obj_id')
+    delete_links(SpellClass, fields, resolve([maps[Spell], maps[Class]], deleted))
+    create_missing_links(SpellClass, fields, [
+        (maps[Spell][row['spells_index']], maps[Class][row['ref_index']])
+        for row in rows
+    ])
     print("Spell Classes loaded.")
 
 
-def load_spell_subclasses(file_path):
+def load_spell_subclasses(rows, deleted, maps):
     """
     Load data from spells_subclasses.csv into the SpellSubclass model.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            spell = Spell.objects.get(index=row['spells_index'])
-            subclass = Subclass.objects.get(index=row['ref_index'])
-            SpellSubclass.objects.get_or_create(spell=spell, subclass=subclass)
+    fields = ('spell_id', 'subclass_id')
+    delete_links(SpellSubclass, fields, resolve([maps[Spell], maps[Subclass]], deleted))
+    create_missing_links(SpellSubclass, fields, [
+        (maps[Spell][row['spells_index']], maps[Subclass][row['ref_index']])
+        for row in rows
+    ])
     print("Spell Subclasses loaded.")
 
 
 # Relationships Loaders
-def load_classes_subclasses(file_path):
+def load_classes_subclasses(rows, deleted, maps):
     """
-    Load data from classes_subclasses.csv into the Subclass model.
+    Load data from classes_subclasses.csv and ensure Subclasses are correctly linked to their Classes.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            class_obj = Class.objects.get(index=row['classes_index'])
-            subclass = Subclass.objects.get(index=row['ref_index'])
-
-            # Ensure the subclass is properly linked to its class
-            if subclass.class_obj != class_obj:
-                subclass.class_obj = class_obj
-                subclass.save()
+    relink(Subclass, 'class_obj_id', {
+        maps[Subclass][row['ref_index']]: maps[Class][row['classes_index']]
+        for row in rows
+    })
     print("Classes-Subclasses relationships loaded.")
 
 
-def load_races_subraces(file_path):
+def load_races_subraces(rows, deleted, maps):
     """
     Load data from races_subraces.csv and ensure Subraces are correctly linked to their Races.
     """
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            race = Race.objects.get(index=row['races_index'])
-            subrace = Subrace.objects.get(index=row['ref_index'])
-
-            # Ensure the Subrace is linked to the correct Race
-            if subrace.race != race:
-                subrace.race = race
-                subrace.save()
+    relink(Subrace, 'race_id', {
+        maps[Subrace][row['ref_index']]: maps[Race][row['races_index']]
+        for row in rows
+    })
     print("Races-Subraces relationships loaded.")
 
 
+# Loaders in the order they must run, each paired with the seed file it consumes and the columns
+# forming the natural key of that file's rows.
+LOADERS = [
+    (load_classes, 'classes.csv', ('index',)),
+    (load_proficiencies, 'proficiencies.csv', ('index',)),
+    (load_races, 'races.csv', ('index',)),
+    (load_subraces, 'subraces.csv', ('index',)),
+    (load_subclasses, 'subclasses.csv', ('index',)),
+    (load_spells, 'spells.csv', ('index',)),
+    (load_class_proficiencies, 'classes_proficiencies.csv', ('classes_index', 'ref_index')),
+    (load_proficiencies_classes, 'proficiencies_classes.csv', ('proficiencies_index', 'ref_index')),
+    (load_proficiencies_races, 'proficiencies_races.csv', ('proficiencies_index', 'ref_index')),
+    (load_races_starting_proficiencies, 'races_starting_proficiencies.csv', ('races_index', 'ref_index')),
+    (load_subraces_starting_proficiencies, 'subraces_starting_proficiencies.csv', ('subraces_index', 'ref_index')),
+    (load_subclasses_desc, 'subclasses_desc.csv', ('subclasses_index',)),
+    (load_classes_subclasses, 'classes_subclasses.csv', ('ref_index',)),
+    (load_races_subraces, 'races_subraces.csv', ('ref_index',)),
+    (load_spell_descriptions, 'spells_desc.csv', ('spells_index',)),
+    (load_spell_classes, 'spells_classes.csv', ('spells_index', 'ref_index')),
+    (load_spell_subclasses, 'spells_subclasses.csv', ('spells_index', 'ref_index')),
+]
+
+
+def plan_changes(data, digests, previous, force=False):
+    """
+    Works out what each loader has to apply. A file whose digest is unchanged is skipped, a changed file
+    contributes only its inserted, updated and deleted rows, and a file depending on a changed table is
+    re-applied in full so rows removed by cascading deletes are restored.
+    Returns a mapping of file name to (rows, deleted keys).
+    """
+    deps = dependencies()
+    changes = {}
+    for _, file_name, key_columns in LOADERS:
+        record = previous.get(file_name)
+        dirty_deps = deps.get(file_name, set()) & set(changes)
+        if force or record is None or dirty_deps:
+            _, deleted = diff_rows(data[file_name], key_columns, record.rows if record else {})
+            changes[file_name] = (data[file_name], deleted)
+        elif record.digest != digests[file_name]:
+            changes[file_name] = diff_rows(data[file_name], key_columns, record.rows)
+    return changes
+
+
 class Command(BaseCommand):
     help = "Load data into the database from CSV files"
 
-    def handle(self, *args, **kwargs):
-        base_dir = os.path.join(os.path.dirname(__file__), "../../../csv_seed")
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            default=DEFAULT_SEED_DIR,
+            help="Directory containing the seed CSV files (defaults to csv_seed/).",
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help="Re-apply every file even if its content hash is unchanged.",
+        )
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help="Report wall time, SQL queries, rows read/written and peak memory for every loader. "
+                 "Combine with --force to profile a full load.",
+        )
+        parser.add_argument(
+            '--profile-output',
+            default=DEFAULT_PROFILE_OUTPUT,
+            help="JSON file the profile report is written to (defaults to load_data_profile.json).",
+        )
+        parser.add_argument(
+            '--profile-baseline',
+            help="JSON report of an earlier --profile run to compare this run against.",
+        )
+
+    def handle(self, *args, **options):
+        base_dir = options['source']
+        force = options['force']
+        profiler = StageProfiler(enabled=options['profile'])
 
         self.stdout.write("Starting data load...")
 
+        profiler.start()
         try:
-            load_classes(os.path.join(base_dir, 'classes.csv'))
-            load_proficiencies(os.path.join(base_dir, 'proficiencies.csv'))
-            load_races(os.path.join(base_dir, 'races.csv'))
-            load_subraces(os.path.join(base_dir, 'subraces.csv'))
-            load_subclasses(os.path.join(base_dir, 'subclasses.csv'))
-            load_spells(os.path.join(base_dir, 'spells.csv'))
-            load_class_proficiencies(os.path.join(base_dir, 'classes_proficiencies.csv'))
-            load_proficiencies_classes(os.path.join(base_dir, 'proficiencies_classes.csv'))
-            load_proficiencies_races(os.path.join(base_dir, 'proficiencies_races.csv'))
-            load_races_starting_proficiencies(os.path.join(base_dir, 'races_starting_proficiencies.csv'))
-            load_subraces_starting_proficiencies(os.path.join(base_dir, 'subraces_starting_proficiencies.csv'))
-            load_subclasses_desc(os.path.join(base_dir, 'subclasses_desc.csv'))
-            load_classes_subclasses(os.path.join(base_dir, 'classes_subclasses.csv'))
-            load_races_subraces(os.path.join(base_dir, 'races_subraces.csv'))
-            load_spell_descriptions(os.path.join(base_dir, 'spells_desc.csv'))
-            load_spell_classes(os.path.join(base_dir, 'spells_classes.csv'))
-            load_spell_subclasses(os.path.join(base_dir, 'spells_subclasses.csv'))
-            self.stdout.write(self.style.SUCCESS("All data loaded successfully."))
+            with profiler.stage('hash files'):
+                paths = {file_name: os.path.join(base_dir, file_name) for _, file_name, _ in LOADERS}
+                digests = {file_name: file_digest(path) for file_name, path in paths.items()}
+                previous = {seed_file.name: seed_file for seed_file in SeedFile.objects.all()}
+
+            if not force and all(
+                    file_name in previous and previous[file_name].digest == digest
+                    for file_name, digest in digests.items()
+            ):
+                self.stdout.write(self.style.SUCCESS("Seed files unchanged, nothing to load."))
+                return
+
+            # Parse every file once and resolve the slugs already stored before touching the database.
+            with profiler.stage('parse and validate'):
+                data = {file_name: load_csv(path) for file_name, path in paths.items()}
+                changes = plan_changes(data, digests, previous, force)
+                maps = {model: index_map(model) for model in SEED_SOURCES}
+                check_references(data, maps, {file_name: deleted for file_name, (_, deleted) in changes.items()})
+
+            with transaction.atomic():
+                for loader, file_name, _ in LOADERS:
+                    if file_name in changes:
+                        with profiler.stage(loader.__name__, rows_read=len(changes[file_name][0])):
+                            loader(*changes[file_name], maps)
+                with profiler.stage('record hashes'):
+                    SeedFile.objects.bulk_create(
+                        [
+                            SeedFile(name=file_name, digest=digests[file_name], rows=row_digests(data[file_name], key))
+                            for _, file_name, key in LOADERS if file_name in changes
+                        ],
+                        update_conflicts=True,
+                        unique_fields=['name'],
+                        update_fields=['digest', 'rows', 'loaded_at'],
+                    )
+                # Cached API responses built from the previous data no longer match it.
+                bump_all_versions()
+                if settings.MATERIALIZED_DOCUMENTS:
+                    with profiler.stage('materialize documents'):
+                        backfill()
+            # Outside the transaction, so workers rebuild their catalogs from the committed data.
+            mark_stale()
+            self.stdout.write(self.style.SUCCESS(
+                f"All data loaded successfully ({len(changes)} of {len(LOADERS)} files applied)."
+            ))
         except Exception as e:
             self.stderr.write(self.style.ERROR(f"An error occurred: {e}"))
+            raise CommandError(e) from e
+        finally:
+            profiler.stop()
+            if profiler.enabled:
+                self.report_profile(profiler, options)
+
+    def report_profile(self, profiler, options):
+        """
+        Prints the per-stage profile, compared with a baseline report when one is given, and saves it as JSON.
+        """
+        baseline = None
+        if options['profile_baseline']:
+            with open(options['profile_baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+        self.stdout.write(profiler.format_table(baseline))
+        profiler.write_json(options['profile_output'], source=os.path.abspath(options['source']))
+        self.stdout.write(f"Profile written to {options['profile_output']}.")
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.documents import backfill
+from api.models import DetailDocument
+
+
+class Command(BaseCommand):
+    help = "Rebuild every materialized detail document from the current data"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = backfill()
+        size = sum(len(body) for body in DetailDocument.objects.values_list('body', flat=True))
+        self.stdout.write(self.style.SUCCESS(
+            f"{count} documents materialized ({size / 1024:.0f} KiB) in {time.perf_counter() - started:.2f}s."
+        ))
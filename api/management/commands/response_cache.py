@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from api.response_cache import cache_stats, response_cache
+
+
+class Command(BaseCommand):
+    help = "Show the hit and miss counts of the API response cache, or clear it"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help="Remove every cached response and reset the counters.",
+        )
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            response_cache().clear()
+            self.stdout.write(self.style.SUCCESS("Response cache cleared."))
+            return
+        stats = cache_stats()
+        total = stats['hits'] + stats['misses']
+        rate = f"{stats['hits'] / total:.1%}" if total else 'n/a'
+        self.stdout.write(f"hits: {stats['hits']}\nmisses: {stats['misses']}\nhit rate: {rate}")
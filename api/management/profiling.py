@@ -0,0 +1,139 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from django.db import connection
+
+
+# Statements whose cursor row count is the number of rows they wrote.
+WRITE_STATEMENTS = {'INSERT', 'UPDATE', 'DELETE'}
+
+
+def rows_changed():
+    """
+    Returns the number of rows inserted, updated or deleted on the default connection since it was opened.
+    SQLite keeps this counter itself, which also covers INSERT ... RETURNING statements whose cursor
+    rowcount is not yet known when they finish executing. Returns None on other backends, whose writes are
+    counted from the cursor row counts instead.
+    """
+    if connection.vendor != 'sqlite':
+        return None
+    connection.ensure_connection()
+    return connection.connection.total_changes
+
+
+class StageProfiler:
+    """
+    Measures the stages of a management command: wall time, SQL queries, rows read and written,
+    and the peak Python memory allocated while the stage ran.
+
+    A disabled profiler turns `stage()` into a no-op so commands can wrap their stages unconditionally.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stages = []
+
+    def start(self):
+        if self.enabled:
+            tracemalloc.start()
+
+    def stop(self):
+        if self.enabled:
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name, rows_read=0):
+        """
+        Profiles the enclosed block as one stage named `name`.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stats = {'stage': name, 'seconds': 0.0, 'queries': 0, 'rows_read': rows_read, 'rows_written': 0,
+                 'peak_memory_kib': 0.0}
+
+        changes_before = rows_changed()
+
+        def count_queries(execute, sql, params, many, context):
+            stats['queries'] += 1
+            result = execute(sql, params, many, context)
+            if changes_before is None and sql.lstrip()[:6].upper() in WRITE_STATEMENTS:
+                stats['rows_written'] += max(context['cursor'].rowcount, 0)
+            return result
+
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_queries):
+                yield
+        finally:
+            stats['seconds'] = round(time.perf_counter() - started, 6)
+            if changes_before is not None:
+                stats['rows_written'] = rows_changed() - changes_before
+            stats['peak_memory_kib'] = round((tracemalloc.get_traced_memory()[1] - baseline) / 1024, 1)
+            self.stages.append(stats)
+
+    def totals(self):
+        """
+        Returns the sums of every measure across stages (the peak memory is the largest single stage).
+        """
+        return {
+            'stage': 'total',
+            'seconds': round(sum(s['seconds'] for s in self.stages), 6),
+            'queries': sum(s['queries'] for s in self.stages),
+            'rows_read': sum(s['rows_read'] for s in self.stages),
+            'rows_written': sum(s['rows_written'] for s in self.stages),
+            'peak_memory_kib': max((s['peak_memory_kib'] for s in self.stages), default=0.0),
+        }
+
+    def write_json(self, path, **metadata):
+        """
+        Saves the report so a later run can be compared against it.
+        """
+        report = {
+            'created': datetime.now(timezone.utc).isoformat(),
+            **metadata,
+            'stages': self.stages,
+            'total': self.totals(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    def format_table(self, baseline=None):
+        """
+        Renders the report as a plain-text table. When a previous report is given, each stage also shows
+        the change in wall time and query count against the stage of the same name.
+        """
+        previous = {s['stage']: s for s in (baseline or {}).get('stages', [])}
+        if baseline:
+            previous['total'] = baseline.get('total', {})
+
+        headers = ['stage', 'seconds', 'queries', 'rows read', 'rows written', 'peak KiB']
+        if baseline:
+            headers += ['Δ seconds', 'Δ queries']
+        lines = []
+        for stats in self.stages + [self.totals()]:
+            line = [stats['stage'], f"{stats['seconds']:.4f}", str(stats['queries']), str(stats['rows_read']),
+                    str(stats['rows_written']), f"{stats['peak_memory_kib']:.1f}"]
+            if baseline:
+                before = previous.get(stats['stage'])
+                if before:
+                    line += [f"{stats['seconds'] - before['seconds']:+.4f}", f"{stats['queries'] - before['queries']:+d}"]
+                else:
+                    line += ['new', 'new']
+            lines.append(line)
+
+        widths = [max(len(row[i]) for row in [headers] + lines) for i in range(len(headers))]
+
+        def render(row):
+            return '  '.join(
+                cell.ljust(width) if i == 0 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))
+            )
+
+        rule = '  '.join('-' * width for width in widths)
+        return '\n'.join([render(headers), rule] + [render(row) for row in lines[:-1]] + [rule, render(lines[-1])])
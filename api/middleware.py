@@ -0,0 +1,198 @@
+import logging
+import re
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework.fields import Field
+
+from api.compression import CODINGS, CompressedBodyCache, coded_etag, identity_etag, negotiate_coding
+
+logger = logging.getLogger(__name__)
+
+# Patterns that reduce a SQL statement to its shape: quoted and numeric literals, and IN lists of any length.
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_LISTS = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+
+# Source files whose frames are never reported as the call site of a query.
+PROJECT_ROOT = str(settings.BASE_DIR)
+THIS_FILE = str(Path(__file__).resolve())
+
+
+# Media types of the API's own representations, which are compressed. HTML is left alone: the browsable API's
+# forms carry CSRF tokens, which compression would expose to BREACH-style attacks.
+COMPRESSIBLE_TYPES = {
+    'application/json', 'application/x-ndjson', 'text/csv', 'application/msgpack', 'application/cbor',
+}
+
+# Compressed response bodies of this process, shared by every CompressionMiddleware instance.
+compressed_bodies = CompressedBodyCache(settings.COMPRESSION_CACHE_BYTES)
+
+
+class NPlusOneQueryError(Exception):
+    """
+    Raised in strict mode when a request repeats the same SQL statement more often than allowed.
+    """
+
+
+def statement_shape(sql):
+    """
+    Returns `sql` with its literal values and IN-list lengths removed, so that the queries of one
+    N+1 loop all map to the same string.
+    """
+    return PLACEHOLDER_LISTS.sub('(%s...)', LITERALS.sub('?', sql))
+
+
+def find_culprit():
+    """
+    Describes where the current query comes from: the innermost serializer field being rendered, if any,
+    and the innermost frame of project code.
+    """
+    field = call_site = None
+    frame = sys._getframe(2)
+    # Skip past the execute wrappers themselves, which may live in project code too.
+    caller = frame
+    while caller and caller.f_code.co_name != '_execute_with_wrappers':
+        caller = caller.f_back
+    if caller:
+        frame = caller.f_back
+    while frame and not (field and call_site):
+        owner = frame.f_locals.get('self')
+        if field is None and isinstance(owner, Field) and owner.field_name and owner.parent is not None:
+            field = f"{type(owner.parent).__name__}.{owner.field_name}"
+        filename = frame.f_code.co_filename
+        if call_site is None and filename.startswith(PROJECT_ROOT) and filename != THIS_FILE \
+                and 'site-packages' not in filename:
+            call_site = f"{Path(filename).relative_to(PROJECT_ROOT)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return field, call_site
+
+
+class QueryPatternTracker:
+    """
+    Counts the SELECT statements of one request by shape and remembers where each shape first went over
+    the threshold. Writes are left out: the ORM deletes and updates large sets in fixed-size batches, which
+    repeat a shape legitimately.
+    """
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = {}
+        self.culprits = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper() != 'SELECT':
+            return execute(sql, params, many, context)
+        shape = statement_shape(sql)
+        count = self.counts.get(shape, 0) + 1
+        self.counts[shape] = count
+        if count == self.threshold + 1:
+            self.culprits[shape] = find_culprit()
+        return execute(sql, params, many, context)
+
+    def repeated(self):
+        """
+        Returns (shape, count, serializer field, call site) for every shape run more often than the threshold.
+        """
+        return [(shape, self.counts[shape], *culprit) for shape, culprit in self.culprits.items()]
+
+
+class NPlusOneDetectionMiddleware:
+    """
+    Warns about N+1 query patterns: SELECT statements of the same shape repeated more than
+    `NPLUSONE_THRESHOLD` times within one request. Each warning names the serializer field and the
+    line of project code that issued the repeated statement. With `NPLUSONE_STRICT` the request
+    raises `NPlusOneQueryError` instead, which makes tests fail.
+
+    The middleware removes itself from the stack at startup unless `NPLUSONE_DETECTION` is enabled.
+    """
+
+    def __init__(self, get_response):
+        if not settings.NPLUSONE_DETECTION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = settings.NPLUSONE_THRESHOLD
+        self.strict = settings.NPLUSONE_STRICT
+
+    def __call__(self, request):
+        tracker = QueryPatternTracker(self.threshold)
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(tracker))
+            response = self.get_response(request)
+
+        problems = tracker.repeated()
+        for shape, count, field, call_site in problems:
+            logger.warning(
+                "N+1 queries on %s %s: %d queries of shape %r (field: %s, call site: %s)",
+                request.method, request.path, count, shape[:200], field or 'unknown', call_site or 'unknown',
+            )
+        if problems and self.strict:
+            raise NPlusOneQueryError(
+                f"{request.method} {request.path} repeated {len(problems)} statement shape(s) more than "
+                f"{self.threshold} times: " + '; '.join(
+                    f"{count}x from {field or call_site or 'unknown'}" for _, count, field, call_site in problems
+                )
+            )
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Compresses API responses with the best coding the client lists in Accept-Encoding: brotli, zstd or gzip
+    (the first two when their libraries are installed). Each compressed body is cached, keyed by the
+    response's ETag (or a digest of the body) and the coding, so a representation is compressed once and the
+    same bytes are served to every later client.
+
+    A compressed response keeps a strong ETag, with the coding appended (`"<tag>-br"`). The coding is taken
+    off the tags of `If-None-Match` and `If-Match` before the view compares them, and a 304 answers with
+    the tag the client sent.
+
+    Bodies shorter than `COMPRESSION_MIN_SIZE` bytes, streamed responses, responses other than 200 and
+    non-API content types are sent as they are. The middleware removes itself from the stack at startup
+    unless `RESPONSE_COMPRESSION` is enabled.
+    """
+
+    def __init__(self, get_response):
+        if not settings.RESPONSE_COMPRESSION or not CODINGS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        sent = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        for header in ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MATCH'):
+            if header in request.META:
+                request.META[header] = ', '.join(map(identity_etag, parse_etags(request.META[header])))
+
+        response = self.get_response(request)
+        if response.status_code == 304 and response.has_header('ETag'):
+            matching = [tag for tag in sent if identity_etag(tag.removeprefix('W/')) == response['ETag']]
+            if matching:
+                response['ETag'] = matching[0]
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip()
+        if response.status_code != 200 or response.streaming or response.has_header('Content-Encoding') \
+                or content_type not in COMPRESSIBLE_TYPES:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = negotiate_coding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if coding is None or len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        etag = response.get('ETag')
+        representation = (request.get_full_path(), response['Content-Type'], etag) if etag else None
+        body = compressed_bodies.compress(response.content, coding, representation)
+        if len(body) >= len(response.content):
+            return response
+        response.content = body
+        response['Content-Length'] = str(len(body))
+        response['Content-Encoding'] = coding
+        if etag:
+            response['ETag'] = coded_etag(etag, coding)
+        return response
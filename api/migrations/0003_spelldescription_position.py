@@ -0,0 +1,57 @@
+from django.db import migrations, models
+
+
+def number_descriptions(apps, schema_editor):
+    """
+    Assigns positions to the existing spell descriptions in insertion order.
+
+    Earlier versions of load_data appended every description again on each start, so a spell's
+    paragraphs may be stored as the same sequence repeated several times. Only the first copy is kept.
+    """
+    SpellDescription = apps.get_model('api', 'SpellDescription')
+    paragraphs = {}
+    for pk, spell_id, value in SpellDescription.objects.order_by('spell_id', 'id').values_list('id', 'spell_id', 'value'):
+        paragraphs.setdefault(spell_id, []).append((pk, value))
+
+    duplicates = []
+    for rows in paragraphs.values():
+        values = [value for _, value in rows]
+        period = next(
+            size for size in range(1, len(values) + 1)
+            if len(values) % size == 0 and values == values[:size] * (len(values) // size)
+        )
+        for position, (pk, _) in enumerate(rows[:period]):
+            SpellDescription.objects.filter(pk=pk).update(position=position)
+        duplicates.extend(pk for pk, _ in rows[period:])
+
+    for start in range(0, len(duplicates), 500):
+        SpellDescription.objects.filter(pk__in=duplicates[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_seedfile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='spelldescription',
+            name='position',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.RunPython(number_descriptions, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='spelldescription',
+            name='position',
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AlterModelOptions(
+            name='spelldescription',
+            options={'ordering': ['spell', 'position']},
+        ),
+        migrations.AddConstraint(
+            model_name='spelldescription',
+            constraint=models.UniqueConstraint(fields=('spell', 'position'), name='unique_spell_description_position'),
+        ),
+    ]
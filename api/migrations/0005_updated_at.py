@@ -0,0 +1,93 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_dataversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='class',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='classproficiency',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='proficiency',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='proficiencyclass',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='proficiencyrace',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='race',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='racestartingproficiency',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='school',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='spell',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='spellclass',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='spelldescription',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='spellsubclass',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='subclass',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='subclassdescription',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='subrace',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='subracestartingproficiency',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, serialize=False),
+        ),
+    ]
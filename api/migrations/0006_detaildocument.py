@@ -0,0 +1,25 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DetailDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(max_length=50)),
+                ('object_id', models.BigIntegerField()),
+                ('body', models.BinaryField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('resource', 'object_id'), name='unique_detail_document')],
+            },
+        ),
+    ]
@@ -12,3 +12,6 @@ from .junction_tables import (
     SpellSubclass,
     ClassProficiency,
 )
+from .seeding import SeedFile
+from .versions import DataVersion
+from .documents import DetailDocument
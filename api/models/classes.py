@@ -1,8 +1,10 @@
 from django.db import models
 
+from .tracking import TrackedModel
+
 
 # Represents a class in the application, e.g., a character class in a game.
-class Class(models.Model):
+class Class(TrackedModel):
     # Unique identifier for the class, used as a reference.
     index = models.CharField(max_length=50, unique=True)
     # Represents the hit die of the class, typically used in role-playing contexts.
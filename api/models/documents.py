@@ -0,0 +1,20 @@
+from django.db import models
+
+
+# The JSON body of one detail response, rendered ahead of time and kept up to date on every write.
+class DetailDocument(models.Model):
+    # Router basename of the resource, e.g. "spell".
+    resource = models.CharField(max_length=50)
+    # Primary key of the object the document describes.
+    object_id = models.BigIntegerField()
+    # The encoded response body, with links rendered for `api.documents.DOCUMENT_ORIGIN`.
+    body = models.BinaryField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['resource', 'object_id'], name='unique_detail_document'),
+        ]
+
+    def __str__(self):
+        # Returns the resource and object id when represented as a string.
+        return f"{self.resource} {self.object_id}"
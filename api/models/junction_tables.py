@@ -1,4 +1,5 @@
 from django.db import models
+from .tracking import TrackedModel
 from .classes import Class
 from .proficiencies import Proficiency
 from .races import Race, Subrace
@@ -7,7 +8,7 @@ from .subclasses import Subclass
 
 
 # Junction table linking classes and proficiencies.
-class ClassProficiency(models.Model):
+class ClassProficiency(TrackedModel):
     # ForeignKey linking the class to its proficiencies.
     class_obj = models.ForeignKey('Class', on_delete=models.CASCADE, related_name='class_proficiencies')
     # ForeignKey linking the proficiency to its classes.
@@ -15,13 +16,13 @@ class ClassProficiency(models.Model):
 
 
 # Alternative junction table between classes and proficiencies, maintaining additional relationships.
-class ProficiencyClass(models.Model):
+class ProficiencyClass(TrackedModel):
     class_obj = models.ForeignKey(Class, on_delete=models.CASCADE, related_name='proficiency_classes')
     proficiency = models.ForeignKey(Proficiency, on_delete=models.CASCADE, related_name='proficiency_classes')
 
 
 # Represents proficiencies granted by a race or subrace.
-class ProficiencyRace(models.Model):
+class ProficiencyRace(TrackedModel):
     # ForeignKey linking the proficiency.
     proficiency = models.ForeignKey(Proficiency, on_delete=models.CASCADE, related_name="races_and_subraces")
     # ForeignKey for the race that grants the proficiency.
@@ -31,24 +32,24 @@ class ProficiencyRace(models.Model):
 
 
 # Starting proficiencies provided by a race at character creation.
-class RaceStartingProficiency(models.Model):
+class RaceStartingProficiency(TrackedModel):
     race = models.ForeignKey(Race, on_delete=models.CASCADE, related_name="starting_proficiencies")
     proficiency = models.ForeignKey(Proficiency, on_delete=models.CASCADE, related_name="starting_races")
 
 
 # Starting proficiencies provided by a subrace at character creation.
-class SubraceStartingProficiency(models.Model):
+class SubraceStartingProficiency(TrackedModel):
     subrace = models.ForeignKey(Subrace, on_delete=models.CASCADE, related_name="starting_proficiencies")
     proficiency = models.ForeignKey(Proficiency, on_delete=models.CASCADE, related_name="starting_subraces")
 
 
 # Links spells to the classes that can use them.
-class SpellClass(models.Model):
+class SpellClass(TrackedModel):
     spell = models.ForeignKey(Spell, on_delete=models.CASCADE, related_name="classes")
     class_obj = models.ForeignKey(Class, on_delete=models.CASCADE, related_name="spells")
 
 
 # Links spells to the subclasses that can use them.
-class SpellSubclass(models.Model):
+class SpellSubclass(TrackedModel):
     spell = models.ForeignKey(Spell, on_delete=models.CASCADE, related_name="subclasses")
     subclass = models.ForeignKey(Subclass, on_delete=models.CASCADE, related_name="spells")
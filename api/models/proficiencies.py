@@ -1,8 +1,10 @@
 from django.db import models
 
+from .tracking import TrackedModel
+
 
 # Represents a proficiency associated with a character, class, or other entity in the application.
-class Proficiency(models.Model):
+class Proficiency(TrackedModel):
     # Unique identifier for the proficiency, used as a reference in the system.
     index = models.CharField(max_length=50, unique=True)
     # Name of the proficiency, e.g., "Light Armor" or "Athletics".
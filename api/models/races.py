@@ -1,8 +1,10 @@
 from django.db import models
 
+from .tracking import TrackedModel
+
 
 # Represents a race in the application, such as a fantasy race like "Elf" or "Dwarf".
-class Race(models.Model):
+class Race(TrackedModel):
     # Unique identifier for the race, used as a reference in the system.
     index = models.CharField(max_length=50, unique=True)
     # Description of the typical age characteristics of the race, such as lifespan or age of maturity.
@@ -26,7 +28,7 @@ class Race(models.Model):
 
 
 # Represents a subrace associated with a parent race, such as "High Elf" for the "Elf" race.
-class Subrace(models.Model):
+class Subrace(TrackedModel):
     # Unique identifier for the subrace, used as a reference in the system.
     index = models.CharField(max_length=50, unique=True)
     # Detailed description of the subrace, such as unique traits or cultural information.
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+# Records the state of a csv_seed file the last time load_data applied it to the database.
+class SeedFile(models.Model):
+    # Name of the file inside the seed directory, e.g. "spells.csv".
+    name = models.CharField(max_length=100, unique=True)
+    # SHA-256 of the file contents, compared on every run to skip files that have not changed.
+    digest = models.CharField(max_length=64)
+    # Digest of each row keyed by its natural key (index slug or junction pair), used to diff the next version.
+    rows = models.JSONField(default=dict)
+    # When the file was last applied.
+    loaded_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        # Returns the file name when represented as a string.
+        return self.name
@@ -1,8 +1,10 @@
 from django.db import models
 
+from .tracking import TrackedModel
+
 
 # Represents a school of magic, such as "Evocation" or "Necromancy".
-class School(models.Model):
+class School(TrackedModel):
     # Unique identifier for the school, used as a reference in the system.
     index = models.CharField(max_length=50, unique=True)
     # Name of the school, e.g., "Evocation", "Transmutation".
@@ -14,7 +16,7 @@ class School(models.Model):
 
 
 # Represents a spell, which is a magical ability or effect.
-class Spell(models.Model):
+class Spell(TrackedModel):
     # Unique identifier for the spell, used as a reference in the system.
     index = models.CharField(max_length=50, unique=True)
     # Name of the spell, e.g., "Fireball", "Mage Hand".
@@ -44,11 +46,27 @@ class Spell(models.Model):
 
 
 # Represents detailed descriptions or effects of a spell.
-class SpellDescription(models.Model):
+class SpellDescription(TrackedModel):
     # ForeignKey linking the description to its associated spell. Uses CASCADE to delete descriptions if the spell is deleted.
     spell = models.ForeignKey(Spell, on_delete=models.CASCADE, related_name="descriptions")
     # Detailed textual description of the spell's effects or rules.
     value = models.TextField()
+    # Zero-based position of the paragraph within the spell's description.
+    position = models.PositiveIntegerField()
+
+    class Meta:
+        # Paragraphs are read back in order straight from the (spell, position) unique index.
+        ordering = ['spell', 'position']
+        constraints = [
+            models.UniqueConstraint(fields=['spell', 'position'], name='unique_spell_description_position'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Appends the paragraph after the spell's existing ones when no position is given.
+        if self.position is None:
+            last = SpellDescription.objects.filter(spell_id=self.spell_id).aggregate(models.Max('position'))
+            self.position = 0 if last['position__max'] is None else last['position__max'] + 1
+        super().save(*args, **kwargs)
 
     def __str__(self):
         # Returns a truncated version of the description for readability.
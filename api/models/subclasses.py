@@ -1,10 +1,11 @@
 from django.db import models
 
 from .classes import Class
+from .tracking import TrackedModel
 
 
 # Represents a subclass associated with a specific class.
-class Subclass(models.Model):
+class Subclass(TrackedModel):
     # Unique identifier for the subclass, used as a reference.
     index = models.CharField(max_length=50, unique=True)
     # ForeignKey linking the subclass to its parent class. Uses CASCADE to delete subclasses if the parent class is deleted.
@@ -20,7 +21,7 @@ class Subclass(models.Model):
 
 
 # Represents a detailed description for a specific subclass.
-class SubclassDescription(models.Model):
+class SubclassDescription(TrackedModel):
     # One-to-one relationship to a subclass, ensuring each subclass has at most one description.
     subclass = models.OneToOneField(Subclass, on_delete=models.CASCADE, related_name="description")
     # The actual description content, typically text-based.
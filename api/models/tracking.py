@@ -0,0 +1,12 @@
+from django.db import models
+
+
+# Base of the API's tables: stamps every row with the time it was last written, so the validators of a response
+# (ETag) can be read from the rows it is built from without rendering it.
+class TrackedModel(models.Model):
+    # Set on every save and every load_data upsert. Left out of serializers using `fields = '__all__'`
+    # (serialize=False), so response bodies do not change.
+    updated_at = models.DateTimeField(auto_now=True, db_index=True, serialize=False)
+
+    class Meta:
+        abstract = True
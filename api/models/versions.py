@@ -0,0 +1,13 @@
+from django.db import models
+
+
+# Counts the writes made to one model's table, so cached responses built from older data can be told apart.
+class DataVersion(models.Model):
+    # Label of the model, e.g. "api.spell".
+    model = models.CharField(max_length=100, unique=True)
+    # Incremented on every write through the API and on every load_data run that changes the table.
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        # Returns the model label and its version when represented as a string.
+        return f"{self.model} v{self.version}"
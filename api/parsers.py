@@ -0,0 +1,68 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from api.renderers import CBORRenderer, FastJSONRenderer, MessagePackRenderer, cbor2, msgpack, orjson
+
+
+class FastJSONParser(JSONParser):
+    """
+    Parses JSON request bodies with orjson when it is installed. orjson only reads UTF-8 and rejects NaN and
+    Infinity, as DRF does under the default `STRICT_JSON`; other encodings and settings go through `JSONParser`.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as JSON and returns the resulting data.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses MessagePack request bodies.
+    """
+    media_type = 'application/msgpack'
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as MessagePack and returns the resulting data.
+        """
+        try:
+            return msgpack.unpackb(stream.read())
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError('MessagePack parse error - %s' % str(exc))
+
+
+class CBORParser(BaseParser):
+    """
+    Parses CBOR request bodies.
+    """
+    media_type = 'application/cbor'
+    renderer_class = CBORRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as CBOR and returns the resulting data.
+        """
+        try:
+            return cbor2.loads(stream.read())
+        except cbor2.CBORDecodeError as exc:
+            raise ParseError('CBOR parse error - %s' % str(exc))
+
+
+# Binary parsers whose library is installed, accepted alongside JSON by the API viewsets.
+BINARY_PARSERS = [
+    parser for parser, library in ((MessagePackParser, msgpack), (CBORParser, cbor2)) if library is not None
+]
@@ -0,0 +1,160 @@
+import csv
+import io
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; without it every response goes through DRF's stdlib encoder.
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency; without it MessagePack is not offered.
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # Optional dependency; without it CBOR is not offered.
+    cbor2 = None
+
+if orjson is not None:
+    # Types orjson would format differently from DRF are handed to DRF's encoder through `default`.
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+# Line and paragraph separators, which DRF escapes so the output is also valid JavaScript.
+JS_UNSAFE = (('\u2028'.encode(), b'\\u2028'), ('\u2029'.encode(), b'\\u2029'))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Renders JSON with orjson when it is installed, producing the same bytes as DRF's `JSONRenderer`. The
+    exception is floats, some of which orjson formats differently (`1e16`, NaN as null); no model has any.
+
+    Indented output (browsable API, `; indent=` in the Accept header), non-default `UNICODE_JSON` or
+    `COMPACT_JSON` settings, and data orjson cannot encode, such as integers beyond 64 bits, are rendered
+    by `JSONRenderer` itself.
+    """
+    default = staticmethod(encoders.JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if orjson is None or data is None or self.ensure_ascii or not self.compact \
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        for character, escaped in JS_UNSAFE:
+            if character in ret:
+                ret = ret.replace(character, escaped)
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders MessagePack. Values JSON has no type for (dates, decimals, lazy strings) are converted as
+    `JSONRenderer` converts them, so decoding either format gives the same data.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    default = staticmethod(encoders.JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into MessagePack, returning a bytestring.
+        """
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=self.default)
+
+
+class CBORRenderer(BaseRenderer):
+    """
+    Renders CBOR. Dates and decimals use CBOR's own tags; other values JSON has no type for are converted
+    as `JSONRenderer` converts them.
+    """
+    media_type = 'application/cbor'
+    format = 'cbor'
+    charset = None
+    render_style = 'binary'
+    default = staticmethod(encoders.JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into CBOR, returning a bytestring.
+        """
+        if data is None:
+            return b''
+        return cbor2.dumps(data, default=lambda encoder, value: encoder.encode(self.default(value)))
+
+
+# Binary renderers whose library is installed, offered alongside JSON by the API viewsets.
+BINARY_RENDERERS = [
+    renderer for renderer, library in ((MessagePackRenderer, msgpack), (CBORRenderer, cbor2)) if library is not None
+]
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renders newline-delimited JSON: one object per line. `stream` writes table rows as they are read;
+    `render` writes a single object, which is how error responses reach the client.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+    json_renderer = FastJSONRenderer()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` as a single line of JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+        return self.json_renderer.render(data) + b'\n'
+
+    def stream(self, columns, chunks):
+        """
+        Yields the lines for each chunk in `chunks`, a list of tuples of values for `columns`.
+        """
+        for chunk in chunks:
+            yield b''.join(self.json_renderer.render(dict(zip(columns, row))) + b'\n' for row in chunk)
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Renders CSV the way the `csv` module writes the seed files: a header row, `\\r\\n` line endings, None as
+    an empty field and booleans as `True`/`False`.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render a single object (such as an error response) as a header row and one data row.
+        """
+        if data is None:
+            return b''
+        return b''.join(self.stream(list(data), [[list(data.values())]]))
+
+    def stream(self, columns, chunks):
+        """
+        Yields the header row followed by each chunk in `chunks`, a list of tuples of values for `columns`.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode(self.charset)
@@ -0,0 +1,107 @@
+import hashlib
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models
+
+from api.models import DataVersion
+
+# Keys of the hit and miss counters in the cache backend.
+HITS_KEY = 'response-cache:hits'
+MISSES_KEY = 'response-cache:misses'
+
+
+def response_cache():
+    """
+    Returns the cache backend holding rendered responses (`RESPONSE_CACHE_ALIAS` in `CACHES`).
+    """
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+@lru_cache(maxsize=None)
+def cascade_models(model):
+    """
+    Returns `model` and every model whose rows are deleted with its rows, following CASCADE foreign keys
+    transitively. A write to `model` may change the rows of all of them.
+    """
+    found = {model}
+    pending = [model]
+    while pending:
+        target = pending.pop()
+        for relation in target._meta.related_objects:
+            if relation.on_delete is models.CASCADE and relation.related_model not in found:
+                found.add(relation.related_model)
+                pending.append(relation.related_model)
+    return frozenset(found)
+
+
+@lru_cache(maxsize=None)
+def lookup_models(model, lookups):
+    """
+    Returns `model` and every model crossed by `lookups` (Django `__` paths), which is what a response
+    rendering those relations is built from.
+    """
+    found = {model}
+    for lookup in lookups:
+        target = model
+        for part in lookup.split('__'):
+            target = target._meta.get_field(part).related_model
+            found.add(target)
+    return frozenset(found)
+
+
+def bump_versions(*written):
+    """
+    Marks the given models, and every model their deletions cascade to, as changed.
+    """
+    labels = sorted({m._meta.label_lower for model in written for m in cascade_models(model)})
+    DataVersion.objects.bulk_create([DataVersion(model=label) for label in labels], ignore_conflicts=True)
+    DataVersion.objects.filter(model__in=labels).update(version=models.F('version') + 1)
+
+
+def bump_all_versions():
+    """
+    Marks every model of the API app as changed.
+    """
+    bump_versions(*apps.get_app_config('api').get_models())
+
+
+def data_versions(dependencies):
+    """
+    Returns the current versions of `dependencies` as a sorted tuple of (label, version) pairs.
+    """
+    labels = {model._meta.label_lower for model in dependencies}
+    versions = dict(DataVersion.objects.filter(model__in=labels).values_list('model', 'version'))
+    return tuple((label, versions.get(label, 0)) for label in sorted(labels))
+
+
+def response_key(url, media_type, versions):
+    """
+    Returns the cache key of a response: its absolute URL (query string included), the negotiated media type
+    and the data versions it was built from, hashed to fit any backend's key length limit.
+    """
+    digest = hashlib.blake2b(repr((url, media_type, versions)).encode(), digest_size=20).hexdigest()
+    return f'response:{digest}'
+
+
+def count(key):
+    """
+    Increments one of the hit/miss counters kept in the cache backend.
+    """
+    cache = response_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def cache_stats():
+    """
+    Returns the hits and misses counted by the response cache. With a shared backend (file, Redis) the counts
+    cover every process; with the default local-memory backend, only the current one.
+    """
+    counts = response_cache().get_many([HITS_KEY, MISSES_KEY])
+    return {'hits': counts.get(HITS_KEY, 0), 'misses': counts.get(MISSES_KEY, 0)}
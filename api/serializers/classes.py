@@ -1,6 +1,6 @@
-from django.urls import reverse
 from rest_framework import serializers
 from api.models import Class, ClassProficiency, Proficiency, SpellClass
+from api.serializers.links import detail_url
 
 
 # Serializer for linking spells to their associated classes.
@@ -18,8 +18,7 @@ class ClassSpellSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the related spell detail view.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('spell-detail', args=[obj.spell.id]))
+        return detail_url(self.context, 'spell-detail', obj.spell_id)
 
 
 # Serializer for linking proficiencies to their associated classes.
@@ -37,8 +36,7 @@ class ClassProficiencySerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the related proficiency detail view.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('proficiency-detail', args=[obj.proficiency.id]))
+        return detail_url(self.context, 'proficiency-detail', obj.proficiency_id)
 
 
 # Serializer for listing class information with links to detailed views.
@@ -54,8 +52,7 @@ class ClassListSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the class detail view.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('class-detail', args=[obj.id]))
+        return detail_url(self.context, 'class-detail', obj.id)
 
 
 # Serializer for handling class input, including associated proficiencies.
@@ -113,18 +110,16 @@ class ClassDetailSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the class detail view.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('class-detail', args=[obj.id]))
+        return detail_url(self.context, 'class-detail', obj.id)
 
     def get_subclasses(self, obj):
         """
         Constructs and returns a list of simplified subclass representations,
         including their URLs, IDs, and names.
         """
-        request = self.context.get('request')
         return [
             {
-                "url": request.build_absolute_uri(reverse('subclass-detail', args=[subclass.id])),
+                "url": detail_url(self.context, 'subclass-detail', subclass.id),
                 "id": subclass.id,
                 "name": subclass.name,
             }
@@ -0,0 +1,174 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db.models.manager import BaseManager
+from rest_framework import fields, serializers
+from rest_framework.fields import empty
+from rest_framework.relations import PrimaryKeyRelatedField, RelatedField
+
+# Scalar fields whose value is copied as-is when it already has the output type, converted otherwise.
+INLINE_TYPES = {fields.CharField: 'str', fields.IntegerField: 'int'}
+
+# Other scalar fields whose `to_representation` depends only on the value; it is called directly.
+SCALAR_FIELDS = (fields.BooleanField, fields.FloatField)
+
+# `get_attribute` implementations the generated attribute reads reproduce.
+DEFAULT_GET_ATTRIBUTE = (fields.Field.get_attribute, RelatedField.get_attribute)
+
+
+class Unsupported(Exception):
+    """
+    Raised while compiling when a serializer uses something the compiler cannot reproduce exactly.
+    """
+
+
+class SerializerCompiler:
+    """
+    Generates the source of one function per serializer in a tree of nested read serializers.
+
+    Each function takes a model instance and the list of bound method-field callables and returns the
+    same dict as the serializer's `to_representation`: field sources become direct attribute reads,
+    `many=True` serializers become list comprehensions, and None and missing-object handling follow DRF.
+    """
+
+    def __init__(self):
+        self.functions = {}
+        self.blocks = []
+        self.namespace = {'ObjectDoesNotExist': ObjectDoesNotExist, 'BaseManager': BaseManager}
+        # (serializer class, method name) of every SerializerMethodField, in the order of the env list.
+        self.methods = []
+
+    def compile(self, serializer):
+        """
+        Generates the function rendering `serializer` (and those it nests) and returns its name.
+        """
+        serializer_class = type(serializer)
+        if serializer_class in self.functions:
+            return self.functions[serializer_class]
+        if serializer_class.to_representation is not serializers.Serializer.to_representation:
+            raise Unsupported(f"{serializer_class.__name__} overrides to_representation")
+        name = f'render_{serializer_class.__name__}'
+        self.functions[serializer_class] = name
+
+        model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+        lines = [f'def {name}(obj, env):', '    r = {}']
+        for field in serializer._readable_fields:
+            lines += ['    ' + line for line in self.field_lines(field, model)]
+        lines.append('    return r')
+        self.blocks.append('\n'.join(lines))
+        return name
+
+    def build(self, serializer):
+        """
+        Compiles `serializer` and returns its render function and the method fields it calls.
+        """
+        name = self.compile(serializer)
+        exec(compile('\n\n'.join(self.blocks), f'<compiled {type(serializer).__name__}>', 'exec'), self.namespace)
+        return self.namespace[name], list(self.methods)
+
+    def constant(self, value):
+        name = f'c{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def field_lines(self, field, model):
+        key = repr(field.field_name)
+
+        if isinstance(field, serializers.SerializerMethodField):
+            method = (type(field.parent), field.method_name)
+            if method not in self.methods:
+                self.methods.append(method)
+            return [f'r[{key}] = env[{self.methods.index(method)}](obj)']
+
+        if type(field).get_attribute not in DEFAULT_GET_ATTRIBUTE:
+            raise Unsupported(f"{field.field_name} overrides get_attribute")
+
+        if isinstance(field, PrimaryKeyRelatedField):
+            model_field = model_field_named(model, field.source_attrs[0]) if len(field.source_attrs) == 1 else None
+            if not (field.use_pk_only_optimization() and field.pk_field is None and model_field is not None
+                    and model_field.is_relation and model_field.concrete):
+                raise Unsupported(f"{field.field_name} is not a plain foreign key")
+            return [f'r[{key}] = obj.{model_field.attname}']
+
+        if isinstance(field, serializers.ListSerializer):
+            if type(field) is not serializers.ListSerializer or not isinstance(field.child, serializers.Serializer):
+                raise Unsupported(f"{field.field_name} is a custom list serializer")
+            value = (f'None if v is None else [{self.compile(field.child)}(i, env) for i in '
+                     f'(v.all() if isinstance(v, BaseManager) else v)]')
+        elif isinstance(field, serializers.Serializer):
+            value = f'None if v is None else {self.compile(field)}(v, env)'
+        elif type(field) in INLINE_TYPES:
+            kind = INLINE_TYPES[type(field)]
+            value = f'v if v is None or v.__class__ is {kind} else {kind}(v)'
+        elif type(field) in SCALAR_FIELDS:
+            value = f'None if v is None else {self.constant(field.to_representation)}(v)'
+        else:
+            raise Unsupported(f"{field.field_name} is a {type(field).__name__}")
+
+        return self.read_lines(field, model, key, f'r[{key}] = {value}')
+
+    def read_lines(self, field, model, key, assignment):
+        """
+        Reads the field's source into `v` and runs `assignment`, which maps None to None; when the source
+        cannot be read, sets `key` to None or leaves it out as DRF would.
+        """
+        # Every hop must be a model field, so none of them is a callable DRF would call.
+        current = model
+        for attr in field.source_attrs:
+            model_field = model_field_named(current, attr)
+            if model_field is None:
+                raise Unsupported(f"{field.field_name} reads {attr!r}, which is not a model field")
+            current = model_field.related_model
+        chain = 'obj.' + '.'.join(field.source_attrs)
+
+        if len(field.source_attrs) == 1 and not model_field.is_relation:
+            # A local column is always there.
+            return [f'v = {chain}', assignment]
+
+        if field.default is not empty:
+            raise Unsupported(f"{field.field_name} has a default")
+        # A missing related object renders as None; a path DRF cannot follow, e.g. through a null foreign
+        # key, is handled the way `Field.get_attribute` handles it.
+        if field.allow_null:
+            missing = f'r[{key}] = None'
+        elif field.required:
+            missing = 'raise'
+        else:
+            # An optional field whose source cannot be read is left out of the output.
+            missing = 'pass'
+        return ['try:', f'    v = {chain}', 'except ObjectDoesNotExist:', f'    r[{key}] = None',
+                'except (KeyError, AttributeError):', f'    {missing}', 'else:', '    ' + assignment]
+
+
+def model_field_named(model, name):
+    if model is None:
+        return None
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+@lru_cache(maxsize=None)
+def compiled_renderer(serializer_class):
+    """
+    Returns a function `render(instance, context)` producing the same data as
+    `serializer_class(instance, context=context).data`, or None if the serializer cannot be compiled.
+
+    Method fields are called on one serializer instance per class per render, sharing `context`.
+    """
+    try:
+        render, methods = SerializerCompiler().build(serializer_class())
+    except Unsupported:
+        return None
+
+    def render_with_context(instance, context):
+        instances = {}
+        env = []
+        for owner, method_name in methods:
+            if owner not in instances:
+                instances[owner] = owner(context=context)
+            env.append(getattr(instances[owner], method_name))
+        return render(instance, env)
+
+    return render_with_context
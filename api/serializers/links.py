@@ -0,0 +1,56 @@
+from functools import lru_cache
+
+from django.urls import get_script_prefix, reverse
+
+# Stand-in primary key reversed once per route; it matches the router's `[^/.]+` lookup pattern.
+PK_MARKER = '0pk0'
+
+
+@lru_cache(maxsize=None)
+def route_template(view_name, script_prefix):
+    """
+    Resolves a detail route once into a %-format path template, e.g. '/api/spells/%s/'.
+    """
+    path = reverse(view_name, args=[PK_MARKER])
+    return path.replace('%', '%%').replace(PK_MARKER, '%s')
+
+
+class LinkBuilder:
+    """
+    Builds absolute links to detail views for one request. The scheme and host are computed once, and
+    each link is a string format of a cached route template instead of a URL resolver call.
+    """
+
+    def __init__(self, request):
+        self.origin = request.build_absolute_uri('/')[:-1]
+        self.script_prefix = get_script_prefix()
+
+    def detail(self, view_name, pk):
+        """
+        Returns the same URL as `request.build_absolute_uri(reverse(view_name, args=[pk]))`.
+        """
+        return self.origin + route_template(view_name, self.script_prefix) % pk
+
+    def detail_template(self, view_name):
+        """
+        Returns the absolute %-format template of a detail route, for callers formatting many links at once.
+        """
+        return self.origin + route_template(view_name, self.script_prefix)
+
+
+def link_builder(context):
+    """
+    Returns the LinkBuilder shared by every serializer rendering with `context`, creating it on first use.
+    Nested serializers read their root's context, so one builder serves a whole response.
+    """
+    builder = context.get('link_builder')
+    if builder is None:
+        builder = context['link_builder'] = LinkBuilder(context['request'])
+    return builder
+
+
+def detail_url(context, view_name, pk):
+    """
+    Returns the absolute URL of the `view_name` detail route for `pk`.
+    """
+    return link_builder(context).detail(view_name, pk)
@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from django.urls import reverse
 from api.models import Proficiency, ProficiencyClass, ProficiencyRace, Class
+from api.serializers.links import detail_url
 
 
 # Serializer for detailed information about a Proficiency (read-only).
@@ -17,19 +17,17 @@ class ProficiencyDetailSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the proficiency detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('proficiency-detail', args=[obj.id]))
+        return detail_url(self.context, 'proficiency-detail', obj.id)
 
     def get_proficiency_classes(self, obj):
         """
         Retrieves all classes associated with this proficiency, including their names and detail URLs.
         """
-        request = self.context.get('request')
-        classes = ProficiencyClass.objects.filter(proficiency=obj)
+        classes = obj.proficiency_classes.all()  # Uses the rows prefetched by the viewset when available.
         return [
             {
                 'class_name': c.class_obj.name,
-                'class_url': request.build_absolute_uri(reverse('class-detail', args=[c.class_obj.id])),
+                'class_url': detail_url(self.context, 'class-detail', c.class_obj_id),
             }
             for c in classes
         ]
@@ -39,16 +37,14 @@ class ProficiencyDetailSerializer(serializers.ModelSerializer):
         Retrieves all races and subraces associated with this proficiency.
         Provides names and clickable URLs for detailed views.
         """
-        request = self.context.get('request')
         races = obj.races_and_subraces.all()  # Leverages the related_name defined in the ProficiencyRace model.
         return [
             {
                 'race_name': r.race.name if r.race else "Unknown",
                 'subrace_name': r.subrace.name if r.subrace else "None",
-                'race_detail_url': request.build_absolute_uri(
-                    reverse('race-detail', args=[r.race.id])) if r.race else None,
-                'subrace_detail_url': request.build_absolute_uri(
-                    reverse('subrace-detail', args=[r.subrace.id])) if r.subrace else None,
+                'race_detail_url': detail_url(self.context, 'race-detail', r.race_id) if r.race else None,
+                # Subraces have no endpoint of their own; they are listed on their parent race's detail view.
+                'subrace_detail_url': detail_url(self.context, 'race-detail', r.subrace.race_id) if r.subrace else None,
             }
             for r in races
         ]
@@ -66,8 +62,7 @@ class ProficiencyListSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the proficiency detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('proficiency-detail', args=[obj.id]))
+        return detail_url(self.context, 'proficiency-detail', obj.id)
 
 
 # Serializer for input operations on Proficiency, supporting relational data.
@@ -126,8 +121,7 @@ class ProficiencyClassSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the class detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('class-detail', args=[obj.class_obj.id]))
+        return detail_url(self.context, 'class-detail', obj.class_obj_id)
 
 
 # Serializer for associating a proficiency with a race and subrace.
@@ -153,5 +147,4 @@ class ProficiencySerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the proficiency detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('proficiency-detail', args=[obj.id]))
+        return detail_url(self.context, 'proficiency-detail', obj.id)
@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from django.urls import reverse
 from api.models import Race, Subrace, RaceStartingProficiency
+from api.serializers.links import detail_url
 
 
 # Serializer for listing races with basic details.
@@ -15,8 +15,7 @@ class RaceListSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the race detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('race-detail', args=[obj.id]))
+        return detail_url(self.context, 'race-detail', obj.id)
 
 
 # Serializer for displaying detailed information about subraces.
@@ -40,8 +39,7 @@ class RaceStartingProficiencySerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the proficiency detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('proficiency-detail', args=[obj.proficiency.id]))
+        return detail_url(self.context, 'proficiency-detail', obj.proficiency_id)
 
 
 # Serializer for creating and updating races.
@@ -66,5 +64,4 @@ class RaceDetailSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the race detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('race-detail', args=[obj.id]))
+        return detail_url(self.context, 'race-detail', obj.id)
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from api.models import School, Spell
-from django.urls import reverse
+from api.serializers.links import detail_url
 
 
 # Serializer to list spells associated with a school.
@@ -17,8 +17,7 @@ class SpellListForSchoolSerializer(serializers.ModelSerializer):
         Returns the absolute URL for the spell detail endpoint.
         This method dynamically generates the URL based on the spell's ID.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('spell-detail', args=[obj.id]))
+        return detail_url(self.context, 'spell-detail', obj.id)
 
 
 # Serializer to display a list of schools with basic details (read-only).
@@ -35,8 +34,7 @@ class SchoolListSerializer(serializers.ModelSerializer):
         Returns the absolute URL for the school detail endpoint.
         This method dynamically generates the URL based on the school's ID.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('school-detail', args=[obj.id]))
+        return detail_url(self.context, 'school-detail', obj.id)
 
 
 # Serializer for creating and updating schools (input serializer).
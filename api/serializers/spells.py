@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from django.urls import reverse
 from api.models import Spell, SpellDescription, SpellClass, SpellSubclass
+from api.serializers.links import detail_url
 
 
 # Serializer for listing spells with minimal details.
@@ -15,8 +15,7 @@ class SpellListSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the spell detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('spell-detail', args=[obj.id]))
+        return detail_url(self.context, 'spell-detail', obj.id)
 
 
 # Serializer for displaying detailed descriptions associated with spells.
@@ -39,8 +38,7 @@ class SpellClassSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the class detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('class-detail', args=[obj.class_obj.id]))
+        return detail_url(self.context, 'class-detail', obj.class_obj_id)
 
 
 # Serializer for associating a spell with a subclass.
@@ -56,8 +54,7 @@ class SpellSubclassSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the subclass detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('subclass-detail', args=[obj.subclass.id]))
+        return detail_url(self.context, 'subclass-detail', obj.subclass_id)
 
 
 # Serializer for creating and updating spells.
@@ -87,5 +84,4 @@ class SpellDetailSerializer(serializers.ModelSerializer):
         """
         Constructs and returns the absolute URL for the spell detail endpoint.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('spell-detail', args=[obj.id]))
+        return detail_url(self.context, 'spell-detail', obj.id)
@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from django.urls import reverse
 from api.models import Subclass, SubclassDescription, Class
+from api.serializers.links import detail_url
 
 
 # Serializer for listing subclasses with basic information.
@@ -16,8 +16,7 @@ class SubclassListSerializer(serializers.ModelSerializer):
         Constructs and returns the absolute URL for the subclass detail endpoint.
         This ensures dynamic linking to detailed views of subclasses.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('subclass-detail', args=[obj.id]))
+        return detail_url(self.context, 'subclass-detail', obj.id)
 
 
 # Serializer for displaying the description associated with a subclass.
@@ -52,14 +51,14 @@ class SubclassDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Subclass
         fields = '__all__'  # Exposes all fields, including nested relationships and custom fields.
+        method_field_sources = {'class_info': ['class_obj']}  # Relations read by method fields, for sparse fieldsets.
 
     def get_detail_url(self, obj):
         """
         Constructs and returns the absolute URL for the subclass detail endpoint.
         This provides dynamic linking to detailed views of subclasses.
         """
-        request = self.context.get('request')
-        return request.build_absolute_uri(reverse('subclass-detail', args=[obj.id]))
+        return detail_url(self.context, 'subclass-detail', obj.id)
 
     def get_class_info(self, obj):
         """
@@ -73,10 +72,8 @@ class SubclassDetailSerializer(serializers.ModelSerializer):
         """
         if obj.class_obj:  # Check if the subclass is linked to a parent class.
             return {
-                'id': obj.class_obj.id,
+                'id': obj.class_obj_id,
                 'name': obj.class_obj.name,
-                'detail_url': self.context['request'].build_absolute_uri(
-                    reverse('class-detail', args=[obj.class_obj.id])
-                ),
+                'detail_url': detail_url(self.context, 'class-detail', obj.class_obj_id),
             }
         return None  # Return None if no parent class is associated.
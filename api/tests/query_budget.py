@@ -0,0 +1,82 @@
+"""
+Helpers for measuring how many SQL queries, and how much SQL time, each API endpoint costs.
+"""
+import time
+
+from django.db import connection, transaction
+from django.db.models import Count
+
+
+def measure(client, method, url, data=None):
+    """
+    Sends one request and returns the response, the number of queries it ran and their total time in seconds.
+    Write requests run inside a savepoint that is rolled back afterwards, so every endpoint sees the same data.
+    """
+    stats = {'queries': 0, 'seconds': 0.0}
+
+    def time_query(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            stats['queries'] += 1
+            stats['seconds'] += time.perf_counter() - started
+
+    with transaction.atomic():
+        with connection.execute_wrapper(time_query):
+            if data is None:
+                response = getattr(client, method)(url)
+            else:
+                response = getattr(client, method)(url, data, format='json')
+        transaction.set_rollback(True)
+    return response, stats['queries'], stats['seconds']
+
+
+def related_extremes(queryset, lookups):
+    """
+    Returns the primary keys of the objects with the fewest and the most rows in the many-valued relations
+    among `lookups`, so an endpoint can be measured on both ends of its fan-out.
+    """
+    counted = set()
+    for lookup in lookups:
+        name = lookup.split('__')[0]
+        field = queryset.model._meta.get_field(name)
+        if field.one_to_many or field.many_to_many:
+            counted.add(name)
+    if not counted:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:1])
+        return pks + list(queryset.order_by('-pk').values_list('pk', flat=True)[:1])
+
+    annotated = queryset.annotate(**{f'{name}_rows': Count(name, distinct=True) for name in counted})
+    order = [f'{name}_rows' for name in sorted(counted)]
+    fewest = annotated.order_by(*order, 'pk').values_list('pk', flat=True).first()
+    most = annotated.order_by(*[f'-{column}' for column in order], 'pk').values_list('pk', flat=True).first()
+    return [fewest, most]
+
+
+class BudgetReport:
+    """
+    Collects the highest query count and SQL time seen per endpoint and data scale.
+    """
+
+    def __init__(self):
+        self.results = {}
+
+    def record(self, endpoint, scale, queries, seconds):
+        queries_seen, seconds_seen = self.results.setdefault(endpoint, {}).get(scale, (0, 0.0))
+        self.results[endpoint][scale] = (max(queries_seen, queries), max(seconds_seen, seconds))
+
+    def queries(self, endpoint, scale):
+        return self.results[endpoint][scale][0]
+
+    def format_table(self, scales):
+        """
+        Renders the results as a Markdown table, one row per endpoint.
+        """
+        headers = ['endpoint'] + [f'queries {scale}x' for scale in scales] + [f'SQL ms {scale}x' for scale in scales]
+        lines = ['| ' + ' | '.join(headers) + ' |', '|' + '|'.join(['---'] + ['---:'] * (len(headers) - 1)) + '|']
+        for endpoint, by_scale in self.results.items():
+            counts = [str(by_scale[scale][0]) if scale in by_scale else '-' for scale in scales]
+            times = [f'{by_scale[scale][1] * 1000:.2f}' if scale in by_scale else '-' for scale in scales]
+            lines.append('| ' + ' | '.join([endpoint] + counts + times) + ' |')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,43 @@
+"""
+Helpers walking every registered resource, and comparing responses with a setting enabled and disabled.
+"""
+from django.test import override_settings
+
+from api.urls import router
+
+
+def resource_urls():
+    """
+    Returns (basename, viewset, list URL, detail URL) for every registered resource, the detail URL being
+    that of its object with the lowest id.
+    """
+    urls = []
+    for prefix, viewset, basename in router.registry:
+        pk = viewset.queryset.model.objects.order_by('pk').values_list('pk', flat=True).first()
+        urls.append((basename, viewset, f'/api/{prefix}/', f'/api/{prefix}/{pk}/'))
+    return urls
+
+
+class SameResponseMixin:
+    """
+    For test cases of settings that change how responses are made but never what they contain.
+    """
+
+    def assertSameResponse(self, url, setting, queries=None, status_code=200, **extra):
+        """
+        Requests `url` as the test case is set up (in exactly `queries` queries when given), then with
+        `setting` disabled, and checks that the status, Content-Type and body are the same. Returns the first
+        response.
+        """
+        if queries is None:
+            response = self.client.get(url, **extra)
+        else:
+            with self.assertNumQueries(queries):
+                response = self.client.get(url, **extra)
+        with override_settings(**{setting: False}):
+            expected = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, status_code, response.content[:500])
+        self.assertEqual(expected.status_code, status_code)
+        self.assertEqual(response['Content-Type'], expected['Content-Type'])
+        self.assertEqual(response.content, expected.content)
+        return response
@@ -0,0 +1,66 @@
+import io
+import json
+from contextlib import redirect_stdout
+from unittest import skipUnless
+
+from django.core.management import call_command
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APITestCase
+
+from api.models import Class, School
+from api.parsers import CBORParser, MessagePackParser
+from api.renderers import cbor2, msgpack
+
+# Media type, decoder and encoder of each binary format whose library is installed.
+FORMATS = {
+    name: formats for name, formats in [
+        ('msgpack', msgpack and ('application/msgpack', msgpack.unpackb, msgpack.packb)),
+        ('cbor', cbor2 and ('application/cbor', cbor2.loads, cbor2.dumps)),
+    ] if formats
+}
+
+
+@skipUnless(FORMATS, "neither msgpack nor cbor2 is installed")
+class BinaryFormatTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def test_responses_decode_to_the_json_data(self):
+        wizard = Class.objects.get(index='wizard')
+        for url in ['/api/classes/', f'/api/classes/{wizard.pk}/', '/api/spells/', '/api/schools/1/']:
+            expected = self.client.get(url)
+            self.assertEqual(expected['Content-Type'], 'application/json')
+            for name, (media_type, decode, _) in FORMATS.items():
+                with self.subTest(url=url, format=name):
+                    response = self.client.get(url, HTTP_ACCEPT=media_type)
+                    self.assertEqual(response['Content-Type'], media_type)
+                    self.assertEqual(decode(response.content), json.loads(expected.content))
+                    self.assertLess(len(response.content), len(expected.content))
+
+    def test_format_query_parameter(self):
+        for name, (media_type, _, _) in FORMATS.items():
+            with self.subTest(format=name):
+                self.assertEqual(self.client.get(f'/api/races/?format={name}')['Content-Type'], media_type)
+
+    def test_request_bodies(self):
+        for name, (media_type, decode, encode) in FORMATS.items():
+            with self.subTest(format=name):
+                body = encode({'index': f'{name}-school', 'name': 'Binary'})
+                response = self.client.post('/api/schools/', body, content_type=media_type, HTTP_ACCEPT=media_type)
+                self.assertEqual(response.status_code, 201, response.content)
+                school = School.objects.get(index=f'{name}-school')
+                self.assertEqual(decode(response.content)['name'], 'Binary')
+
+                response = self.client.patch(f'/api/schools/{school.pk}/', encode({'name': 'Renamed'}),
+                                             content_type=media_type)
+                self.assertEqual(response.status_code, 200, response.content)
+                school.refresh_from_db()
+                self.assertEqual(school.name, 'Renamed')
+
+    def test_malformed_bodies_are_rejected(self):
+        for parser, name in [(MessagePackParser, 'msgpack'), (CBORParser, 'cbor')]:
+            if name in FORMATS:
+                with self.subTest(format=name), self.assertRaises(ParseError):
+                    parser().parse(io.BytesIO(FORMATS[name][2]({'a': 1})[:-1]))
@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api.catalog import get_catalog, mark_stale
+from api.catalog_file import MappedCatalog
+from api.models import Class, Spell, SpellDescription
+from api.tests.resources import SameResponseMixin, resource_urls
+
+DIRECTORY = tempfile.mkdtemp()
+STAMP = os.path.join(DIRECTORY, 'catalog.stamp')
+
+
+@override_settings(CATALOG_READS=True, CATALOG_STAMP=STAMP)
+class CatalogTests(SameResponseMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def setUp(self):
+        # Each test's writes are rolled back, so the catalog is rebuilt from the loaded data every time.
+        mark_stale()
+        get_catalog()
+
+    def test_responses_match_the_database_without_queries(self):
+        for _, _, list_url, detail_url in resource_urls():
+            for url in [list_url, detail_url, f'{list_url}?fields=id,name']:
+                with self.subTest(url=url):
+                    self.assertSameResponse(url, 'CATALOG_READS', queries=0)
+
+    def test_missing_objects_are_not_found_like_the_database(self):
+        self.assertSameResponse('/api/spells/0/', 'CATALOG_READS', status_code=404)
+
+    def test_includes_are_read_from_the_database(self):
+        wizard = Class.objects.get(index='wizard')
+        self.assertSameResponse(f'/api/classes/{wizard.pk}/?include=spells', 'CATALOG_READS', queries=5)
+
+    def test_writes_rebuild_the_catalog(self):
+        fireball = Spell.objects.get(index='fireball')
+        wizard = Class.objects.get(index='wizard')
+        before = get_catalog()
+        self.client.patch(f'/api/spells/{fireball.pk}/', {'name': 'Big Fireball'}, format='json')
+
+        self.assertIsNot(get_catalog(), before)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(f'/api/spells/{fireball.pk}/').json()['name'], 'Big Fireball')
+            self.assertIn('Big Fireball', self.client.get(f'/api/classes/{wizard.pk}/').content.decode())
+
+    def test_stamp_change_rebuilds_the_catalog(self):
+        catalog = get_catalog()
+        self.assertIs(get_catalog(), catalog)
+        Spell.objects.filter(index='fireball').update(name='Big Fireball')
+        mark_stale()
+
+        rebuilt = get_catalog()
+        self.assertIsNot(rebuilt, catalog)
+        self.assertEqual(rebuilt.get(Spell, Spell.objects.get(index='fireball').pk).name, 'Big Fireball')
+        self.assertEqual(rebuilt.rows, catalog.rows)
+        self.assertGreater(rebuilt.memory, 0)
+
+    def test_rows_are_found_by_index(self):
+        catalog = get_catalog()
+        self.assertEqual(catalog.find(Spell, 'fireball').pk, Spell.objects.get(index='fireball').pk)
+        self.assertIsNone(catalog.find(Spell, 'no-such-spell'))
+
+    def test_columns_are_read_in_default_ordering(self):
+        columns = ['spell_id', 'position', 'value']
+        self.assertEqual(get_catalog().values(SpellDescription, columns),
+                         list(SpellDescription.objects.values_list(*columns)))
+
+
+@override_settings(CATALOG_FILE=os.path.join(DIRECTORY, 'catalog.bin'))
+class MappedCatalogTests(CatalogTests):
+    def test_writes_publish_a_new_file(self):
+        catalog = get_catalog()
+        self.assertIsInstance(catalog, MappedCatalog)
+        fireball = Spell.objects.get(index='fireball')
+        self.client.patch(f'/api/spells/{fireball.pk}/', {'material': None}, format='json')
+
+        published = get_catalog()
+        self.assertNotEqual(published.stamp, catalog.stamp)
+        self.assertIsNone(published.get(Spell, fireball.pk).material)
+        # The previous file stays mapped and readable for whoever still holds it.
+        self.assertIsNotNone(catalog.get(Spell, fireball.pk).material)
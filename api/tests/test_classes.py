@@ -37,6 +37,10 @@ class ClassEndpointTests(APITestCase):
         self.assertEqual(len(response.data["class_proficiencies"]), 2)
         self.assertEqual(response.data["subclasses"][0]["name"], "Evocation Wizard")
 
+    def test_list_classes_skips_detail_relations(self):
+        with self.assertNumQueries(1):
+            self.client.get(self.classes_url)
+
     def test_create_class(self):
         data = {
             "index": "test_class",
@@ -0,0 +1,71 @@
+import io
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from api.models import Spell, Subclass, SubclassDescription
+from api.serializers import SpellListSerializer, SubclassDetailSerializer
+from api.serializers.compiler import compiled_renderer
+from api.tests.resources import SameResponseMixin
+from api.urls import router
+
+
+class CompiledSerializerTests(SameResponseMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def setUp(self):
+        self.request = APIRequestFactory().get('/', HTTP_HOST='testserver')
+
+    def assertRendersLikeSerializer(self, serializer_class, instance):
+        render = compiled_renderer(serializer_class)
+        expected = serializer_class(instance, context={'request': self.request}).data
+        actual = render(instance, {'request': self.request})
+        self.assertEqual(actual, expected)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_every_read_serializer_renders_every_object_identically(self):
+        for _, viewset, basename in router.registry:
+            for action in ('list', 'retrieve'):
+                view = viewset(action=action, basename=basename, format_kwarg=None, request=self.request)
+                serializer_class = view.get_serializer_class()
+                with self.subTest(serializer=serializer_class.__name__):
+                    self.assertIsNotNone(compiled_renderer(serializer_class))
+                    for instance in view.get_queryset():
+                        self.assertRendersLikeSerializer(serializer_class, instance)
+
+    def test_missing_related_objects_render_like_drf(self):
+        """
+        A reverse one-to-one with no row renders as None, as DRF does on ObjectDoesNotExist.
+        """
+        subclass = Subclass.objects.first()
+        SubclassDescription.objects.filter(subclass=subclass).delete()
+        subclass = Subclass.objects.get(pk=subclass.pk)
+        self.assertRendersLikeSerializer(SubclassDetailSerializer, subclass)
+
+    @override_settings(COMPILE_SERIALIZERS=True)
+    def test_detail_endpoints_use_the_compiled_serializer(self):
+        spell = Spell.objects.first()
+        response = self.assertSameResponse(f'/api/spells/{spell.pk}/', 'COMPILE_SERIALIZERS',
+                                           HTTP_ACCEPT='application/json')
+        self.assertIsInstance(response.data, dict)
+
+    def test_unsupported_serializers_are_not_compiled(self):
+        class ShoutingSerializer(SpellListSerializer):
+            def to_representation(self, instance):
+                return {key: str(value).upper() for key, value in super().to_representation(instance).items()}
+
+        class LengthSerializer(SpellListSerializer):
+            name_length = serializers.IntegerField(source='name.__len__')
+
+            class Meta(SpellListSerializer.Meta):
+                fields = ['id', 'name_length']
+
+        self.assertIsNone(compiled_renderer(ShoutingSerializer))
+        self.assertIsNone(compiled_renderer(LengthSerializer))
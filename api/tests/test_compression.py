@@ -0,0 +1,97 @@
+import gzip
+import io
+from contextlib import redirect_stdout
+from unittest import skipIf
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+
+from api.compression import BEST_LEVELS, CODINGS, best_compression, brotli, compress, negotiate_coding, zstandard
+from api.middleware import compressed_bodies
+from api.models import Spell
+
+DECOMPRESS = {
+    'gzip': gzip.decompress,
+    'br': brotli and brotli.decompress,
+    'zstd': zstandard and (lambda data: zstandard.ZstdDecompressor().decompress(data)),
+}
+
+
+class NegotiationTests(SimpleTestCase):
+    def test_best_accepted_coding_wins(self):
+        self.assertEqual(negotiate_coding('gzip', ['br', 'gzip']), 'gzip')
+        self.assertEqual(negotiate_coding('gzip, deflate, br, zstd', ['br', 'zstd', 'gzip']), 'br')
+        self.assertEqual(negotiate_coding('br;q=0.5, gzip', ['br', 'gzip']), 'gzip')
+        self.assertEqual(negotiate_coding('*', ['br', 'gzip']), 'br')
+        self.assertEqual(negotiate_coding('*;q=0.1, br;q=0', ['br', 'gzip']), 'gzip')
+
+    def test_nothing_acceptable(self):
+        for header in ['', 'identity', 'deflate', 'gzip;q=0', 'gzip;q=x']:
+            with self.subTest(header=header):
+                self.assertIsNone(negotiate_coding(header, ['br', 'gzip']))
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def setUp(self):
+        compressed_bodies.clear()
+
+    def test_every_available_coding_round_trips(self):
+        plain = self.client.get('/api/spells/')
+        self.assertIn('Accept-Encoding', plain['Vary'])
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        for coding in CODINGS:
+            with self.subTest(coding=coding):
+                response = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING=coding)
+                self.assertEqual(response['Content-Encoding'], coding)
+                self.assertEqual(int(response['Content-Length']), len(response.content))
+                self.assertLess(len(response.content), len(plain.content) / 3)
+                self.assertEqual(DECOMPRESS[coding](response.content), plain.content)
+
+    @skipIf(brotli is None, "brotli is not installed")
+    def test_brotli_is_preferred(self):
+        response = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip, deflate, br, zstd')
+        self.assertEqual(response['Content-Encoding'], 'br')
+
+    def test_bodies_are_compressed_once(self):
+        for _ in range(3):
+            self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual((compressed_bodies.misses, compressed_bodies.hits), (1, 2))
+
+        Spell.objects.filter(index='fireball').update(name='Fireball!')
+        response = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertIn(b'Fireball!', gzip.decompress(response.content))
+        self.assertEqual(compressed_bodies.misses, 2)
+
+    @skipIf(brotli is None, "brotli is not installed")
+    def test_only_bodies_compressed_ahead_use_the_best_levels(self):
+        response = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='br')
+        plain = brotli.decompress(response.content)
+        self.assertEqual(response.content, compress(plain, 'br'))
+        self.assertNotEqual(response.content, CODINGS['br'](plain, BEST_LEVELS['br']))
+
+        compressed_bodies.clear()
+        with best_compression():
+            self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='br')
+        cached = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='br')
+        self.assertEqual(cached.content, CODINGS['br'](plain, BEST_LEVELS['br']))
+
+    def test_small_bodies_are_sent_as_they_are(self):
+        spell = Spell.objects.get(index='fireball')
+        size = len(self.client.get(f'/api/spells/{spell.pk}/').content)
+        with override_settings(COMPRESSION_MIN_SIZE=size + 1):
+            response = self.client.get(f'/api/spells/{spell.pk}/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_html_and_errors_are_not_compressed(self):
+        for url, extra in [('/api/spells/', {'HTTP_ACCEPT': 'text/html'}), ('/api/spells/0/', {})]:
+            with self.subTest(url=url, **extra):
+                response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', **extra)
+                self.assertFalse(response.has_header('Content-Encoding'))
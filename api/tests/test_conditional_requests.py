@@ -0,0 +1,120 @@
+import io
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api.management.commands.load_data import DEFAULT_SEED_DIR
+from api.models import Class, SpellClass, Spell
+from api.tests.resources import resource_urls
+
+
+@override_settings(CONDITIONAL_REQUESTS=True)
+class ConditionalRequestTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def etag(self, url, **extra):
+        return self.client.get(url, **extra)['ETag']
+
+    def test_unchanged_resources_cost_one_query(self):
+        for _, _, list_url, detail_url in resource_urls():
+            for url in [list_url, detail_url]:
+                with self.subTest(url=url):
+                    response = self.client.get(url)
+                    self.assertTrue(response['ETag'].startswith('"'))
+                    self.assertFalse(response.has_header('Last-Modified'))
+                    with self.assertNumQueries(1):
+                        again = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+                    self.assertEqual(again.status_code, 304)
+                    self.assertEqual(again.content, b'')
+                    self.assertEqual(again['ETag'], response['ETag'])
+
+    def test_related_writes_change_the_etag(self):
+        fireball = Spell.objects.get(index='fireball')
+        wizard = Class.objects.get(index='wizard')
+        url = f'/api/spells/{fireball.pk}/'
+        before = self.etag(url)
+        wizard.name = 'Wizard!'
+        wizard.save()
+        after_rename = self.etag(url)
+        self.assertNotEqual(after_rename, before)
+
+        SpellClass.objects.filter(spell=fireball).first().delete()
+        self.assertNotEqual(self.etag(url), after_rename)
+        # The list renders spell columns only, so it is unaffected by class writes.
+        self.assertEqual(self.client.get('/api/spells/', HTTP_IF_NONE_MATCH=self.etag('/api/spells/')).status_code,
+                         304)
+
+    def test_deletes_are_not_hidden_by_if_modified_since(self):
+        fireball = Spell.objects.get(index='fireball')
+        url = f'/api/spells/{fireball.pk}/'
+        before = self.client.get(url)
+        SpellClass.objects.filter(spell=fireball).first().delete()
+        after = self.client.get(url, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after.content, before.content)
+
+    def test_non_numeric_ids_are_not_found(self):
+        for conditional in (True, False):
+            for prefix in ('spells', 'classes'):
+                with self.subTest(conditional=conditional, prefix=prefix), \
+                        override_settings(CONDITIONAL_REQUESTS=conditional):
+                    self.assertEqual(self.client.get(f'/api/{prefix}/abc/').status_code, 404)
+
+    def test_stale_etags_get_the_body(self):
+        fireball = Spell.objects.get(index='fireball')
+        etag = self.etag('/api/spells/')
+        self.client.patch(f'/api/spells/{fireball.pk}/', {'name': 'Big Fireball'}, format='json')
+        response = self.client.get('/api/spells/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Big Fireball', response.content)
+
+    def test_load_data_updates_change_the_etag(self):
+        seed_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, seed_dir)
+        shutil.copytree(DEFAULT_SEED_DIR, seed_dir, dirs_exist_ok=True)
+        spells = seed_dir / 'spells.csv'
+        etag = self.etag('/api/spells/')
+        spells.write_text(spells.read_text().replace(',Fireball,', ',Fireball II,'))
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', source=str(seed_dir), stdout=io.StringIO())
+        self.assertEqual(Spell.objects.get(index='fireball').name, 'Fireball II')
+        self.assertNotEqual(self.etag('/api/spells/'), etag)
+
+    def test_each_representation_has_its_own_etag(self):
+        etags = {self.etag('/api/spells/'), self.etag('/api/spells/?fields=name'),
+                 self.etag('/api/spells/', HTTP_ACCEPT='application/msgpack'),
+                 self.etag('/api/spells/?include=school')}
+        self.assertEqual(len(etags), 4)
+
+    def test_compressed_responses_keep_strong_etags(self):
+        etag = self.etag('/api/spells/')
+        compressed = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed['ETag'], f'{etag[:-1]}-gzip"')
+
+        again = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=compressed['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again['ETag'], compressed['ETag'])
+        self.assertEqual(self.client.get('/api/spells/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get('/api/spells/', HTTP_IF_NONE_MATCH=f'W/{etag}').status_code, 304)
+
+        fireball = Spell.objects.get(index='fireball')
+        fireball.name = 'Fireball!'
+        fireball.save()
+        stale = self.client.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=compressed['ETag'])
+        self.assertEqual(stale.status_code, 200)
+
+    def test_missing_objects_and_html_have_no_validators(self):
+        self.assertFalse(self.client.get('/api/spells/0/').has_header('ETag'))
+        self.assertFalse(self.client.get('/api/spells/', HTTP_ACCEPT='text/html').has_header('ETag'))
+
+    @override_settings(CONDITIONAL_REQUESTS=False)
+    def test_disabled(self):
+        self.assertFalse(self.client.get('/api/spells/').has_header('ETag'))
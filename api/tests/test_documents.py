@@ -0,0 +1,102 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import SystemCheckError
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+
+from api import documents
+from api.models import Class, DetailDocument, Spell, SpellClass
+from api.tests.resources import SameResponseMixin, resource_urls
+
+
+@override_settings(MATERIALIZED_DOCUMENTS=True)
+class DetailDocumentTests(SameResponseMixin, APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        documents.connect()
+        cls.addClassCleanup(documents.disconnect)
+
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def assertServedLikeSerializer(self, url):
+        return self.assertSameResponse(url, 'MATERIALIZED_DOCUMENTS', queries=1)
+
+    def test_load_data_materializes_every_detail(self):
+        for basename, viewset, _, detail_url in resource_urls():
+            model = viewset.queryset.model
+            self.assertEqual(DetailDocument.objects.filter(resource=basename).count(), model.objects.count())
+            with self.subTest(resource=basename):
+                response = self.assertServedLikeSerializer(detail_url)
+                self.assertIn(b'http://testserver/api/', response.content)
+
+    def test_catalog_reads_cannot_be_enabled_too(self):
+        with override_settings(CATALOG_READS=True), self.assertRaisesMessage(SystemCheckError, 'api.E001'):
+            call_command('check')
+
+    def test_other_representations_are_rendered(self):
+        wizard = Class.objects.get(index='wizard')
+        for query in ['?fields=name', '?include=spells', '?format=msgpack']:
+            with self.subTest(query=query):
+                self.assertSameResponse(f'/api/classes/{wizard.pk}/{query}', 'MATERIALIZED_DOCUMENTS')
+
+    def test_api_writes_rebuild_dependent_documents(self):
+        fireball = Spell.objects.get(index='fireball')
+        wizard = Class.objects.get(index='wizard')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/spells/{fireball.pk}/', {'name': 'Big Fireball'}, format='json')
+
+        self.assertIn(b'Big Fireball', self.assertServedLikeSerializer(f'/api/spells/{fireball.pk}/').content)
+        self.assertIn(b'Big Fireball', self.assertServedLikeSerializer(f'/api/classes/{wizard.pk}/').content)
+
+    def test_moved_junction_rows_rebuild_both_sides(self):
+        fireball = Spell.objects.get(index='fireball')
+        wizard, bard = Class.objects.get(index='wizard'), Class.objects.get(index='bard')
+        link = SpellClass.objects.get(spell=fireball, class_obj=wizard)
+        with self.captureOnCommitCallbacks(execute=True):
+            link.class_obj = bard
+            link.save()
+
+        self.assertNotIn(b'"Fireball"', self.assertServedLikeSerializer(f'/api/classes/{wizard.pk}/').content)
+        self.assertIn(b'"Fireball"', self.assertServedLikeSerializer(f'/api/classes/{bard.pk}/').content)
+        self.assertServedLikeSerializer(f'/api/spells/{fireball.pk}/')
+
+    def test_deletes_drop_and_rebuild_documents(self):
+        fireball = Spell.objects.get(index='fireball')
+        wizard = Class.objects.get(index='wizard')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f'/api/spells/{fireball.pk}/')
+
+        self.assertFalse(DetailDocument.objects.filter(resource='spell', object_id=fireball.pk).exists())
+        self.assertNotIn(b'"Fireball"', self.assertServedLikeSerializer(f'/api/classes/{wizard.pk}/').content)
+
+
+class MaterializedDocumentsBootTests(SimpleTestCase):
+    def test_commands_run_with_documents_enabled(self):
+        """
+        Each command runs in a fresh process, so `api.documents` is imported by the app registry rather than
+        by the test runner.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {**os.environ, 'DATABASE_URL': f'sqlite:///{tmp}/db.sqlite3', 'MATERIALIZED_DOCUMENTS': 'true'}
+            for command in (['check'], ['migrate', '--verbosity', '0'], ['load_data'], ['materialize']):
+                with self.subTest(command=command[0]):
+                    result = subprocess.run(
+                        [sys.executable, 'manage.py', *command],
+                        cwd=settings.BASE_DIR,
+                        env=env,
+                        capture_output=True,
+                        text=True,
+                    )
+                    self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn('477 documents materialized', result.stdout)
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from api.management.commands.load_data import DEFAULT_SEED_DIR
+from api.models import Class, Spell, SpellClass
+from api.views.export_view import EXPORTS
+
+
+class ExportTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def export(self, resource, format='csv'):
+        response = self.client.get(f'/api/export/{resource}/', {'format': format})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_every_seed_file_can_be_exported(self):
+        self.assertEqual(sorted(f'{name}.csv' for name in EXPORTS), sorted(os.listdir(DEFAULT_SEED_DIR)))
+
+    def test_csv_export_matches_the_seed_files(self):
+        for resource in EXPORTS:
+            with self.subTest(resource=resource):
+                with open(os.path.join(DEFAULT_SEED_DIR, f'{resource}.csv'), newline='') as file:
+                    seed = list(csv.reader(file))
+                self.assertEqual(list(csv.reader(io.StringIO(self.export(resource)))), seed)
+
+    def test_exported_files_load_back(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for resource in EXPORTS:
+                with open(os.path.join(directory, f'{resource}.csv'), 'w', newline='') as file:
+                    file.write(self.export(resource))
+            before = {resource: self.export(resource) for resource in EXPORTS}
+            Spell.objects.all().delete()
+            Class.objects.all().delete()
+            with redirect_stdout(io.StringIO()):
+                call_command('load_data', source=directory, force=True, stdout=io.StringIO())
+        for resource in EXPORTS:
+            with self.subTest(resource=resource):
+                self.assertEqual(self.export(resource), before[resource])
+
+    def test_ndjson_is_the_default(self):
+        response = self.client.get('/api/export/spells_classes/')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="spells_classes.ndjson"')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), SpellClass.objects.count())
+        self.assertEqual(set(json.loads(lines[0])), {'ref_index', 'ref_name', 'spells_index'})
+
+    def test_nulls_and_booleans(self):
+        rows = [json.loads(line) for line in self.export('spells', 'ndjson').splitlines()]
+        spell = next(row for row in rows if row['material'] is None)
+        self.assertIsInstance(spell['ritual'], bool)
+        csv_rows = list(csv.DictReader(io.StringIO(self.export('spells'))))
+        self.assertEqual(next(row for row in csv_rows if row['index'] == spell['index'])['material'], '')
+
+    def test_unknown_resource(self):
+        response = self.client.get('/api/export/schools/')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('spells_classes', json.loads(response.content)['detail'])
@@ -0,0 +1,60 @@
+import csv
+import io
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.management.commands.load_data import DEFAULT_SEED_DIR
+from api.models import Spell, SpellClass, SpellDescription, ProficiencyRace, School, Subclass
+
+
+def generate(output, *args):
+    call_command('generate_seed', '--output', str(output), *args, stdout=io.StringIO())
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+class GenerateSeedCommandTests(TestCase):
+    def setUp(self):
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+    def test_scales_every_file_by_the_factor(self):
+        generate(self.output_dir, '--scale', '3')
+        for path in Path(DEFAULT_SEED_DIR).glob('*.csv'):
+            self.assertEqual(len(read_rows(self.output_dir / path.name)), 3 * len(read_rows(path)), path.name)
+
+    def test_same_seed_writes_identical_files(self):
+        generate(self.output_dir / 'a', '--scale', '2', '--seed', '7')
+        generate(self.output_dir / 'b', '--scale', '2', '--seed', '7')
+        generate(self.output_dir / 'c', '--scale', '2', '--seed', '8')
+        first = (self.output_dir / 'a' / 'spells_desc.csv').read_bytes()
+        self.assertEqual(first, (self.output_dir / 'b' / 'spells_desc.csv').read_bytes())
+        self.assertNotEqual(first, (self.output_dir / 'c' / 'spells_desc.csv').read_bytes())
+
+    def test_description_lengths_come_from_the_real_values(self):
+        generate(self.output_dir, '--scale', '2')
+        real_lengths = {len(row['value']) for row in read_rows(Path(DEFAULT_SEED_DIR) / 'spells_desc.csv')}
+        generated = [row for row in read_rows(self.output_dir / 'spells_desc.csv') if row['spells_index'].endswith('-1')]
+        self.assertTrue(generated)
+        self.assertTrue(all(len(row['value']) in real_lengths for row in generated))
+
+    def test_output_loads_with_load_data(self):
+        generate(self.output_dir, '--scale', '2')
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', '--source', str(self.output_dir), stdout=io.StringIO())
+
+        self.assertEqual(Spell.objects.count(), 638)
+        self.assertEqual(SpellClass.objects.count(), 1556)
+        self.assertEqual(SpellDescription.objects.count(), 2124)
+        self.assertEqual(ProficiencyRace.objects.filter(subrace__isnull=False).count(), 8)
+        self.assertEqual(School.objects.count(), 8)
+        self.assertEqual(Subclass.objects.get(index='evocation-1').class_obj.index, 'wizard-1')
+        self.assertEqual(Spell.objects.get(index='fireball-1').classes.count(), 2)
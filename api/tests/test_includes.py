@@ -0,0 +1,62 @@
+import io
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from api.models import Class, School, Spell
+from api.tests.resources import resource_urls
+
+
+class IncludeTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def test_detail_includes_each_related_object_once(self):
+        spell = Spell.objects.get(index='fireball')
+        plain = self.client.get(f'/api/spells/{spell.pk}/')
+        with self.assertNumQueries(4 + 3):
+            response = self.client.get(f'/api/spells/{spell.pk}/', {'include': 'classes,subclasses,school'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['data'], plain.json())
+
+        school = self.client.get('/api/schools/').json()
+        self.assertEqual(data['included']['school'], [s for s in school if s['id'] == spell.school_id])
+        class_ids = sorted(spell.classes.values_list('class_obj_id', flat=True))
+        self.assertEqual([c['id'] for c in data['included']['class']], class_ids)
+        self.assertEqual(set(data['included']['class'][0]), {'id', 'name', 'detail_url'})
+        self.assertIn('subclass', data['included'])
+
+    def test_list_includes_are_deduplicated(self):
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/spells/', {'include': 'school'})
+        schools = response.json()['included']['school']
+        self.assertEqual(len(response.json()['data']), Spell.objects.count())
+        self.assertEqual([s['id'] for s in schools], sorted(School.objects.filter(spells__isnull=False)
+                                                           .distinct().values_list('pk', flat=True)))
+
+    def test_every_offered_relation_can_be_included(self):
+        for basename, viewset, list_url, detail_url in resource_urls():
+            for name in viewset.includes:
+                with self.subTest(resource=basename, include=name):
+                    for url in [list_url, detail_url]:
+                        response = self.client.get(url, {'include': name})
+                        self.assertEqual(response.status_code, 200, response.content)
+                        self.assertEqual(set(response.json()), {'data', 'included'})
+
+    def test_includes_combine_with_sparse_fieldsets(self):
+        wizard = Class.objects.get(index='wizard')
+        response = self.client.get(f'/api/classes/{wizard.pk}/', {'include': 'spells', 'fields': 'name'})
+        self.assertEqual(response.json()['data'], {'name': 'Wizard'})
+        self.assertEqual(len(response.json()['included']['spell']), wizard.spells.count())
+
+    def test_unknown_relations_are_rejected(self):
+        response = self.client.get('/api/schools/', {'include': 'spells,teachers'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'include': ["Unknown relation(s): teachers. Choose from: spells."]})
+
+    def test_responses_without_include_are_unchanged(self):
+        self.assertIsInstance(self.client.get('/api/spells/').json(), list)
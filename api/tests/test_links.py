@@ -0,0 +1,37 @@
+import io
+
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import clear_script_prefix, reverse, set_script_prefix
+
+from api.serializers.links import LinkBuilder, detail_url
+
+
+class LinkBuilderTests(SimpleTestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/api/spells/', HTTP_HOST='localhost', secure=True)
+
+    def test_links_match_reverse(self):
+        builder = LinkBuilder(self.request)
+        for view_name in ['spell-detail', 'class-detail', 'proficiency-detail', 'race-detail', 'school-detail',
+                          'subclass-detail']:
+            self.assertEqual(builder.detail(view_name, 42),
+                             self.request.build_absolute_uri(reverse(view_name, args=[42])))
+
+    def test_links_follow_the_script_prefix(self):
+        set_script_prefix('/mounted/')
+        self.addCleanup(clear_script_prefix)
+        self.assertEqual(LinkBuilder(self.request).detail('spell-detail', 7),
+                         'https://localhost/mounted/api/spells/7/')
+
+    def test_builder_is_shared_through_the_context(self):
+        context = {'request': self.request}
+        detail_url(context, 'spell-detail', 1)
+        builder = context['link_builder']
+        detail_url(context, 'class-detail', 2)
+        self.assertIs(context['link_builder'], builder)
+
+    def test_bench_command_reports_both_cases(self):
+        stdout = io.StringIO()
+        call_command('bench', 'links', '--iterations', '10', stdout=stdout)
+        self.assertIn("LinkBuilder.detail()", stdout.getvalue())
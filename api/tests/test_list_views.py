@@ -0,0 +1,48 @@
+import io
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from api.urls import router
+from api.views.base_viewsets import values_layout
+from api.serializers import SpellListSerializer
+
+
+class FastListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def test_list_responses_match_the_serializers(self):
+        """
+        Every list response is byte-identical to rendering the list serializer over model instances.
+        """
+        request = APIRequestFactory().get('/', HTTP_HOST='testserver')
+        for prefix, viewset, basename in router.registry:
+            with self.subTest(resource=basename):
+                view = viewset(action='list', basename=basename, format_kwarg=None, request=request)
+                serializer_class = view.get_serializer_class()
+                self.assertIsNotNone(values_layout(serializer_class))
+                expected = serializer_class(viewset.queryset.model.objects.all(), many=True,
+                                            context={'request': request})
+                response = self.client.get(f'/api/{prefix}/', HTTP_ACCEPT='application/json')
+                self.assertEqual(response.content, JSONRenderer().render(expected.data))
+
+    def test_list_runs_one_query_without_building_models(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/races/')
+        self.assertEqual(len(response.data), 9)
+        self.assertIsInstance(response.data[0], dict)
+
+    def test_serializers_with_computed_fields_are_not_flattened(self):
+        class RenamingSerializer(SpellListSerializer):
+            title = serializers.CharField(source='name')
+
+            class Meta(SpellListSerializer.Meta):
+                fields = ['id', 'title', 'detail_url']
+
+        self.assertIsNone(values_layout(RenamingSerializer))
@@ -0,0 +1,181 @@
+import io
+import json
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from api.management.commands.load_data import check_references, index_map, DEFAULT_SEED_DIR, REFERENCES, \
+    SEED_SOURCES
+from api.management.profiling import StageProfiler
+from api.models import Class, Proficiency, ProficiencyRace, Spell, SpellClass, SpellDescription, School, Subrace, \
+    Subclass, SeedFile
+
+
+def run_load_data(*args):
+    """
+    Runs the load_data command with its progress output silenced and returns what it wrote to stdout.
+    """
+    stdout = io.StringIO()
+    with redirect_stdout(io.StringIO()):
+        call_command('load_data', *args, stdout=stdout, stderr=io.StringIO())
+    return stdout.getvalue()
+
+
+class LoadDataCommandTests(TestCase):
+    def test_loads_every_table(self):
+        run_load_data()
+        self.assertEqual(Class.objects.count(), 12)
+        self.assertEqual(Proficiency.objects.count(), 117)
+        self.assertEqual(School.objects.count(), 8)
+        self.assertEqual(Spell.objects.count(), 319)
+        self.assertEqual(SpellClass.objects.count(), 778)
+        # The proficiencies_races file mixes race and subrace slugs in the same column.
+        self.assertEqual(ProficiencyRace.objects.filter(subrace__isnull=False).count(), 4)
+        self.assertEqual(Subclass.objects.get(index='evocation').class_obj.index, 'wizard')
+        self.assertEqual(Subrace.objects.get(index='high-elf').race.index, 'elf')
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """
+        The whole seed (about 2.8k rows) is written with a small, fixed number of statements per table.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            run_load_data()
+        self.assertLess(len(queries), 60)
+
+    def test_rerun_does_not_duplicate_rows(self):
+        run_load_data()
+        run_load_data()
+        self.assertEqual(Class.objects.count(), 12)
+        self.assertEqual(SpellClass.objects.count(), 778)
+        self.assertEqual(ProficiencyRace.objects.count(), 9)
+
+    def test_unresolved_reference_is_rejected_before_writing(self):
+        data = {file_name: [] for file_name, _, _ in REFERENCES}
+        data.update({file_name: [] for file_name, _ in SEED_SOURCES.values()})
+        data['spells_classes.csv'] = [{'spells_index': 'fireball', 'ref_index': 'wizard', 'ref_name': 'Wizard'}]
+        maps = {model: index_map(model) for model in SEED_SOURCES}
+        with self.assertRaisesMessage(CommandError, "spells_classes.csv:2: spells_index='fireball'"):
+            check_references(data, maps)
+        self.assertEqual(SpellClass.objects.count(), 0)
+
+
+class IncrementalLoadDataTests(TestCase):
+    def setUp(self):
+        # Work on a copy of the seed files so they can be edited between runs.
+        self.seed_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.seed_dir)
+        shutil.copytree(DEFAULT_SEED_DIR, self.seed_dir, dirs_exist_ok=True)
+        run_load_data('--source', str(self.seed_dir))
+
+    def edit(self, file_name, old, new):
+        path = self.seed_dir / file_name
+        path.write_text(path.read_text(encoding='utf-8').replace(old, new), encoding='utf-8')
+
+    def test_records_a_hash_per_file(self):
+        self.assertEqual(SeedFile.objects.count(), 17)
+        self.assertEqual(len(SeedFile.objects.get(name='spells_classes.csv').rows), 778)
+
+    def test_unchanged_files_return_after_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            output = run_load_data('--source', str(self.seed_dir))
+        self.assertIn("nothing to load", output)
+        self.assertEqual(len(queries), 1)
+
+    def test_applies_only_changed_rows(self):
+        wizard = Class.objects.get(index='wizard')
+        self.edit('classes.csv', 'wizard,6,Wizard', 'wizard,6,Archmage')
+        self.edit('spells_classes.csv', 'wizard,Wizard,acid-arrow\n', '')
+
+        with CaptureQueriesContext(connection) as queries:
+            output = run_load_data('--source', str(self.seed_dir))
+
+        self.assertIn("files applied", output)
+        wizard.refresh_from_db()
+        self.assertEqual(wizard.name, "Archmage")
+        self.assertFalse(SpellClass.objects.filter(spell__index='acid-arrow', class_obj=wizard).exists())
+        self.assertEqual(SpellClass.objects.count(), 777)
+        # Untouched tables are neither re-read nor rewritten.
+        self.assertFalse(any('api_spelldescription' in query['sql'] for query in queries))
+
+    def test_renamed_slug_replaces_row_and_its_links(self):
+        for file_name in ('spells_classes.csv', 'spells_subclasses.csv'):
+            self.edit(file_name, ',acid-splash\n', ',acid-splash-renamed\n')
+        self.edit('spells_desc.csv', '\nacid-splash,', '\nacid-splash-renamed,')
+        self.edit('spells.csv', ',acid-splash,', ',acid-splash-renamed,')
+        run_load_data('--source', str(self.seed_dir))
+
+        self.assertFalse(Spell.objects.filter(index='acid-splash').exists())
+        renamed = Spell.objects.get(index='acid-splash-renamed')
+        self.assertEqual(renamed.descriptions.count(), 2)
+        self.assertEqual(renamed.classes.count(), 2)
+        self.assertEqual(renamed.subclasses.count(), 1)
+        self.assertEqual(SpellDescription.objects.count(), 1062)
+        self.assertEqual(SpellClass.objects.count(), 778)
+
+    def test_forced_reload_keeps_descriptions_constant(self):
+        run_load_data('--source', str(self.seed_dir), '--force')
+        self.assertEqual(SpellDescription.objects.count(), 1062)
+        positions = list(Spell.objects.get(index='control-weather').descriptions.values_list('position', flat=True))
+        self.assertEqual(positions, list(range(28)))
+
+    def test_shortened_description_drops_trailing_paragraphs(self):
+        self.edit('spells_desc.csv', 'acid-splash,"This spell\'s damage', 'acid-arrow,"This spell\'s damage')
+        run_load_data('--source', str(self.seed_dir))
+
+        self.assertEqual(Spell.objects.get(index='acid-splash').descriptions.count(), 1)
+        acid_arrow = list(Spell.objects.get(index='acid-arrow').descriptions.values_list('position', 'value'))
+        self.assertEqual(acid_arrow[-1][0], len(acid_arrow) - 1)
+        self.assertTrue(acid_arrow[-1][1].startswith("This spell's damage"))
+        self.assertEqual(SpellDescription.objects.count(), 1062)
+
+    def test_dangling_reference_leaves_database_untouched(self):
+        self.edit('spells.csv', ',acid-splash,', ',acid-splash-renamed,')
+        with self.assertRaises(CommandError):
+            run_load_data('--source', str(self.seed_dir))
+        self.assertTrue(Spell.objects.filter(index='acid-splash').exists())
+        self.assertFalse(Spell.objects.filter(index='acid-splash-renamed').exists())
+
+
+class LoadDataProfileTests(TestCase):
+    def setUp(self):
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+    def test_profile_reports_every_stage(self):
+        report_path = self.output_dir / 'profile.json'
+        output = run_load_data('--profile', '--profile-output', str(report_path))
+
+        self.assertIn("rows written", output)
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+        stages = {stage['stage']: stage for stage in report['stages']}
+        self.assertIn('parse and validate', stages)
+        self.assertEqual(stages['load_spell_descriptions']['rows_read'], 1062)
+        self.assertEqual(stages['load_spell_descriptions']['rows_written'], 1062)
+        self.assertEqual(report['total']['queries'], sum(stage['queries'] for stage in report['stages']))
+
+    def test_profile_counts_writes_without_sqlite_counter(self):
+        run_load_data()
+        profiler = StageProfiler()
+        profiler.start()
+        with mock.patch('api.management.profiling.rows_changed', return_value=None):
+            with profiler.stage('rename'):
+                Spell.objects.filter(school__index='evocation').update(name='Renamed')
+                Spell.objects.filter(name='Renamed').count()
+        profiler.stop()
+        self.assertEqual(profiler.stages[0]['rows_written'], Spell.objects.filter(name='Renamed').count())
+        self.assertEqual(profiler.stages[0]['queries'], 2)
+
+    def test_profile_compares_against_baseline(self):
+        baseline = self.output_dir / 'baseline.json'
+        run_load_data('--profile', '--profile-output', str(baseline))
+        output = run_load_data('--force', '--profile', '--profile-output', str(self.output_dir / 'after.json'),
+                               '--profile-baseline', str(baseline))
+        self.assertIn("Δ queries", output)
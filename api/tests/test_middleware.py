@@ -0,0 +1,51 @@
+from unittest import mock
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.middleware import NPlusOneDetectionMiddleware, NPlusOneQueryError, statement_shape
+from api.models import Class, School, Spell, SpellClass
+from api.views import SpellViewSet
+
+
+@override_settings(NPLUSONE_DETECTION=True, NPLUSONE_THRESHOLD=3, NPLUSONE_STRICT=False)
+class NPlusOneDetectionTests(APITestCase):
+    def setUp(self):
+        school = School.objects.create(index="evocation", name="Evocation")
+        self.spell = Spell.objects.create(index="fireball", name="Fireball", level=3, casting_time="1 action",
+                                          concentration=False, duration="Instantaneous", range="150 feet",
+                                          ritual=False, school=school)
+        for i in range(5):
+            class_obj = Class.objects.create(index=f"class-{i}", name=f"Class {i}", hit_die=8)
+            SpellClass.objects.create(spell=self.spell, class_obj=class_obj)
+        self.spell_detail_url = reverse("spell-detail", args=[self.spell.id])
+
+    def test_statement_shape_ignores_values_and_list_lengths(self):
+        self.assertEqual(statement_shape('SELECT * FROM t WHERE id IN (%s, %s, %s) AND n = 42'),
+                         statement_shape("SELECT * FROM t WHERE id IN (%s) AND n = 'x'"))
+
+    def test_planned_endpoint_is_not_reported(self):
+        with self.assertNoLogs('api.middleware', level='WARNING'):
+            response = self.client.get(self.spell_detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_lazy_loads_are_reported_with_their_serializer_field(self):
+        with mock.patch.object(SpellViewSet, 'query_plans', {}), \
+                self.assertLogs('api.middleware', level='WARNING') as logs:
+            self.client.get(self.spell_detail_url)
+        self.assertIn("SpellClassSerializer.class_name", logs.output[0])
+        self.assertIn('"api_class"', logs.output[0])
+
+    @override_settings(NPLUSONE_STRICT=True)
+    def test_strict_mode_raises(self):
+        with mock.patch.object(SpellViewSet, 'query_plans', {}), self.assertLogs('api.middleware', level='WARNING'):
+            with self.assertRaises(NPlusOneQueryError):
+                self.client.get(self.spell_detail_url)
+
+    @override_settings(NPLUSONE_DETECTION=False)
+    def test_disabled_middleware_leaves_the_stack(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            NPlusOneDetectionMiddleware(lambda request: None)
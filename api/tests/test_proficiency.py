@@ -44,6 +44,13 @@ class ProficiencyEndpointTests(APITestCase):
         self.assertIn("proficiency_classes", response.data)
         self.assertIn("races_and_subraces", response.data)
 
+    def test_retrieve_proficiency_granted_by_subrace(self):
+        response = self.client.get(reverse("proficiency-detail", args=[self.proficiency2.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        granted = response.data["races_and_subraces"][0]
+        self.assertEqual(granted["subrace_name"], "Variant Human")
+        self.assertTrue(granted["subrace_detail_url"].endswith(reverse("race-detail", args=[self.race.id])))
+
     def test_create_proficiency(self):
         data = {"index": "medium_armor", "name": "Medium Armor", "type": "Armor"}
         response = self.client.post(self.proficiencies_url, data, format="json")
@@ -0,0 +1,132 @@
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from api.models import Class, Proficiency, School
+from api.tests.query_budget import BudgetReport, measure, related_extremes
+from api.urls import router
+
+# Data scales every endpoint is measured at: the bundled seed, then a 10x synthetic copy of it.
+SCALES = (1, 10)
+
+# Highest number of queries each endpoint may run, at any scale.
+BUDGETS = {
+    'class': {'list': 1, 'retrieve': 4, 'create': 6, 'partial_update': 2, 'destroy': 9},
+    'proficiency': {'list': 1, 'retrieve': 3, 'create': 4, 'partial_update': 2, 'destroy': 7},
+    'race': {'list': 1, 'retrieve': 3, 'create': 2, 'partial_update': 2, 'destroy': 8},
+    'spell': {'list': 1, 'retrieve': 4, 'create': 3, 'partial_update': 2, 'destroy': 5},
+    # Deleting a school cascades to its spells, whose related rows are deleted 500 spells at a time.
+    'school': {'list': 1, 'retrieve': 2, 'create': 2, 'partial_update': 2, 'destroy': 15},
+    'subclass': {'list': 1, 'retrieve': 1, 'create': 3, 'partial_update': 2, 'destroy': 4},
+}
+
+# Actions whose count may step with data volume: cascading deletes are issued in batches of rows and skip
+# relations that have nothing to delete. They are only held to their budget.
+GROWTH_EXEMPT = {'destroy'}
+
+# Set to the SQL time a single request may spend, in seconds (e.g. 0.5), to also fail on slow queries. Off by
+# default: wall-clock limits fail at random on loaded machines, and the report table shows the times anyway.
+QUERY_TIME_BUDGET = float(os.environ.get('QUERY_TIME_BUDGET') or 0) or None
+
+# Set to a file path to save the results table, e.g. to diff it between commits.
+REPORT_PATH = os.environ.get('QUERY_BUDGET_REPORT')
+
+
+def payloads():
+    """
+    Returns, per resource, a valid body for POST and a body for PATCH.
+    """
+    class_id = Class.objects.order_by('pk').values_list('pk', flat=True).first()
+    proficiency_ids = list(Proficiency.objects.order_by('pk').values_list('pk', flat=True)[:2])
+    return {
+        'class': ({'index': 'budget-class', 'hit_die': 8, 'name': 'Budget', 'proficiencies': proficiency_ids},
+                  {'name': 'Renamed'}),
+        'proficiency': ({'index': 'budget-proficiency', 'name': 'Budget', 'type': 'Skills',
+                         'associated_classes': [class_id]}, {'name': 'Renamed'}),
+        'race': ({'index': 'budget-race', 'name': 'Budget', 'speed': 30, 'age': 'Varies', 'alignment': 'Any',
+                  'language_desc': 'Common', 'size': 'Medium', 'size_description': 'Average'}, {'speed': 35}),
+        'spell': ({'index': 'budget-spell', 'name': 'Budget', 'level': 1, 'casting_time': '1 action',
+                   'concentration': False, 'duration': 'Instantaneous', 'range': 'Self', 'ritual': False,
+                   'school': School.objects.order_by('pk').values_list('pk', flat=True).first()},
+                  {'name': 'Renamed'}),
+        'school': ({'index': 'budget-school', 'name': 'Budget'}, {'name': 'Renamed'}),
+        'subclass': ({'index': 'budget-subclass', 'name': 'Budget', 'subclass_flavor': 'Budget',
+                      'class_obj': class_id}, {'name': 'Renamed'}),
+    }
+
+
+@override_settings(NPLUSONE_DETECTION=True, NPLUSONE_STRICT=True)
+class QueryBudgetTests(APITestCase):
+    """
+    Measures every route of every registered viewset at each scale. An endpoint fails when it exceeds its
+    budget, or when its query count depends on the amount of data: between scales, or between the objects
+    with the fewest and the most related rows. Requests also run under the strict N+1 detector, which names
+    the serializer field behind a regression.
+    """
+
+    def setUp(self):
+        self.seed_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.seed_dir)
+        self.report = BudgetReport()
+
+    def load(self, scale):
+        with redirect_stdout(io.StringIO()):
+            call_command('generate_seed', '--scale', str(scale), '--output', str(self.seed_dir), stdout=io.StringIO())
+            call_command('load_data', '--source', str(self.seed_dir), stdout=io.StringIO())
+
+    def check(self, endpoint, scale, method, url, data=None, expected_status=200):
+        response, queries, seconds = measure(self.client, method, url, data)
+        self.assertEqual(response.status_code, expected_status, f"{endpoint}: {response.content[:500]}")
+        if QUERY_TIME_BUDGET:
+            self.assertLessEqual(seconds, QUERY_TIME_BUDGET, f"{endpoint} spent {seconds:.3f}s in SQL")
+        return queries, seconds
+
+    def measure_resource(self, basename, viewset, scale, bodies):
+        create_body, patch_body = bodies
+        queryset = viewset.queryset.model._default_manager.all()
+        sample = related_extremes(queryset, viewset.query_plans.get('retrieve', ()))
+        list_url = reverse(f'{basename}-list')
+        detail_urls = [reverse(f'{basename}-detail', args=[pk]) for pk in sample]
+
+        routes = [('list', 'get', list_url, None, 200), ('create', 'post', list_url, create_body, 201)]
+        for url in detail_urls:
+            routes += [('retrieve', 'get', url, None, 200), ('partial_update', 'patch', url, patch_body, 200),
+                       ('destroy', 'delete', url, None, 204)]
+
+        per_object = {}
+        for action, method, url, data, expected_status in routes:
+            endpoint = f'{method.upper()} {basename}-{action}'
+            queries, seconds = self.check(endpoint, scale, method, url, data, expected_status)
+            self.report.record(endpoint, scale, queries, seconds)
+            if action not in GROWTH_EXEMPT:
+                per_object.setdefault(endpoint, set()).add(queries)
+            self.assertLessEqual(queries, BUDGETS[basename][action], f"{endpoint} at {scale}x")
+
+        for endpoint, counts in per_object.items():
+            self.assertEqual(len(counts), 1, f"{endpoint} at {scale}x ran {sorted(counts)} queries "
+                                             f"depending on how many related rows the object has")
+
+    def test_query_counts_do_not_grow_with_data(self):
+        for scale in SCALES:
+            self.load(scale)
+            bodies = payloads()
+            for _, viewset, basename in router.registry:
+                with self.subTest(resource=basename, scale=scale):
+                    self.measure_resource(basename, viewset, scale, bodies[basename])
+
+        if REPORT_PATH:
+            Path(REPORT_PATH).write_text(self.report.format_table(SCALES), encoding='utf-8')
+
+        for endpoint in self.report.results:
+            if endpoint.rsplit('-', 1)[1] in GROWTH_EXEMPT:
+                continue
+            counts = [self.report.queries(endpoint, scale) for scale in SCALES]
+            self.assertEqual(len(set(counts)), 1, f"{endpoint} ran {counts} queries at {SCALES}x data")
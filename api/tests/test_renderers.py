@@ -0,0 +1,62 @@
+import datetime
+import io
+from decimal import Decimal
+from unittest import mock
+
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from api.models import School
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(APITestCase):
+    def assertRendersLikeDRF(self, data, accepted_media_type=None, renderer_context=None):
+        self.assertEqual(
+            FastJSONRenderer().render(data, accepted_media_type, renderer_context),
+            JSONRenderer().render(data, accepted_media_type, renderer_context),
+        )
+
+    def test_output_matches_drf(self):
+        self.assertRendersLikeDRF({
+            'name': 'Ünïcode ✨', 'separators': 'line\u2028paragraph\u2029', 'nested': [{'a': 1}, None, True],
+            'when': datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2024, 5, 1), 'amount': Decimal('1.50'), 'tuple': (1, 2),
+        })
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_what_orjson_cannot_encode_falls_back_to_drf(self):
+        self.assertRendersLikeDRF({'big': 2 ** 70, 1: 'integer key'})
+
+    def test_indented_output_falls_back_to_drf(self):
+        data = {'name': 'Evocation', 'spells': [1, 2]}
+        self.assertRendersLikeDRF(data, 'application/json; indent=4')
+        self.assertRendersLikeDRF(data, renderer_context={'indent': 2})
+
+    def test_stdlib_is_used_without_orjson(self):
+        with mock.patch('api.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render({'a': [1]}), b'{"a":[1]}')
+
+
+class FastJSONParserTests(APITestCase):
+    def parse(self, body, encoding='utf-8'):
+        return FastJSONParser().parse(io.BytesIO(body), 'application/json', {'encoding': encoding})
+
+    def test_parses_utf8_and_other_encodings(self):
+        self.assertEqual(self.parse('{"name": "Évocation"}'.encode()), {'name': 'Évocation'})
+        self.assertEqual(self.parse('{"name": "Évocation"}'.encode('utf-16'), 'utf-16'), {'name': 'Évocation'})
+
+    def test_rejects_malformed_json_and_non_finite_numbers(self):
+        for body in (b'{"name": ', b'{"level": NaN}'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self.parse(body)
+
+    def test_endpoints_accept_json_bodies(self):
+        response = self.client.post('/api/schools/', {'index': 'chronurgy', 'name': 'Chronurgy'}, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(School.objects.filter(index='chronurgy').exists())
+
+        response = self.client.post('/api/schools/', b'{"index": ', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
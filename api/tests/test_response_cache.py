@@ -0,0 +1,105 @@
+import io
+import tempfile
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api.models import Class, School, Spell
+from api.response_cache import cache_stats, cascade_models, response_cache
+from api.tests.resources import resource_urls
+
+
+@override_settings(RESPONSE_CACHE=True)
+class ResponseCacheTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def setUp(self):
+        response_cache().clear()
+
+    def assertCached(self, url, **extra):
+        miss = self.client.get(url, **extra)
+        with self.assertNumQueries(1):
+            hit = self.client.get(url, **extra)
+        self.assertEqual((miss['X-Cache'], hit['X-Cache']), ('MISS', 'HIT'))
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(hit['Content-Type'], miss['Content-Type'])
+        return hit
+
+    def test_every_list_and_detail_route_is_cached(self):
+        for _, _, list_url, detail_url in resource_urls():
+            for url in [list_url, detail_url]:
+                with self.subTest(url=url):
+                    self.assertCached(url)
+        self.assertEqual(cache_stats(), {'hits': 12, 'misses': 12})
+
+    def test_key_covers_query_string_and_format(self):
+        json = self.assertCached('/api/spells/')
+        self.assertNotEqual(self.assertCached('/api/spells/?include=school').content, json.content)
+        self.assertNotEqual(self.assertCached('/api/spells/?fields=name').content, json.content)
+        msgpack = self.assertCached('/api/spells/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(msgpack['Content-Type'], 'application/msgpack')
+        self.assertNotEqual(self.assertCached('/api/spells/', HTTP_ACCEPT='application/json; indent=2').content,
+                            json.content)
+
+    def test_writes_invalidate_dependent_responses(self):
+        fireball = Spell.objects.get(index='fireball')
+        wizard = Class.objects.get(index='wizard')
+        self.assertCached(f'/api/classes/{wizard.pk}/')
+        self.assertCached('/api/schools/')
+        self.client.patch(f'/api/spells/{fireball.pk}/', {'name': 'Big Fireball'}, format='json')
+
+        response = self.client.get(f'/api/classes/{wizard.pk}/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn(b'Big Fireball', response.content)
+        # Schools render no spell data in the list, so a spell update leaves their cached list alone.
+        self.assertEqual(self.client.get('/api/schools/')['X-Cache'], 'HIT')
+
+    def test_deletes_invalidate_cascaded_models(self):
+        self.assertLessEqual({School, Spell}, cascade_models(School))
+        wizard = Class.objects.get(index='wizard')
+        urls = ['/api/spells/', f'/api/classes/{wizard.pk}/', '/api/subclasses/?include=spells', '/api/subclasses/']
+        for url in urls:
+            self.client.get(url)
+        evocation = School.objects.get(index='evocation')
+        self.client.delete(f'/api/schools/{evocation.pk}/')
+        for url in urls[:3]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        # The subclass list renders no spell data.
+        self.assertEqual(self.client.get(urls[3])['X-Cache'], 'HIT')
+        self.assertNotIn(b'Fireball', self.client.get(f'/api/classes/{wizard.pk}/').content)
+
+    def test_load_data_invalidates_everything(self):
+        self.client.get('/api/races/')
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', force=True, stdout=io.StringIO())
+        self.assertEqual(self.client.get('/api/races/')['X-Cache'], 'MISS')
+
+    def test_errors_and_html_are_not_cached(self):
+        for url, extra in [('/api/spells/0/', {}), ('/api/spells/', {'HTTP_ACCEPT': 'text/html'})]:
+            with self.subTest(url=url):
+                self.client.get(url, **extra)
+                self.assertNotEqual(self.client.get(url, **extra).get('X-Cache'), 'HIT')
+
+    def test_file_backend(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory}
+            with override_settings(CACHES={'default': backend, 'responses': backend}):
+                self.assertCached('/api/spells/')
+
+    @override_settings(RESPONSE_CACHE=False)
+    def test_disabled(self):
+        self.assertFalse(self.client.get('/api/spells/').has_header('X-Cache'))
+
+    def test_stats_command(self):
+        self.assertCached('/api/races/')
+        out = io.StringIO()
+        call_command('response_cache', stdout=out)
+        self.assertEqual(out.getvalue().splitlines(), ['hits: 1', 'misses: 1', 'hit rate: 50.0%'])
+        call_command('response_cache', clear=True, stdout=io.StringIO())
+        self.assertEqual(cache_stats(), {'hits': 0, 'misses': 0})
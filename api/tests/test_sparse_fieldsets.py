@@ -0,0 +1,73 @@
+import io
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from api.models import Class, Spell
+from api.tests.resources import resource_urls
+
+
+class SparseFieldsetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def test_every_field_can_be_requested_alone(self):
+        """
+        A one-field response has that field as rendered in the full response, with the rest of the row deferred.
+        """
+        for _, _, list_url, detail_url in resource_urls():
+            for url in [list_url, detail_url]:
+                full = self.client.get(url).json()
+                sample = full[0] if isinstance(full, list) else full
+                for name, value in sample.items():
+                    with self.subTest(url=url, field=name):
+                        response = self.client.get(url, {'fields': name})
+                        self.assertEqual(response.status_code, 200, response.content)
+                        data = response.json()
+                        self.assertEqual(data[0] if isinstance(data, list) else data, {name: value})
+
+    def test_only_requested_columns_are_selected_and_relations_skipped(self):
+        spell = Spell.objects.get(index='fireball')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/spells/{spell.pk}/', {'fields': 'id,name,level'})
+        self.assertEqual(response.json(), {'id': spell.pk, 'name': 'Fireball', 'level': 3})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"api_spell"."higher_level"', queries[0]['sql'])
+
+    def test_nested_fieldsets(self):
+        wizard = Class.objects.get(index='wizard')
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/classes/{wizard.pk}/', {'fields': 'name,spells',
+                                                                      'fields[spells]': 'spell_name'})
+        data = response.json()
+        self.assertEqual(list(data), ['name', 'spells'])
+        self.assertIn({'spell_name': 'Fireball'}, data['spells'])
+        self.assertTrue(all(list(spell) == ['spell_name'] for spell in data['spells']))
+
+    def test_list_links_without_the_id_column(self):
+        response = self.client.get('/api/spells/', {'fields': 'detail_url'})
+        spell = Spell.objects.order_by('pk').first()
+        self.assertEqual(response.json()[0], {'detail_url': f'http://testserver/api/spells/{spell.pk}/'})
+
+    def test_invalid_fieldsets_are_rejected(self):
+        spell = Spell.objects.first()
+        cases = [
+            ('/api/spells/', {'fields': 'name,power'}, 'fields', "Unknown field(s): power."),
+            ('/api/spells/', {'fields': ''}, 'fields', "Select at least one field."),
+            ('/api/spells/', {'fields': ' , '}, 'fields', "Select at least one field."),
+            (f'/api/spells/{spell.pk}/', {'fields': ''}, 'fields', "Select at least one field."),
+            (f'/api/classes/{Class.objects.first().pk}/', {'fields[spells]': ''}, 'fields[spells]',
+             "Select at least one field."),
+            (f'/api/spells/{spell.pk}/', {'fields[school_name]': 'name'}, 'fields[school_name]',
+             "'school_name' is not a nested object."),
+        ]
+        for url, params, key, message in cases:
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {key: [message]})
@@ -68,6 +68,31 @@ class SpellEndpointTests(APITestCase):
         self.assertEqual(len(response.data["subclasses"]), 1)  # Ensure associated subclass is included
         self.assertEqual(response.data["subclasses"][0]["subclass_name"], "Evocation Wizard")
 
+    def test_descriptions_are_returned_in_position_order(self):
+        """
+        Test that description paragraphs keep their position regardless of insertion order.
+        """
+        SpellDescription.objects.create(spell=self.spell, position=5, value="Last paragraph.")
+        SpellDescription.objects.create(spell=self.spell, value="Appended paragraph.")
+        response = self.client.get(self.spell_detail_url)
+        self.assertEqual([d["position"] for d in response.data["descriptions"]], [0, 1, 5, 6])
+        self.assertEqual(response.data["descriptions"][3]["value"], "Appended paragraph.")
+
+    def test_retrieve_spell_query_count_does_not_grow_with_relations(self):
+        """
+        Test that the detail view loads its school, descriptions, classes and subclasses in four queries.
+        """
+        for i in range(5):
+            class_obj = Class.objects.create(index=f"class-{i}", name=f"Class {i}", hit_die=8)
+            SpellClass.objects.create(spell=self.spell, class_obj=class_obj)
+            subclass = Subclass.objects.create(index=f"subclass-{i}", name=f"Subclass {i}", subclass_flavor="Flavor",
+                                               class_obj=class_obj)
+            SpellSubclass.objects.create(spell=self.spell, subclass=subclass)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.spell_detail_url)
+        self.assertEqual(len(response.data["classes"]), 6)
+        self.assertEqual(response.data["subclasses"][5]["subclass_name"], "Subclass 4")
+
     def test_create_spell(self):
         """
         Test creating a new spell.
@@ -0,0 +1,70 @@
+import io
+import json
+import tracemalloc
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from api.models import Spell
+from api.urls import router
+from api.views import SpellViewSet
+
+
+@override_settings(STREAM_LIST_RESPONSES=True, STREAM_CHUNK_SIZE=7)
+class StreamingListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def buffered(self, url, **extra):
+        with override_settings(STREAM_LIST_RESPONSES=False):
+            return self.client.get(url, **extra)
+
+    def test_streamed_lists_match_buffered_ones(self):
+        for prefix, _, basename in router.registry:
+            with self.subTest(resource=basename):
+                response = self.client.get(f'/api/{prefix}/')
+                self.assertTrue(response.streaming)
+                self.assertEqual(response['Content-Type'], 'application/json')
+                self.assertEqual(b''.join(response.streaming_content), self.buffered(f'/api/{prefix}/').content)
+
+    def test_serializer_path_streams_too(self):
+        factory = APIRequestFactory()
+        view = SpellViewSet.as_view({'get': 'list'}, basename='spell', fast_list=False)
+        streamed = view(factory.get('/api/spells/'))
+        with override_settings(STREAM_LIST_RESPONSES=False):
+            buffered = view(factory.get('/api/spells/')).render()
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(b''.join(streamed.streaming_content), buffered.content)
+
+    def test_rows_are_encoded_a_chunk_at_a_time(self):
+        pieces = iter(self.client.get('/api/spells/').streaming_content)
+        self.assertEqual(next(pieces), b'[')
+        self.assertEqual(len(json.loads(b'[' + next(pieces) + b']')), 7)
+
+    def test_flat_memory(self):
+        """
+        The streamed response never holds the whole list: its peak allocation is a fraction of the buffered one.
+        """
+        peaks = {}
+        for stream in (False, True):
+            with override_settings(STREAM_LIST_RESPONSES=stream):
+                tracemalloc.start()
+                response = self.client.get('/api/spells/')
+                for _ in response.streaming_content if stream else [response.content]:
+                    pass
+                peaks[stream] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        self.assertLess(peaks[True], peaks[False] / 3)
+
+    def test_other_responses_are_not_streamed(self):
+        spell = Spell.objects.first()
+        for url, extra in [('/api/spells/', {'HTTP_ACCEPT': 'text/html'}),
+                           ('/api/spells/', {'HTTP_ACCEPT': 'application/json; indent=2'}),
+                           ('/api/spells/?include=school', {}),
+                           (f'/api/spells/{spell.pk}/', {})]:
+            with self.subTest(url=url, **extra):
+                self.assertFalse(self.client.get(url, **extra).streaming)
@@ -0,0 +1,77 @@
+import io
+from contextlib import redirect_stdout
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api import warmup
+from api.middleware import compressed_bodies
+from api.response_cache import response_cache
+from api.urls import router
+from api.views.export_view import EXPORTS
+
+
+@override_settings(WARM_UP=True, WARM_UP_HOST='api.example.fly.dev', ALLOWED_HOSTS=['api.example.fly.dev'])
+@mock.patch.object(warmup, 'last_report', None)
+class WarmUpTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with redirect_stdout(io.StringIO()):
+            call_command('load_data', stdout=io.StringIO())
+
+    def setUp(self):
+        compressed_bodies.clear()
+        response_cache().clear()
+
+    def get(self, path, **extra):
+        return self.client.get(path, HTTP_HOST='api.example.fly.dev', **extra)
+
+    def test_ready_only_after_warm_up(self):
+        response = self.get('/healthz/ready')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {'status': 'warming up'})
+
+        report = warmup.warm_up()
+        response = self.get('/healthz/ready')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ready', 'warm_up': report})
+        self.assertEqual(report['failures'], [])
+        # API root and one browsable page, a list and a detail per resource, every export.
+        self.assertEqual(report['requests'], 2 + 2 * len(router.registry) + len(EXPORTS))
+
+    def test_failed_requests_keep_the_worker_unready(self):
+        requests = [('/api/spells/', 'application/json'), ('/api/nothing-here/', 'application/json')]
+        with mock.patch.object(warmup, 'warm_up_requests', return_value=requests), \
+                self.assertLogs('api.warmup', 'ERROR'):
+            report = warmup.warm_up()
+        self.assertEqual(report['failures'], ['GET /api/nothing-here/: 404'])
+        response = self.get('/healthz/ready')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {'status': 'warm-up failed', 'warm_up': report})
+
+    @override_settings(WARM_UP_HOST='api.example.com')
+    def test_host_outside_allowed_hosts_is_rejected(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "'api.example.com' is not in ALLOWED_HOSTS"):
+            warmup.warm_up()
+        self.assertIsNone(warmup.last_report)
+
+    @override_settings(WARM_UP=False)
+    def test_ready_without_warm_up(self):
+        self.assertEqual(self.get('/healthz/ready').json(), {'status': 'ready', 'warm_up': None})
+
+    @override_settings(WARM_UP_OBJECTS=0)
+    def test_every_object_is_warmed_on_request(self):
+        report = warmup.warm_up()
+        details = sum(viewset.queryset.model.objects.count() for _, viewset, _ in router.registry)
+        self.assertEqual(report['requests'], 2 + len(router.registry) + details + len(EXPORTS))
+
+    @override_settings(RESPONSE_CACHE=True)
+    def test_caches_are_primed_for_the_public_host(self):
+        warmup.warm_up()
+        hits = compressed_bodies.hits
+        response = self.get('/api/spells/', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual((response['X-Cache'], response['Content-Encoding']), ('HIT', 'br'))
+        self.assertEqual(compressed_bodies.hits, hits + 1)
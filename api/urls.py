@@ -1,9 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from rest_framework.response import Response
 from rest_framework.renderers import TemplateHTMLRenderer
 
 from rest_framework.views import APIView
 from api.views import ClassViewSet, ProficiencyViewSet, RaceViewSet, SpellViewSet, SchoolViewSet, SubclassViewSet
+from api.views.export_view import ExportView
 
 
 class CustomRouter(DefaultRouter):
@@ -84,4 +86,7 @@ router.register('spells', SpellViewSet, basename='spell')
 router.register('schools', SchoolViewSet, basename='school')
 router.register('subclasses', SubclassViewSet, basename='subclass')
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    # Streams a seed table (e.g. spells, spells_classes) as NDJSON or CSV.
+    path('export/<str:resource>/', ExportView.as_view(), name='export'),
+]
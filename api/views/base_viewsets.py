@@ -1,7 +1,359 @@
+from contextlib import nullcontext
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch, QuerySet
+from django.http import Http404, StreamingHttpResponse
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import ModelViewSet
 
+from api.parsers import BINARY_PARSERS
+from api.renderers import BINARY_RENDERERS
+from api.serializers.compiler import compiled_renderer
+from api.serializers.links import link_builder
+from api.views.includes import included_documents, parse_includes
+from api.views.mixins import CatalogMixin, ConditionalMixin, DetailDocumentMixin, ResponseCacheMixin
+from api.views.sparse_fieldsets import parse_fieldsets, read_sources, sparse_queryset, trim_fields
+from api.views.streaming import can_stream_json, chunked, json_array_stream
+
+# Serializer fields whose representation of a database value is the value itself, so `.values()` rows can be
+# returned as they come. Subclasses are excluded on purpose, as they may override `to_representation`.
+PASSTHROUGH_FIELDS = (serializers.CharField, serializers.IntegerField)
+
+
+def apply_query_plan(queryset, lookups):
+    """
+    Loads the relations named by `lookups` (Django `__` paths) alongside `queryset`.
+
+    Paths made only of foreign keys and one-to-one relations are joined with `select_related`. A path
+    crossing a many-valued relation is prefetched, and whatever follows it is planned again on the
+    prefetch queryset, so `classes__class_obj` costs a single extra query however many classes there are.
+    """
+    select = []
+    prefetch = {}
+    for lookup in lookups:
+        model = queryset.model
+        parts = lookup.split('__')
+        for i, part in enumerate(parts):
+            field = model._meta.get_field(part)
+            model = field.related_model
+            if field.one_to_many or field.many_to_many:
+                nested = prefetch.setdefault('__'.join(parts[:i + 1]), (model, []))[1]
+                if parts[i + 1:]:
+                    nested.append('__'.join(parts[i + 1:]))
+                break
+        else:
+            select.append(lookup)
+
+    if select:
+        queryset = queryset.select_related(*select)
+    for path, (model, nested) in prefetch.items():
+        queryset = queryset.prefetch_related(
+            Prefetch(path, queryset=apply_query_plan(model._default_manager.all(), nested))
+        )
+    return queryset
+
+
+@lru_cache(maxsize=None)
+def values_layout(serializer_class, fields=None):
+    """
+    Works out whether a list serializer can be rendered straight from `.values()` rows: every field must be
+    either a plain column rendered as-is or the `detail_url` link. Returns the output field names and the
+    columns to select (None in place of the link), or None when the serializer needs its full machinery.
+
+    `fields`, a frozenset of names, restricts the layout to a sparse fieldset. Names the serializer does not
+    have also return None, leaving the error to the serializer path.
+    """
+    all_fields = serializer_class().fields
+    if fields is not None and not fields <= all_fields.keys():
+        return None
+    names, columns = [], []
+    for name, field in all_fields.items():
+        if fields is not None and name not in fields:
+            continue
+        if name == 'detail_url' and isinstance(field, serializers.SerializerMethodField):
+            columns.append(None)
+        elif type(field) in PASSTHROUGH_FIELDS and field.source == name and not field.write_only:
+            columns.append(name)
+        else:
+            return None
+        names.append(name)
+    return tuple(names), tuple(columns)
+
+
+class ResourceViewSet(ModelViewSet):
+    """
+    Renders the list and detail responses of a resource from the database.
+
+    Subclasses declare in `query_plans` the relations each action's serializer renders, and
+    `get_queryset` loads them up front so every endpoint runs a fixed number of queries.
+
+    List responses whose serializer only renders plain columns and a `detail_url` link are built from
+    `.values()` rows without instantiating models or running serializer fields; the output is identical.
+
+    List and detail requests can ask for a sparse fieldset, `?fields=id,name` and `?fields[spells]=name` for
+    nested objects. The response then only has those fields, only their columns are selected, and relations
+    none of them renders are not loaded.
+
+    Subclasses may also offer related objects by name in `includes`, as lookup paths. Asking for them with
+    `?include=` wraps the response as `{"data": ..., "included": {<resource>: [...]}}`, where every related
+    object appears once, rendered by its resource's list serializer.
+
+    With `STREAM_LIST_RESPONSES` enabled, JSON list responses are streamed: the queryset is iterated
+    `STREAM_CHUNK_SIZE` rows at a time and each chunk is serialized and encoded before the next is read.
+
+    With `COMPILE_SERIALIZERS` enabled, detail responses are rendered by the function compiled from the
+    detail serializer, falling back to the serializer itself when it cannot be compiled.
+
+    Besides JSON, responses are available as MessagePack (`Accept: application/msgpack`) and CBOR
+    (`Accept: application/cbor`), and request bodies are accepted in both, when their libraries are installed.
+
+    Mixins put in front of it override `list_response`, `list_rows` and `retrieve_response` to read from
+    somewhere else, and `data_changed` and `write_transaction` to keep that up to date on writes.
+    """
+    # Binary formats come after the defaults, so clients accepting anything still get JSON.
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES + BINARY_RENDERERS
+    parser_classes = api_settings.DEFAULT_PARSER_CLASSES + BINARY_PARSERS
+    # Relations rendered per action, as lookup paths; actions without an entry use the bare queryset.
+    query_plans = {}
+    # Related objects clients can ask for with `?include=`, by name, as lookup paths to the related model.
+    includes = {}
+    # Render list responses from `.values()` rows when the list serializer allows it.
+    fast_list = True
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.get_includes()  # Rejects unknown relations before any query runs.
+
+    def get_fieldsets(self):
+        """
+        Returns the sparse fieldsets requested for a list or detail response, or None for every field.
+        """
+        if self.action not in ('list', 'retrieve') or self.request is None:
+            return None
+        if not hasattr(self, '_fieldsets'):
+            self._fieldsets = parse_fieldsets(self.request.GET) or None
+        return self._fieldsets
 
-class NoPutModelViewSet(ModelViewSet):
+    def get_includes(self):
+        """
+        Returns the lookups of the relations requested with `?include=` on a list or detail request.
+        """
+        if self.action not in ('list', 'retrieve') or self.request is None:
+            return []
+        return [self.includes[name] for name in parse_includes(self.request.GET, self.includes)]
+
+    def with_included(self, response):
+        """
+        Wraps the data of a list or detail response with the related objects requested with `?include=`.
+        """
+        lookups = self.get_includes()
+        if lookups and response.status_code == 200:
+            included = included_documents(self.response_queryset(), lookups, self.get_serializer_context())
+            response.data = {'data': response.data, 'included': included}
+        return response
+
+    def get_queryset(self):
+        """
+        Returns the base queryset with the relations planned for the current action, narrowed to the
+        requested fields.
+        """
+        queryset = super().get_queryset()
+        lookups = self.query_plans.get(self.action, ())
+        fieldsets = self.get_fieldsets()
+        if fieldsets and () in fieldsets:
+            sources = read_sources(self.get_serializer_class(), fieldsets[()])
+            if sources is not None:
+                queryset, lookups = sparse_queryset(queryset, lookups, sources)
+        return apply_query_plan(queryset, lookups)
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Returns the serializer instance, without the fields left out of the requested fieldsets.
+        """
+        serializer = super().get_serializer(*args, **kwargs)
+        fieldsets = self.get_fieldsets()
+        if fieldsets:
+            trim_fields(serializer, fieldsets)
+        return serializer
+
+    def response_queryset(self):
+        """
+        Returns the rows a list or detail response is built from: the filtered queryset, narrowed to the
+        requested object for a detail response.
+        """
+        if self.action == 'retrieve':
+            return self.detail_queryset()
+        return self.filter_queryset(self.get_queryset())
+
+    def response_lookups(self):
+        """
+        Returns the relations a list or detail response renders: the action's query plan and the relations
+        requested with `?include=`.
+        """
+        return tuple(self.query_plans.get(self.action, ())) + tuple(self.get_includes())
+
+    def data_changed(self):
+        """
+        Called after every write through the API; mixins refresh what they read from.
+        """
+
+    def write_transaction(self):
+        """
+        Returns the context a write runs in.
+        """
+        return nullcontext()
+
+    def create(self, request, *args, **kwargs):
+        """
+        Creates an object and tells the mixins its model changed.
+        """
+        with self.write_transaction():
+            response = super().create(request, *args, **kwargs)
+        self.data_changed()
+        return response
+
+    def update(self, request, *args, **kwargs):
+        """
+        Updates an object and tells the mixins its model changed.
+        """
+        with self.write_transaction():
+            response = super().update(request, *args, **kwargs)
+        self.data_changed()
+        return response
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Deletes an object and tells the mixins its model, and any model its deletion cascades to, changed.
+        """
+        with self.write_transaction():
+            response = super().destroy(request, *args, **kwargs)
+        self.data_changed()
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns the list response, with the related objects requested with `?include=`.
+        """
+        return self.with_included(self.list_response(request, *args, **kwargs))
+
+    def list_layout(self):
+        """
+        Returns the `values_layout` the list response is rendered with, or None when it takes the serializer.
+        """
+        # The link template is looked up through the router basename, so views mounted without one take the slow path.
+        fieldsets = self.get_fieldsets()
+        if not self.fast_list or not self.basename or (fieldsets and fieldsets.keys() != {()}):
+            return None
+        return values_layout(self.get_serializer_class(), frozenset(fieldsets[()]) if fieldsets else None)
+
+    def list_rows(self, columns):
+        """
+        Returns the `columns` of every row of the list, in the order the model-based query returns them.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+        return queryset.values_list(*columns)
+
+    def list_response(self, request, *args, **kwargs):
+        """
+        Returns the list response, from `.values()` rows when the list serializer only renders plain columns.
+        With `STREAM_LIST_RESPONSES` enabled, unpaginated JSON lists are streamed in chunks.
+        """
+        layout = self.list_layout()
+        if layout is None:
+            if not self.can_stream():
+                return super().list(request, *args, **kwargs)
+            queryset = self.filter_queryset(self.get_queryset())
+            chunks = chunked(queryset.iterator(chunk_size=settings.STREAM_CHUNK_SIZE), settings.STREAM_CHUNK_SIZE)
+            return self.streaming_response(self.get_serializer(chunk, many=True).data for chunk in chunks)
+
+        names, columns = layout
+        link = columns.index(None) if None in columns else None
+        selected = [column for column in columns if column is not None]
+        # The link is formatted from the primary key, selected last.
+        rows = self.list_rows(selected if link is None else [*selected, self.queryset.model._meta.pk.attname])
+
+        if link is None:
+            def to_dict(row):
+                return dict(zip(names, row))
+        else:
+            template = link_builder(self.get_serializer_context()).detail_template(f'{self.basename}-detail')
+
+            def to_dict(row):
+                return dict(zip(names, row[:link] + (template % row[-1],) + row[link:-1]))
+
+        if self.can_stream():
+            source = rows.iterator(chunk_size=settings.STREAM_CHUNK_SIZE) if isinstance(rows, QuerySet) else iter(rows)
+            chunks = chunked(source, settings.STREAM_CHUNK_SIZE)
+            return self.streaming_response([to_dict(row) for row in chunk] for chunk in chunks)
+        page = self.paginate_queryset(rows)
+        data = [to_dict(row) for row in (rows if page is None else page)]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def can_stream(self):
+        """
+        Tells whether the list response may be streamed: streaming is enabled, the list is not paginated
+        or wrapped with included objects, and the negotiated renderer writes compact JSON.
+        """
+        if not settings.STREAM_LIST_RESPONSES or self.paginator is not None or self.get_includes():
+            return False
+        renderer = getattr(self.request, 'accepted_renderer', None)
+        media_type = getattr(self.request, 'accepted_media_type', None)
+        return can_stream_json(renderer, media_type, self.get_renderer_context())
+
+    def streaming_response(self, chunks):
+        """
+        Streams lists of serialized objects as one JSON array, encoding each list as it is produced.
+        """
+        renderer = self.request.accepted_renderer
+        stream = json_array_stream(chunks, renderer, self.request.accepted_media_type, self.get_renderer_context())
+        return StreamingHttpResponse(stream, content_type=renderer.media_type)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns the detail response, with the related objects requested with `?include=`.
+        """
+        return self.with_included(self.retrieve_response(request, *args, **kwargs))
+
+    def detail_queryset(self):
+        """
+        Returns the queryset narrowed to the object of a detail request.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        lookup = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            return self.filter_queryset(self.get_queryset()).filter(**lookup)
+        except (TypeError, ValueError, ValidationError):
+            # A value the lookup field cannot hold (`/api/spells/abc/`) matches no object, as in DRF's
+            # `get_object_or_404`.
+            raise Http404
+
+    def retrieve_response(self, request, *args, **kwargs):
+        """
+        Returns the detail response of the requested object.
+        """
+        return self.render_object(self.get_object())
+
+    def render_object(self, instance):
+        """
+        Returns the detail response of `instance`, rendered by the compiled serializer when `COMPILE_SERIALIZERS`
+        is enabled. Sparse fieldsets are rendered by the serializer.
+        """
+        if settings.COMPILE_SERIALIZERS and not self.get_fieldsets():
+            render = compiled_renderer(self.get_serializer_class())
+            if render is not None:
+                return Response(render(instance, self.get_serializer_context()))
+        return Response(self.get_serializer(instance).data)
+
+
+class NoPutModelViewSet(ConditionalMixin, ResponseCacheMixin, DetailDocumentMixin, CatalogMixin, ResourceViewSet):
     """
     Custom ViewSet that disables the PUT method globally.
 
@@ -17,6 +369,11 @@ class NoPutModelViewSet(ModelViewSet):
 
     Excluding the PUT method enforces the use of PATCH for updates, which aligns
     with RESTful design principles that recommend partial updates for most scenarios.
+
+    List and detail responses go through the optional read paths in the order of the bases, each one only
+    acting when its setting is enabled: a conditional request is answered with 304 first, then from the
+    response cache; otherwise a detail is the stored document when there is one, and the response is
+    rendered from the catalog or, failing everything else, from the database (`ResourceViewSet`).
     """
     # Restrict HTTP methods to exclude PUT.
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
@@ -15,11 +15,17 @@ class ClassViewSet(NoPutModelViewSet):
     - Create/Update: Supports input operations using ClassInputSerializer.
     - Supports HTTP methods: POST, PATCH, and DELETE (no PUT).
     """
-    queryset = Class.objects.prefetch_related(
-        'class_proficiencies__proficiency',
-        'subclasses',
-        'spells'
-    ).all()
+    queryset = Class.objects.all()
+    # Relations rendered by the detail serializer, loaded with a fixed number of queries.
+    query_plans = {
+        'retrieve': ['class_proficiencies__proficiency', 'subclasses', 'spells__spell'],
+    }
+    # Related resources clients can embed with `?include=`.
+    includes = {
+        'proficiencies': 'class_proficiencies__proficiency',
+        'subclasses': 'subclasses',
+        'spells': 'spells__spell',
+    }
 
     def get_serializer_class(self):
         """
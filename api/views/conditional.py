@@ -0,0 +1,52 @@
+import hashlib
+
+from django.db import connections
+
+from api.views.includes import related_model
+
+
+def dependent_querysets(queryset, lookups):
+    """
+    Yields `queryset` and, for every relation crossed by `lookups` (Django `__` paths, each prefix once), the
+    rows of the related model reached from it. Together they are every row a response rendering those
+    relations is built from.
+    """
+    queryset = queryset.select_related(None).prefetch_related(None).order_by()
+    yield queryset
+    seen = set()
+    for lookup in lookups:
+        parts = lookup.split('__')
+        for end in range(1, len(parts) + 1):
+            path = '__'.join(parts[:end])
+            if path not in seen:
+                seen.add(path)
+                model = related_model(queryset.model, path)
+                yield model._default_manager.filter(pk__in=queryset.values(path)).order_by()
+
+
+def row_versions(querysets):
+    """
+    Returns (position, latest `updated_at`, row count) for each queryset, read in a single query. A write
+    changes the latest timestamp of its table; a deletion changes the count.
+    """
+    querysets = list(querysets)
+    selects, params = [], []
+    for position, queryset in enumerate(querysets):
+        sql, query_params = queryset.values('updated_at').query.sql_with_params()
+        selects.append(f'SELECT {position}, MAX(updated_at), COUNT(*) FROM ({sql}) AS rows_{position}')
+        params.extend(query_params)
+    with connections[querysets[0].db].cursor() as cursor:
+        cursor.execute(' UNION ALL '.join(selects), params)
+        return sorted(cursor.fetchall())
+
+
+def entity_tag(versions, representation):
+    """
+    Returns the strong ETag of a response built from rows with the given `row_versions`. `representation`
+    tells apart the responses built from the same rows: URL, media type and so on.
+
+    There is no Last-Modified: deleting a row leaves the latest `updated_at` of its table where it was, so only
+    the row counts in the ETag see it.
+    """
+    digest = hashlib.blake2b(repr((versions, representation)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
@@ -0,0 +1,97 @@
+from django.db.models.functions import Coalesce
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound
+from rest_framework.views import APIView
+
+from api.models import Class, Proficiency, ClassProficiency, Race, ProficiencyClass, ProficiencyRace, \
+    RaceStartingProficiency, Subrace, SubraceStartingProficiency, Subclass, SubclassDescription, Spell, \
+    SpellDescription, SpellClass, SpellSubclass
+from api.renderers import CSVRenderer, NDJSONRenderer
+from api.views.streaming import chunked
+
+# Rows read from the database per round trip; on PostgreSQL they come from a server-side cursor.
+EXPORT_CHUNK_SIZE = 2000
+
+# Every seed file, by name without extension: the model its rows come from, the order rows are written in,
+# and each CSV column with the lookup (or expression) it is read from. The layout matches `csv_seed/`, so
+# a directory of exported CSV files can be loaded with `load_data --source`.
+EXPORTS = {
+    'classes': (Class, ('pk',), {'index': 'index', 'hit_die': 'hit_die', 'name': 'name'}),
+    'proficiencies': (Proficiency, ('pk',), {'index': 'index', 'name': 'name', 'type': 'type'}),
+    'races': (Race, ('pk',), {
+        'index': 'index', 'age': 'age', 'alignment': 'alignment', 'language_desc': 'language_desc',
+        'name': 'name', 'size': 'size', 'size_description': 'size_description', 'speed': 'speed',
+    }),
+    'subraces': (Subrace, ('pk',), {'index': 'index', 'desc': 'desc', 'name': 'name', 'race_index': 'race__index'}),
+    'subclasses': (Subclass, ('pk',), {
+        'index': 'index', 'class_index': 'class_obj__index', 'name': 'name', 'subclass_flavor': 'subclass_flavor',
+    }),
+    'spells': (Spell, ('pk',), {
+        'attack_type': 'attack_type', 'casting_time': 'casting_time', 'concentration': 'concentration',
+        'duration': 'duration', 'index': 'index', 'level': 'level', 'material': 'material', 'name': 'name',
+        'range': 'range', 'ritual': 'ritual', 'school_index': 'school__index', 'school_name': 'school__name',
+    }),
+    'classes_proficiencies': (ClassProficiency, ('pk',), {
+        'classes_index': 'class_obj__index', 'ref_index': 'proficiency__index',
+    }),
+    'proficiencies_classes': (ProficiencyClass, ('pk',), {
+        'proficiencies_index': 'proficiency__index', 'ref_index': 'class_obj__index',
+    }),
+    'proficiencies_races': (ProficiencyRace, ('pk',), {
+        'proficiencies_index': 'proficiency__index', 'ref_index': Coalesce('race__index', 'subrace__index'),
+    }),
+    'races_starting_proficiencies': (RaceStartingProficiency, ('pk',), {
+        'races_index': 'race__index', 'ref_index': 'proficiency__index',
+    }),
+    'subraces_starting_proficiencies': (SubraceStartingProficiency, ('pk',), {
+        'subraces_index': 'subrace__index', 'ref_index': 'proficiency__index',
+    }),
+    'subclasses_desc': (SubclassDescription, ('pk',), {'subclasses_index': 'subclass__index', 'value': 'value'}),
+    'classes_subclasses': (Subclass, ('pk',), {'classes_index': 'class_obj__index', 'ref_index': 'index'}),
+    'races_subraces': (Subrace, ('pk',), {'races_index': 'race__index', 'ref_index': 'index'}),
+    # Paragraph order within a spell is the row order, which load_data turns back into positions.
+    'spells_desc': (SpellDescription, ('spell_id', 'position'), {'spells_index': 'spell__index', 'value': 'value'}),
+    'spells_classes': (SpellClass, ('pk',), {
+        'ref_index': 'class_obj__index', 'ref_name': 'class_obj__name', 'spells_index': 'spell__index',
+    }),
+    'spells_subclasses': (SpellSubclass, ('pk',), {
+        'ref_index': 'subclass__index', 'ref_name': 'subclass__name', 'spells_index': 'spell__index',
+    }),
+}
+
+
+def export_rows(resource):
+    """
+    Returns the CSV columns of a seed file and an iterator over its rows as value tuples, read in chunks.
+    """
+    model, ordering, columns = EXPORTS[resource]
+    aliases = {f'export_{i}': source for i, source in enumerate(columns.values()) if not isinstance(source, str)}
+    lookups = [
+        source if isinstance(source, str) else f'export_{i}' for i, source in enumerate(columns.values())
+    ]
+    queryset = model._default_manager.annotate(**aliases).order_by(*ordering).values_list(*lookups)
+    return list(columns), queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+class ExportView(APIView):
+    """
+    Streams every row of one seed file, e.g. `/api/export/spells_classes/`, as NDJSON (the default) or CSV
+    (`Accept: text/csv` or `?format=csv`). Rows are read from the database in chunks and written out as they
+    arrive, so memory use does not depend on the size of the table.
+    """
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    def get(self, request, resource):
+        """
+        Streams the rows of `resource` in the negotiated format.
+        """
+        if resource not in EXPORTS:
+            raise NotFound(f"Unknown export '{resource}'. Choose from: {', '.join(EXPORTS)}.")
+        columns, rows = export_rows(resource)
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(columns, chunked(rows, EXPORT_CHUNK_SIZE)),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}',
+        )
+        response['Content-Disposition'] = f'attachment; filename="{resource}.{renderer.format}"'
+        return response
@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api import warmup
+from api.renderers import FastJSONRenderer
+
+
+class ReadyView(APIView):
+    """
+    Readiness probe at `/healthz/ready`: 200 once this worker has warmed up (see `api.warmup`), 503 before
+    and when any warm-up request failed. Load balancers and the fly.io health check route traffic only to
+    workers that answer 200.
+    """
+    renderer_classes = [FastJSONRenderer]
+
+    def get(self, request):
+        """
+        Returns whether the worker is ready, with the report of its warm-up.
+        """
+        if warmup.is_ready():
+            return Response({'status': 'ready', 'warm_up': warmup.last_report})
+        if warmup.last_report is None:
+            return Response({'status': 'warming up'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({'status': 'warm-up failed', 'warm_up': warmup.last_report},
+                        status=status.HTTP_503_SERVICE_UNAVAILABLE)
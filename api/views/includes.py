@@ -0,0 +1,57 @@
+from functools import lru_cache
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+def parse_includes(query_params, includes):
+    """
+    Returns the relation names listed in `?include=`, in order and without repeats. Raises ValidationError
+    for names the viewset does not offer in `includes`.
+    """
+    names = list(dict.fromkeys(name.strip() for name in query_params.get('include', '').split(',') if name.strip()))
+    unknown = [name for name in names if name not in includes]
+    if unknown:
+        raise ValidationError({'include': [
+            f"Unknown relation(s): {', '.join(unknown)}. Choose from: {', '.join(includes)}."
+        ]})
+    return names
+
+
+@lru_cache(maxsize=None)
+def resource_for_model(model):
+    """
+    Returns the router basename and viewset serving `model`.
+    """
+    from api.urls import router
+
+    for _, viewset, basename in router.registry:
+        if viewset.queryset.model is model:
+            return basename, viewset
+    raise LookupError(f"No API resource serves {model.__name__}.")
+
+
+def related_model(model, lookup):
+    for part in lookup.split('__'):
+        model = model._meta.get_field(part).related_model
+    return model
+
+
+def included_documents(queryset, lookups, context):
+    """
+    Renders the objects reached from `queryset` through each of `lookups` (Django `__` paths), grouped by
+    resource type, each object once, with the list serializer of its resource. Every type costs one query:
+    the related keys are selected by a subquery on `queryset`.
+    """
+    conditions = {}
+    for lookup in lookups:
+        resource = resource_for_model(related_model(queryset.model, lookup))
+        condition = Q(pk__in=queryset.select_related(None).prefetch_related(None).order_by().values(lookup))
+        conditions[resource] = conditions[resource] | condition if resource in conditions else condition
+
+    included = {}
+    for (basename, viewset), condition in conditions.items():
+        serializer_class = viewset(action='list').get_serializer_class()
+        objects = viewset.queryset.model._default_manager.filter(condition).order_by('pk')
+        included[basename] = serializer_class(objects, many=True, context=context).data
+    return included
@@ -0,0 +1,210 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import Http404, HttpResponse
+from django.urls import get_script_prefix
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+from api.catalog import get_catalog, refresh_catalog
+from api.documents import DOCUMENT_ORIGIN, document_body
+from api.renderers import FastJSONRenderer
+from api.response_cache import HITS_KEY, MISSES_KEY, bump_versions, count, data_versions, lookup_models, \
+    response_cache, response_key
+from api.serializers.links import link_builder
+from api.views.conditional import dependent_querysets, entity_tag, row_versions
+
+
+def renders_html(request):
+    """
+    Tells whether the request is for the browsable API, or has not been negotiated yet.
+    """
+    renderer = getattr(request, 'accepted_renderer', None)
+    return renderer is None or renderer.media_type == 'text/html'
+
+
+class ConditionalMixin:
+    """
+    With `CONDITIONAL_REQUESTS` enabled, list and detail responses carry a strong ETag, read in one query
+    from the `updated_at` and row counts of every table the response is built from. `If-None-Match` is
+    answered with 304 before anything is serialized.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
+
+    def conditional(self, build, request, *args, **kwargs):
+        """
+        Returns 304 Not Modified when the request's validators match the rows the response would be built
+        from, and otherwise the response made by `build`, with its ETag.
+        """
+        if not settings.CONDITIONAL_REQUESTS or renders_html(request):
+            return build(request, *args, **kwargs)
+        versions = row_versions(dependent_querysets(self.response_queryset(), self.response_lookups()))
+        etag = entity_tag(versions, (request.build_absolute_uri(), request.accepted_media_type))
+        response = get_conditional_response(request, etag)
+        if response is None:
+            response = build(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+        return response
+
+
+class ResponseCacheMixin:
+    """
+    With `RESPONSE_CACHE` enabled, rendered list and detail responses are cached, keyed by URL, negotiated
+    media type and the data versions of the models they are built from. Creating, updating or deleting through
+    the API bumps the version of the model and of every model its deletions cascade to; `load_data` bumps all.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached(super().retrieve, request, *args, **kwargs)
+
+    def cache_dependencies(self):
+        """
+        Returns the models a list or detail response is built from: the queryset's model and those crossed by
+        the action's query plan and by the relations requested with `?include=`.
+        """
+        return lookup_models(self.queryset.model, self.response_lookups())
+
+    def cached(self, build, request, *args, **kwargs):
+        """
+        Returns the response made by `build`, or its cached copy when the same URL was rendered in the same
+        media type since the models it depends on last changed. Successful, buffered, non-HTML responses are
+        stored; `X-Cache` tells whether the response was a hit.
+        """
+        if not settings.RESPONSE_CACHE or renders_html(request):
+            return build(request, *args, **kwargs)
+        versions = data_versions(self.cache_dependencies())
+        key = response_key(request.build_absolute_uri(), request.accepted_media_type, versions)
+        cache = response_cache()
+        hit = cache.get(key)
+        if hit is not None:
+            count(HITS_KEY)
+            content, content_type = hit
+            response = HttpResponse(content, content_type=content_type)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        count(MISSES_KEY)
+        response = build(request, *args, **kwargs)
+        if isinstance(response, Response) and response.status_code == 200:
+            # Rendered here rather than by `finalize_response`, so the bytes can be stored.
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = self.get_renderer_context()
+            response.render()
+            cache.set(key, (response.content, response['Content-Type']), settings.RESPONSE_CACHE_TIMEOUT)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def data_changed(self):
+        """
+        Bumps the data version of the queryset's model and of every model its deletions cascade to.
+        """
+        if settings.RESPONSE_CACHE:
+            bump_versions(self.queryset.model)
+        super().data_changed()
+
+
+class DetailDocumentMixin:
+    """
+    With `MATERIALIZED_DOCUMENTS` enabled, JSON detail responses are the bodies stored in `DetailDocument`,
+    read with one primary-key lookup; `api.documents` rebuilds them whenever a row they are built from changes.
+    Writes run in one transaction, so the documents they outdate are rebuilt once, when it commits.
+    """
+
+    def write_transaction(self):
+        if settings.MATERIALIZED_DOCUMENTS:
+            return transaction.atomic()
+        return super().write_transaction()
+
+    def detail_document(self):
+        """
+        Returns the body of the stored detail document of the requested object, with links for the requesting
+        origin. Returns None when `MATERIALIZED_DOCUMENTS` is disabled, when the request asks for something
+        the documents do not hold (a sparse fieldset, included objects, another format), or when the object
+        has no document.
+        """
+        request = self.request
+        if (not settings.MATERIALIZED_DOCUMENTS or self.get_fieldsets() or self.get_includes() or self.filter_backends
+                or not isinstance(request.accepted_renderer, FastJSONRenderer)
+                or request.accepted_media_type != request.accepted_renderer.media_type
+                or get_script_prefix() != '/'):
+            return None
+        try:
+            pk = self.queryset.model._meta.pk.to_python(self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+        except ValidationError:
+            return None
+        body = document_body(self.basename, pk)
+        if body is None:
+            return None
+        return body.replace(DOCUMENT_ORIGIN.encode(), link_builder(self.get_serializer_context()).origin.encode())
+
+    def retrieve_response(self, request, *args, **kwargs):
+        body = self.detail_document()
+        if body is None:
+            return super().retrieve_response(request, *args, **kwargs)
+        return HttpResponse(body, content_type=request.accepted_renderer.media_type)
+
+
+class CatalogMixin:
+    """
+    With `CATALOG_READS` enabled, list and detail responses are rendered from the in-memory catalog
+    (`api.catalog`) instead of the database, except for `?include=`; writes rebuild it.
+    """
+
+    def use_catalog(self):
+        """
+        Tells whether the response can be rendered from the catalog: `CATALOG_READS` is enabled, no related
+        objects are requested with `?include=` and no filter backend narrows the queryset.
+        """
+        return settings.CATALOG_READS and not self.get_includes() and not self.filter_backends
+
+    def catalog_object(self):
+        """
+        Returns the catalog's copy of the object of a detail request, raising Http404 as `get_object` does.
+        """
+        model = self.queryset.model
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            pk = model._meta.pk.to_python(self.kwargs[lookup_url_kwarg])
+        except ValidationError:
+            raise Http404
+        instance = get_catalog().get(model, pk)
+        if instance is None:
+            raise Http404(f"No {model._meta.object_name} matches the given query.")
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    def list_response(self, request, *args, **kwargs):
+        if not self.use_catalog() or self.list_layout() is not None:
+            return super().list_response(request, *args, **kwargs)
+        objects = get_catalog().all(self.queryset.model)
+        page = self.paginate_queryset(objects)
+        data = self.get_serializer(objects if page is None else page, many=True).data
+        return Response(data) if page is None else self.get_paginated_response(data)
+
+    def list_rows(self, columns):
+        if not self.use_catalog():
+            return super().list_rows(columns)
+        return get_catalog().values(self.queryset.model, columns)
+
+    def retrieve_response(self, request, *args, **kwargs):
+        if not self.use_catalog():
+            return super().retrieve_response(request, *args, **kwargs)
+        return self.render_object(self.catalog_object())
+
+    def data_changed(self):
+        """
+        Rebuilds the catalog.
+        """
+        if settings.CATALOG_READS:
+            refresh_catalog()
+        super().data_changed()
@@ -13,6 +13,15 @@ class ProficiencyViewSet(NoPutModelViewSet):
     - Supports HTTP methods: POST, PATCH, and DELETE (no PUT).
     """
     queryset = Proficiency.objects.all()  # Retrieves all Proficiency objects for use in the ViewSet.
+    # Relations rendered by the detail serializer, loaded with a fixed number of queries.
+    query_plans = {
+        'retrieve': ['proficiency_classes__class_obj', 'races_and_subraces__race', 'races_and_subraces__subrace'],
+    }
+    # Related resources clients can embed with `?include=`.
+    includes = {
+        'classes': 'proficiency_classes__class_obj',
+        'races': 'races_and_subraces__race',
+    }
 
     def get_serializer_class(self):
         """
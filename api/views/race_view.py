@@ -13,6 +13,14 @@ class RaceViewSet(NoPutModelViewSet):
     """
     # Retrieves all Race objects from the database.
     queryset = Race.objects.all()
+    # Relations rendered by the detail serializer, loaded with a fixed number of queries.
+    query_plans = {
+        'retrieve': ['subraces', 'starting_proficiencies__proficiency'],
+    }
+    # Related resources clients can embed with `?include=`.
+    includes = {
+        'proficiencies': 'starting_proficiencies__proficiency',
+    }
 
     def get_serializer_class(self):
         """
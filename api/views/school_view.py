@@ -14,6 +14,14 @@ class SchoolViewSet(NoPutModelViewSet):
     - Supports POST, PATCH, and DELETE actions, providing CRUD functionality.
     """
     queryset = School.objects.all()
+    # Relations rendered by the detail serializer, loaded with a fixed number of queries.
+    query_plans = {
+        'retrieve': ['spells'],
+    }
+    # Related resources clients can embed with `?include=`.
+    includes = {
+        'spells': 'spells',
+    }
 
     def get_serializer_class(self):
         """
@@ -0,0 +1,105 @@
+import re
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+# Query parameters selecting fields: `fields` for the top level and `fields[<path>]` for a nested serializer,
+# <path> being nested field names joined with dots, e.g. `fields[spells]`.
+FIELDS_PARAM = re.compile(r'^fields(?:\[([\w.]+)\])?$')
+
+
+def parse_fieldsets(query_params):
+    """
+    Returns the requested field names by nested path, e.g. {(): {'id', 'name'}, ('spells',): {'id'}}.
+    Raises ValidationError for a parameter naming no field at all (`?fields=` or `?fields=,`).
+    """
+    fieldsets = {}
+    for key, value in query_params.items():
+        match = FIELDS_PARAM.match(key)
+        if match:
+            path = tuple(match.group(1).split('.')) if match.group(1) else ()
+            names = {name.strip() for name in value.split(',') if name.strip()}
+            if not names:
+                raise ValidationError({key: ["Select at least one field."]})
+            fieldsets[path] = names
+    return fieldsets
+
+
+def nested_serializer(field):
+    """
+    Returns the serializer rendering each object of `field`, or None if it is not a nested serializer.
+    """
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    return field if isinstance(field, serializers.Serializer) else None
+
+
+def trim_fields(serializer, fieldsets):
+    """
+    Removes from a bound serializer (or the child of a list serializer) every field the fieldsets leave out.
+    Raises ValidationError for unknown field names and for paths that do not lead to a nested serializer.
+    """
+    root = nested_serializer(serializer)
+    # Deepest paths first, so that a nested serializer is trimmed before its parent possibly drops it.
+    for path, names in sorted(fieldsets.items(), key=lambda item: -len(item[0])):
+        param = f"fields[{'.'.join(path)}]" if path else 'fields'
+        target = root
+        for name in path:
+            target = nested_serializer(target.fields.get(name))
+            if target is None:
+                raise ValidationError({param: [f"'{name}' is not a nested object."]})
+        unknown = names - target.fields.keys()
+        if unknown:
+            raise ValidationError({param: [f"Unknown field(s): {', '.join(sorted(unknown))}."]})
+        for name in list(target.fields):
+            if name not in names:
+                target.fields.pop(name)
+
+
+def model_field_named(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def read_sources(serializer_class, names):
+    """
+    Returns the model attributes read by the named top-level fields of `serializer_class`, or None when one
+    of them renders the whole object (`source='*'`). Unknown names are ignored; `trim_fields` reports them.
+
+    A SerializerMethodField is taken to read the model attribute of the same name, if there is one, besides
+    the primary key. Serializers whose methods read something else list it in `Meta.method_field_sources`.
+    """
+    model = serializer_class.Meta.model
+    method_sources = getattr(serializer_class.Meta, 'method_field_sources', {})
+    fields = serializer_class().fields
+    sources = set()
+    for name in names & fields.keys():
+        field = fields[name]
+        if isinstance(field, serializers.SerializerMethodField):
+            default = [name] if model_field_named(model, name) is not None else []
+            sources.update(method_sources.get(name, default))
+        elif field.source == '*':
+            return None
+        else:
+            sources.add(field.source_attrs[0])
+    return sources
+
+
+def sparse_queryset(queryset, lookups, sources):
+    """
+    Narrows a list or detail queryset to what the requested fields read: the query plan `lookups` are cut
+    down to the relations in `sources`, and only the primary key and the columns in `sources` are selected.
+    Returns the queryset and the remaining lookups.
+    """
+    lookups = [lookup for lookup in lookups if lookup.split('__', 1)[0] in sources]
+    model = queryset.model
+    fields = [model_field_named(model, source) for source in sources]
+    # Attributes that are not model fields (properties, methods) may read any column, so none is deferred.
+    if all(field is not None for field in fields):
+        # Reverse one-to-one relations are named too, as they are joined with select_related.
+        columns = [field.name for field in fields if field.concrete or field.one_to_one]
+        queryset = queryset.only(model._meta.pk.name, *columns)
+    return queryset, lookups
@@ -13,6 +13,16 @@ class SpellViewSet(NoPutModelViewSet):
     """
     # QuerySet defining the data source for this ViewSet. Retrieves all Spell objects from the database.
     queryset = Spell.objects.all()
+    # Relations rendered by the detail serializer, loaded with a fixed number of queries.
+    query_plans = {
+        'retrieve': ['school', 'descriptions', 'classes__class_obj', 'subclasses__subclass'],
+    }
+    # Related resources clients can embed with `?include=`.
+    includes = {
+        'school': 'school',
+        'classes': 'classes__class_obj',
+        'subclasses': 'subclasses__subclass',
+    }
 
     def get_serializer_class(self):
         """
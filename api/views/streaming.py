@@ -0,0 +1,34 @@
+from itertools import islice
+
+from rest_framework.renderers import JSONRenderer
+
+
+def chunked(iterable, size):
+    """
+    Yields lists of up to `size` consecutive items of `iterable`.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def can_stream_json(renderer, accepted_media_type, renderer_context):
+    """
+    Tells whether `renderer` writes compact JSON, the only output `json_array_stream` can split into chunks.
+    """
+    return isinstance(renderer, JSONRenderer) and renderer.compact \
+        and renderer.get_indent(accepted_media_type, renderer_context) is None
+
+
+def json_array_stream(chunks, renderer, accepted_media_type=None, renderer_context=None):
+    """
+    Encodes lists of items as a single JSON array, one chunk at a time. The bytes are the same as rendering
+    all the items in one list, but only one chunk is held in memory.
+    """
+    yield b'['
+    separator = b''
+    for chunk in chunks:
+        if chunk:
+            yield separator + renderer.render(chunk, accepted_media_type, renderer_context)[1:-1]
+            separator = b','
+    yield b']'
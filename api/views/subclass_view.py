@@ -13,6 +13,15 @@ class SubclassViewSet(NoPutModelViewSet):
     """
     # QuerySet that retrieves all Subclass objects from the database.
     queryset = Subclass.objects.all()
+    # Relations rendered by the detail serializer, loaded with a fixed number of queries.
+    query_plans = {
+        'retrieve': ['class_obj', 'description'],
+    }
+    # Related resources clients can embed with `?include=`.
+    includes = {
+        'class': 'class_obj',
+        'spells': 'spells__spell',
+    }
 
     def get_serializer_class(self):
         """
@@ -0,0 +1,114 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http.request import split_domain_port, validate_host
+from django.test import Client
+
+from api.catalog import catalog_models, get_catalog
+from api.compression import CODINGS, best_compression
+from api.urls import router
+from api.views.export_view import EXPORTS
+
+logger = logging.getLogger(__name__)
+
+# Rows read per round trip while touching the tables.
+TOUCH_CHUNK_SIZE = 2000
+
+# What the last warm-up of this process did; None until one has completed.
+last_report = None
+
+
+def touch_tables():
+    """
+    Reads every column of every row, so the database pages are in the OS page cache before the first request.
+    Returns the number of rows read.
+    """
+    rows = 0
+    for model in catalog_models():
+        attnames = [field.attname for field in model._meta.concrete_fields]
+        for _ in model._base_manager.values_list(*attnames).iterator(chunk_size=TOUCH_CHUNK_SIZE):
+            rows += 1
+    return rows
+
+
+def warm_up_requests():
+    """
+    Returns the (path, Accept header) of every request the warm-up sends: the API root, the list and the first
+    `WARM_UP_OBJECTS` details (all of them with 0) of every registered resource, one browsable API page and
+    every export.
+    """
+    requests = [('/api/', 'text/html')]
+    for prefix, viewset, _ in router.registry:
+        requests.append((f'/api/{prefix}/', 'application/json'))
+        pks = viewset.queryset.model._default_manager.order_by('pk').values_list('pk', flat=True)
+        if settings.WARM_UP_OBJECTS:
+            pks = pks[:settings.WARM_UP_OBJECTS]
+        requests.extend((f'/api/{prefix}/{pk}/', 'application/json') for pk in pks)
+    requests.append((f'/api/{router.registry[0][0]}/', 'text/html'))
+    requests.extend((f'/api/export/{resource}/', 'application/x-ndjson') for resource in EXPORTS)
+    return requests
+
+
+def check_host():
+    """
+    Raises ImproperlyConfigured unless `WARM_UP_HOST` is one of the `ALLOWED_HOSTS`: Django would answer
+    every warm-up request with 400 and nothing would be primed.
+    """
+    allowed_hosts = settings.ALLOWED_HOSTS
+    if settings.DEBUG and not allowed_hosts:
+        # The hosts Django itself allows in that case.
+        allowed_hosts = ['.localhost', '127.0.0.1', '[::1]']
+    domain, _ = split_domain_port(settings.WARM_UP_HOST)
+    if not domain or not validate_host(domain, allowed_hosts):
+        raise ImproperlyConfigured(f"WARM_UP_HOST {settings.WARM_UP_HOST!r} is not in ALLOWED_HOSTS.")
+
+
+def warm_up():
+    """
+    Warms this process up before it serves traffic: checks `WARM_UP_HOST`, reads every table, loads the catalog when `CATALOG_READS`
+    is enabled, then sends every `warm_up_requests` request through the whole middleware stack as
+    `WARM_UP_HOST`, accepting the codings the compression middleware offers. That imports and sets up every
+    code path (URL resolver, serializers, renderers, templates) and fills the response, compressed body and
+    link caches for the host clients use; those bodies are compressed at the highest levels. Returns the report `/healthz/ready` shows.
+    """
+    global last_report
+    check_host()
+    started = time.perf_counter()
+    rows = touch_tables()
+    if settings.CATALOG_READS:
+        get_catalog()
+
+    client = Client(raise_request_exception=False)
+    failures = []
+    requests = warm_up_requests()
+    for path, accept in requests:
+        # Nobody is waiting on these bodies, so they are cached at the highest compression levels.
+        with best_compression():
+            response = client.get(path, HTTP_HOST=settings.WARM_UP_HOST, HTTP_ACCEPT=accept,
+                                  HTTP_ACCEPT_ENCODING=', '.join(CODINGS))
+            # Reads streamed bodies to the end, so exports run all their queries.
+            b''.join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        if response.status_code != 200:
+            failures.append(f'GET {path}: {response.status_code}')
+
+    last_report = {
+        'seconds': round(time.perf_counter() - started, 3),
+        'rows': rows,
+        'requests': len(requests),
+        'failures': failures,
+    }
+    logger.info("Warm-up done: %s", last_report)
+    for failure in failures:
+        logger.error("Warm-up request failed: %s", failure)
+    return last_report
+
+
+def is_ready():
+    """
+    Tells whether this process has warmed up with every request succeeding, or does not warm up at all
+    (`WARM_UP` disabled).
+    """
+    return not settings.WARM_UP or (last_report is not None and not last_report['failures'])
@@ -1,6 +1,7 @@
 from pathlib import Path
 import environ
 import os
+import tempfile
 
 # Initialize environment variables
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -35,14 +36,73 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.CompressionMiddleware',  # Sees the final response; removes itself unless RESPONSE_COMPRESSION
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.NPlusOneDetectionMiddleware',  # Removes itself unless NPLUSONE_DETECTION is enabled
 ]
 
+# Response Compression
+RESPONSE_COMPRESSION = env.bool("RESPONSE_COMPRESSION", default=True)  # Negotiate br/zstd/gzip from Accept-Encoding
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)  # Bodies shorter than this are sent as they are
+COMPRESSION_CACHE_BYTES = env.int("COMPRESSION_CACHE_BYTES", default=32 * 1024 * 1024)  # Compressed bodies kept per process
+
+# In-Memory Catalog
+CATALOG_READS = env.bool("CATALOG_READS", default=False)  # Serve list and detail GETs from an in-memory copy
+CATALOG_STAMP = env("CATALOG_STAMP", default=os.path.join(tempfile.gettempdir(), 'dnd-catalog.stamp'))  # Write marker shared by workers
+CATALOG_FILE = env("CATALOG_FILE", default="")  # Catalog file mapped by every worker instead of a copy in each
+
+# Warm-Up
+WARM_UP = env.bool("WARM_UP", default=False)  # Exercise every route as each worker starts; /healthz/ready waits for it
+WARM_UP_HOST = env("WARM_UP_HOST", default="localhost")  # Host the warm-up requests are sent as (links and cache keys use it)
+WARM_UP_OBJECTS = env.int("WARM_UP_OBJECTS", default=1)  # Detail pages warmed per resource, lowest ids first; 0 for all
+
+# Materialized Detail Documents
+MATERIALIZED_DOCUMENTS = env.bool("MATERIALIZED_DOCUMENTS", default=False)  # Serve JSON details from stored, write-maintained bodies
+
+# Conditional Requests
+CONDITIONAL_REQUESTS = env.bool("CONDITIONAL_REQUESTS", default=False)  # ETags from row timestamps and counts, 304s
+
+# Response Cache
+RESPONSE_CACHE = env.bool("RESPONSE_CACHE", default=False)  # Cache rendered list and detail responses
+RESPONSE_CACHE_ALIAS = 'responses'  # Entry of CACHES holding them
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=24 * 60 * 60)  # Seconds an entry is kept
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://'),
+    # locmemcache:// (per process), filecache:///var/tmp/dnd-responses or rediscache://127.0.0.1:6379/1
+    RESPONSE_CACHE_ALIAS: env.cache_url('RESPONSE_CACHE_URL', default='locmemcache://responses'),
+}
+
+# N+1 Query Detection
+NPLUSONE_DETECTION = env.bool("NPLUSONE_DETECTION", default=False)  # Watch each request for repeated SQL shapes
+NPLUSONE_THRESHOLD = env.int("NPLUSONE_THRESHOLD", default=5)  # Repeats of one shape tolerated per request
+NPLUSONE_STRICT = env.bool("NPLUSONE_STRICT", default=False)  # Raise NPlusOneQueryError instead of logging
+
+# Django REST Framework
+REST_FRAMEWORK = {
+    # orjson-backed JSON when it is installed, DRF's stdlib encoder otherwise; output is the same either way.
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Serializer Compilation
+COMPILE_SERIALIZERS = env.bool("COMPILE_SERIALIZERS", default=False)  # Render detail views with compiled serializers
+
+# List Streaming
+STREAM_LIST_RESPONSES = env.bool("STREAM_LIST_RESPONSES", default=False)  # Stream unpaginated JSON lists in chunks
+STREAM_CHUNK_SIZE = env.int("STREAM_CHUNK_SIZE", default=500)  # Rows read, serialized and encoded per chunk
+
 # URL Configuration
 ROOT_URLCONF = 'dndRestAPI.urls'
 
@@ -2,9 +2,12 @@ from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import RedirectView
 
+from api.views.health_view import ReadyView
+
 urlpatterns = [
     # Redirect root URL to the API page
     path('', RedirectView.as_view(url='/api/', permanent=True)),
     path('admin/', admin.site.urls),
     path('api/', include('api.urls')),  # Include API routes
+    path('healthz/ready', ReadyView.as_view(), name='ready'),  # 200 once the worker has warmed up
 ]
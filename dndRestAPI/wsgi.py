@@ -9,8 +9,20 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dndRestAPI.settings')
 
 application = get_wsgi_application()
+
+# Warm the worker up before it serves its first request: gunicorn only starts accepting connections in a
+# worker once this module is imported. Without warm-up, still load (or map) the catalog up front.
+if settings.WARM_UP:
+    from api.warmup import warm_up
+
+    warm_up()
+elif settings.CATALOG_READS:
+    from api.catalog import get_catalog
+
+    get_catalog()
@@ -1,5 +1,27 @@
 #!/bin/sh
-python manage.py migrate
-python manage.py collectstatic --noinput
-python manage.py load_data
-gunicorn dndRestAPI.wsgi:application --bind 0.0.0.0:8080
\ No newline at end of file
+# Boot from the database snapshot baked into the image when no DATABASE_URL is configured. The snapshot only
+# seeds an empty data volume; an existing database is migrated in place and, when the image ships different
+# seed content (its .sha256), brought up to date by load_data, which keeps the rows written through the API.
+SNAPSHOT=/code/snapshot/db.sqlite3
+DATA_DIR=${DATA_DIR:-/data}
+
+if [ -z "$DATABASE_URL" ] && [ -f "$SNAPSHOT" ]; then
+    mkdir -p "$DATA_DIR"
+    export DATABASE_URL="sqlite:///$DATA_DIR/db.sqlite3"
+    if [ ! -f "$DATA_DIR/db.sqlite3" ]; then
+        cp "$SNAPSHOT" "$DATA_DIR/db.sqlite3.tmp"
+        mv "$DATA_DIR/db.sqlite3.tmp" "$DATA_DIR/db.sqlite3"
+    else
+        python manage.py migrate
+        if ! cmp -s "$SNAPSHOT.sha256" "$DATA_DIR/db.sqlite3.sha256"; then
+            python manage.py load_data
+        fi
+    fi
+    cp "$SNAPSHOT.sha256" "$DATA_DIR/db.sqlite3.sha256"
+else
+    python manage.py migrate
+    python manage.py collectstatic --noinput
+    python manage.py load_data
+fi
+
+exec gunicorn dndRestAPI.wsgi:application --bind 0.0.0.0:8080